@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Content-addressed storage for uploads.
+
+Files are stored once under their SHA-256 in sharded directories
+(``<root>/ab/cd/abcd....pdf``), so re-uploading the same resume or avatar reuses the
+existing blob. The ``blobs`` table counts how many user columns point at each blob;
+replacing an upload moves the reference in the same transaction as the user update.
+
+Blobs whose count drops to zero (and files with no row at all) are removed by:
+    python -m backend.blob_store gc [--dry-run] [--recount] [--grace-seconds 3600]
+"""
+
+import argparse
+import itertools
+import os
+import re
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import select, update
+
+# Ensure project root is on sys.path so `python backend/blob_store.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.models import Blob, Intern, Recruiter
+
+
+_BLOB_NAME = re.compile(r"^([0-9a-f]{64})(\.[a-z0-9]+)?$")
+_DERIVED_NAME = re.compile(r"^([0-9a-f]{64})\.[a-z0-9]+\.[a-z0-9]+$")
+# User columns holding blob paths; each non-null value is one reference
+REFERENCE_COLUMNS = (Intern.profile_image_path, Intern.resume_pdf_path, Recruiter.profile_image_path)
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    sha256: str
+    suffix: str
+    size: int
+    path: Path
+
+
+class BlobStore:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._tmp = self.root / ".tmp"
+        self._tmp.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, sha256: str, suffix: str) -> Path:
+        return self.root / sha256[:2] / sha256[2:4] / f"{sha256}{suffix}"
+
+    def derived_path(self, sha256: str, name: str) -> Path:
+        """Path for a file derived from a blob (e.g. a thumbnail); gc removes it with the blob."""
+        return self.root / sha256[:2] / sha256[2:4] / f"{sha256}.{name}"
+
+    def digest_of(self, path: Optional[str]) -> Optional[str]:
+        """SHA-256 of a stored blob path, or None for paths outside the store (legacy uploads)."""
+        if not path:
+            return None
+        p = Path(path)
+        match = _BLOB_NAME.match(p.name)
+        if match is None or self.root.resolve() not in p.resolve().parents:
+            return None
+        return match.group(1)
+
+    def temp_file(self) -> Tuple[int, str]:
+        return tempfile.mkstemp(dir=self._tmp, prefix="upload-", suffix=".part")
+
+    def commit(self, tmp_name: str, sha256: str, suffix: str, size: int) -> StoredBlob:
+        """Move a fully written temp file into place, or drop it if the blob already exists."""
+        dest = self.path_for(sha256, suffix)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            os.unlink(tmp_name)
+            # Refresh mtime so a concurrent gc treats the blob as recently used
+            os.utime(dest)
+        else:
+            os.replace(tmp_name, dest)
+        return StoredBlob(sha256=sha256, suffix=suffix, size=size, path=dest)
+
+    def iter_files(self) -> Iterator[Path]:
+        for path in self.root.glob("*/*/*"):
+            if path.is_file() and _BLOB_NAME.match(path.name):
+                yield path
+
+    def iter_derived(self) -> Iterator[Tuple[str, Path]]:
+        """(sha256, path) for every derived file, whether or not its blob still exists."""
+        for path in self.root.glob("*/*/*"):
+            match = _DERIVED_NAME.match(path.name)
+            if match and path.is_file():
+                yield match.group(1), path
+
+
+def _insert_ignore(dialect_name: str):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+async def swap_reference(db, store: BlobStore, old_path: Optional[str], blob: StoredBlob) -> bool:
+    """Point one reference at ``blob`` instead of ``old_path`` (AsyncSession, caller commits).
+
+    Returns False when the old path is already this blob (unchanged upload).
+    """
+    old_digest = store.digest_of(old_path)
+    if old_digest == blob.sha256:
+        return False
+    await db.execute(
+        _insert_ignore(db.bind.dialect.name)(Blob)
+        .values(sha256=blob.sha256, suffix=blob.suffix, size=blob.size, refcount=0)
+        .on_conflict_do_nothing(index_elements=[Blob.sha256])
+    )
+    await db.execute(update(Blob).where(Blob.sha256 == blob.sha256).values(refcount=Blob.refcount + 1))
+    if old_digest is not None:
+        await db.execute(update(Blob).where(Blob.sha256 == old_digest).values(refcount=Blob.refcount - 1))
+    return True
+
+
+def gc(db, store: BlobStore, grace_seconds: float, dry_run: bool = False, recount: bool = False) -> dict:
+    """Delete unreferenced blobs older than ``grace_seconds`` (sync Session)."""
+    if recount:
+        counts: dict = {}
+        for column in REFERENCE_COLUMNS:
+            for (path,) in db.execute(select(column).where(column.isnot(None))):
+                digest = store.digest_of(path)
+                if digest:
+                    counts[digest] = counts.get(digest, 0) + 1
+        for row in db.scalars(select(Blob)):
+            row.refcount = counts.get(row.sha256, 0)
+        if not dry_run:
+            db.commit()
+
+    cutoff = time.time() - grace_seconds
+    rows = {row.sha256: row for row in db.scalars(select(Blob))}
+    removed_files = removed_rows = freed = 0
+    for path in store.iter_files():
+        digest = _BLOB_NAME.match(path.name).group(1)
+        row = rows.get(digest)
+        if row is not None and row.refcount > 0:
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if stat.st_mtime > cutoff:
+            continue
+        removed_files += 1
+        freed += stat.st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
+            if row is not None:
+                db.delete(row)
+                removed_rows += 1
+    # Rows at zero whose file is already gone
+    for digest, row in rows.items():
+        if row.refcount <= 0 and not store.path_for(digest, row.suffix).exists() and not dry_run:
+            if row not in db.deleted:
+                db.delete(row)
+                removed_rows += 1
+    # Derived files (thumbnails) whose blob is gone
+    if not dry_run:
+        live = {_BLOB_NAME.match(p.name).group(1) for p in store.iter_files()}
+        for digest, path in store.iter_derived():
+            if digest not in live:
+                path.unlink(missing_ok=True)
+    # Temp files left behind by interrupted uploads and thumbnail renders
+    for tmp in itertools.chain(store._tmp.glob("upload-*.part"), store.root.glob("*/*/.*.part")):
+        try:
+            stale = tmp.stat().st_mtime <= cutoff
+        except FileNotFoundError:
+            # Finished (renamed into place) since the glob
+            continue
+        if stale and not dry_run:
+            tmp.unlink(missing_ok=True)
+    if not dry_run:
+        db.commit()
+    return {"removed_files": removed_files, "removed_rows": removed_rows, "freed_bytes": freed, "dry_run": dry_run}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    gc_parser = sub.add_parser("gc", help="delete unreferenced blobs")
+    gc_parser.add_argument("--dry-run", action="store_true")
+    gc_parser.add_argument("--recount", action="store_true", help="recompute reference counts from user rows first")
+    gc_parser.add_argument("--grace-seconds", type=float, default=3600.0,
+                           help="keep unreferenced blobs younger than this (uploads in flight)")
+    args = parser.parse_args(argv)
+
+    # Same database and upload root as the API
+    from backend.main import SessionLocal, blob_store
+
+    with SessionLocal() as db:
+        report = gc(db, blob_store, args.grace_seconds, dry_run=args.dry_run, recount=args.recount)
+    print(report)
+    return 0
+
+
+__all__ = ["StoredBlob", "BlobStore", "REFERENCE_COLUMNS", "swap_reference", "gc"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+"""
+Bounded, thread-safe TTL cache for small per-process lookups.
+
+Entries expire ``ttl`` seconds after being set; when full, the least recently used
+entry is evicted. Each uvicorn worker has its own copy, so keep TTLs short for data
+that other workers can change.
+"""
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = float(ttl)
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires, value = item
+            if expires <= now:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+__all__ = ["TTLCache"]
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Concurrent write benchmark for the SQLite engine profiles.
+
+Runs the database side of the apply / rescore paths against a fresh temporary SQLite
+file, once per profile, with threads sharing one engine like the API workers do:
+- apply:   insert an Application plus its MatchScore in one transaction
+- rescore: rewrite every Application.similarity_score and MatchScore of one listing
+- read:    the recruiter dashboard aggregation query
+
+Reports operations/s, p50/p95 latency and "database is locked" failures per operation.
+
+Examples:
+    python -m backend.db_benchmark
+    python -m backend.db_benchmark --profiles default tuned --appliers 16 --duration 20
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
+# Ensure project root is on sys.path so `python backend/db_benchmark.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.db_profile import PROFILES, engine_options, install_sqlite_pragmas
+from backend.models import Application, Base, Intern, Listing, MatchScore, Recruiter
+
+
+def _make_engine(path: Path, profile: str):
+    url = f"sqlite:///{path}"
+    if profile == "default":
+        # The engine as originally configured: SQLite defaults, default pool
+        return create_engine(url, connect_args={"check_same_thread": False})
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **engine_options(url))
+    install_sqlite_pragmas(engine, profile)
+    return engine
+
+
+def _seed(Session, listings: int, students: int) -> None:
+    with Session() as db:
+        db.add(Recruiter(email="bench-recruiter@example.com", first_name="B", last_name="R",
+                         password_hash="x", organization_name="Bench"))
+        db.add_all(Intern(email=f"student{i}@example.com", first_name="S", last_name=str(i), password_hash="x")
+                   for i in range(students))
+        db.add_all(Listing(recruiter_email="bench-recruiter@example.com", title=f"Listing {i}", description="",
+                           degree="BSc", major="CS", duration_months=3, location="Dhaka", is_remote=False,
+                           required_skills=["python"], optional_skills=[], deadline="2099-12-31", archived=False)
+                   for i in range(listings))
+        db.commit()
+
+
+def _apply(db, rng: random.Random, listings: int, students: int) -> None:
+    listing_id = rng.randint(1, listings)
+    email = f"student{rng.randrange(students)}@example.com"
+    score = rng.random()
+    try:
+        db.add(Application(listing_id=listing_id, intern_email=email, status="pending", similarity_score=score))
+        db.add(MatchScore(listing_id=listing_id, intern_email=email, final_score=score,
+                          components={"required_coverage": score}, explanations={}, fingerprint="bench"))
+        db.commit()
+    except IntegrityError:
+        # Already applied; the unique index rejects it as in the API
+        db.rollback()
+
+
+def _rescore(db, rng: random.Random, listings: int, students: int) -> None:
+    listing_id = rng.randint(1, listings)
+    score = rng.random()
+    db.execute(update(Application).where(Application.listing_id == listing_id).values(similarity_score=score))
+    db.execute(update(MatchScore).where(MatchScore.listing_id == listing_id)
+               .values(final_score=score, scored_at=datetime.utcnow()))
+    db.commit()
+
+
+def _read(db, rng: random.Random, listings: int, students: int) -> None:
+    db.execute(
+        select(func.count(Application.id), func.count(func.distinct(Listing.id)))
+        .select_from(Listing)
+        .outerjoin(Application, Application.listing_id == Listing.id)
+        .where(Listing.recruiter_email == "bench-recruiter@example.com")
+    ).one()
+    db.rollback()
+
+
+OPERATIONS = {"apply": _apply, "rescore": _rescore, "read": _read}
+
+
+def _worker(Session, op: str, seed: int, deadline: float, args, latencies: Dict[str, List[float]], locked: Dict[str, int], lock):
+    rng = random.Random(seed)
+    fn = OPERATIONS[op]
+    local: List[float] = []
+    local_locked = 0
+    with Session() as db:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                fn(db, rng, args.listings, args.students)
+                local.append((time.perf_counter() - start) * 1000.0)
+            except OperationalError as exc:
+                db.rollback()
+                if "locked" not in str(exc):
+                    raise
+                local_locked += 1
+    with lock:
+        latencies[op].extend(local)
+        locked[op] += local_locked
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run_profile(profile: str, args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        engine = _make_engine(path, profile)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+        _seed(Session, args.listings, args.students)
+
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        locked: Dict[str, int] = defaultdict(int)
+        lock = threading.Lock()
+        plan = ["apply"] * args.appliers + ["rescore"] * args.rescorers + ["read"] * args.readers
+        start = time.perf_counter()
+        deadline = start + args.duration
+        threads = [
+            threading.Thread(target=_worker, args=(Session, op, n, deadline, args, latencies, locked, lock))
+            for n, op in enumerate(plan)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        with Session() as db:
+            applications = db.scalar(select(func.count(Application.id)))
+        engine.dispose()
+
+    print(f"profile={profile}  threads={len(plan)}  duration={elapsed:.1f}s  applications={applications}")
+    print(f"  {'operation':10s} {'ops/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>8s} {'locked':>7s}")
+    for op in OPERATIONS:
+        values = latencies[op]
+        print(f"  {op:10s} {len(values) / elapsed:8.1f} {_percentile(values, 50):8.1f} "
+              f"{_percentile(values, 95):8.1f} {max(values, default=0.0):8.1f} {locked[op]:7d}")
+    mean = statistics.fmean(latencies["apply"]) if latencies["apply"] else 0.0
+    print(f"  mean apply latency {mean:.1f} ms")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES)[::-1])
+    parser.add_argument("--appliers", type=int, default=8)
+    parser.add_argument("--rescorers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--listings", type=int, default=50)
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    for profile in args.profiles:
+        run_profile(profile, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
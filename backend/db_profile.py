@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import event
+
+
+"""
+Engine profile for InternMix databases.
+
+SQLite defaults (rollback journal, synchronous=FULL) serialize concurrent writers badly
+and surface "database is locked" under load. INTERNMIX_SQLITE_PROFILE selects:
+- tuned (default): WAL journal, synchronous=NORMAL, busy_timeout, mmap and a larger
+  page cache, applied to every new connection
+- default: leave SQLite's own settings untouched
+
+Pool sizing (INTERNMIX_DB_POOL_*) applies to any pooled engine, SQLite or PostgreSQL.
+
+count_queries counts the statements engines send to the database, for query-count checks
+(see query_check.py).
+"""
+
+PROFILES = ("tuned", "default")
+
+SQLITE_PROFILE = os.getenv("INTERNMIX_SQLITE_PROFILE", "tuned").lower()
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("INTERNMIX_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_SYNCHRONOUS = os.getenv("INTERNMIX_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+SQLITE_MMAP_SIZE = int(os.getenv("INTERNMIX_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("INTERNMIX_SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+POOL_SIZE = int(os.getenv("INTERNMIX_DB_POOL_SIZE", "10"))
+POOL_MAX_OVERFLOW = int(os.getenv("INTERNMIX_DB_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = float(os.getenv("INTERNMIX_DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("INTERNMIX_DB_POOL_RECYCLE", "1800"))
+
+
+def sqlite_pragmas(profile: str = SQLITE_PROFILE) -> List[str]:
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown SQLite profile {profile!r}; expected one of {', '.join(PROFILES)}")
+    if profile == "default":
+        return []
+    return [
+        # busy_timeout first so switching the journal mode waits out other connections
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        "PRAGMA journal_mode=WAL",
+        f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+    ]
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_memory(url: str) -> bool:
+    return ":memory:" in url or url.rstrip("/") in ("sqlite:", "sqlite+aiosqlite:")
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """Pool sizing keyword arguments for create_engine / create_async_engine."""
+    if _is_sqlite(url) and _is_memory(url):
+        # In-memory databases use a single shared connection; sizing does not apply
+        return {}
+    options: Dict[str, Any] = {
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+    }
+    if not _is_sqlite(url):
+        options.update(pool_recycle=POOL_RECYCLE, pool_pre_ping=True)
+    return options
+
+
+def install_sqlite_pragmas(engine, profile: str = SQLITE_PROFILE) -> None:
+    """Run the profile's PRAGMAs on every new DBAPI connection of a (sync or async) engine."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not _is_sqlite(str(sync_engine.url)):
+        return
+    pragmas = sqlite_pragmas(profile)
+    if not pragmas:
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+class QueryCounter:
+    """Statements seen by count_queries, in execution order."""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(*engines) -> Iterator[QueryCounter]:
+    """Count the statements the given (sync or async) engines execute inside the block."""
+    counter = QueryCounter()
+    targets = [getattr(engine, "sync_engine", engine) for engine in engines]
+    for target in targets:
+        event.listen(target, "before_cursor_execute", counter._before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        for target in targets:
+            event.remove(target, "before_cursor_execute", counter._before_cursor_execute)
+
+
+__all__ = [
+    "PROFILES", "SQLITE_PROFILE", "sqlite_pragmas", "engine_options", "install_sqlite_pragmas",
+    "QueryCounter", "count_queries",
+]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+One-off migration: remove duplicate applications before the unique index is created.
+
+``uq_applications_listing_intern`` allows one application per (listing, intern). Databases
+from before it was added may hold several; the API then starts without the index (and
+logs it) until they are resolved here.
+
+Without ``--apply`` the duplicates are only listed. With it, the earliest application of
+each pair is kept and the others are deleted (their MatchScore row is per pair and stays).
+Pairs whose applications have different statuses are skipped unless ``--force``, since
+the later one may carry a recruiter's decision; resolve those by hand.
+
+    python -m backend.dedupe_applications [--apply] [--force]
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+# Ensure project root is on sys.path so `python backend/dedupe_applications.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.models import Application
+
+
+def duplicate_groups(db: Session) -> Dict[Tuple[int, str], List[Application]]:
+    """Applications of every (listing, intern) pair applied to more than once, oldest first."""
+    pairs = (
+        select(Application.listing_id, Application.intern_email)
+        .group_by(Application.listing_id, Application.intern_email)
+        .having(func.count(Application.id) > 1)
+        .subquery()
+    )
+    rows = db.scalars(
+        select(Application)
+        .join(pairs, (Application.listing_id == pairs.c.listing_id) & (Application.intern_email == pairs.c.intern_email))
+        .order_by(Application.listing_id, Application.intern_email, Application.id)
+    )
+    groups: Dict[Tuple[int, str], List[Application]] = defaultdict(list)
+    for app in rows:
+        groups[(app.listing_id, app.intern_email)].append(app)
+    return dict(groups)
+
+
+def dedupe(db: Session, apply: bool = False, force: bool = False) -> Dict[str, int]:
+    groups = duplicate_groups(db)
+    doomed: List[int] = []
+    skipped = 0
+    for (listing_id, email), apps in groups.items():
+        statuses = {app.status for app in apps}
+        conflict = len(statuses) > 1 and not force
+        print(f"listing={listing_id} intern={email} "
+              + ", ".join(f"#{app.id} {app.status} {app.applied_at}" for app in apps)
+              + (" -> skipped (statuses differ)" if conflict else f" -> keep #{apps[0].id}"))
+        if conflict:
+            skipped += 1
+            continue
+        doomed.extend(app.id for app in apps[1:])
+    if apply and doomed:
+        db.execute(delete(Application).where(Application.id.in_(doomed)))
+        db.commit()
+    return {"pairs": len(groups), "skipped": skipped, "deleted" if apply else "would_delete": len(doomed)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="delete the duplicates (default: list them)")
+    parser.add_argument("--force", action="store_true", help="also dedupe pairs whose statuses differ")
+    args = parser.parse_args(argv)
+
+    # Same database as the API
+    from backend.main import SessionLocal, ensure_indexes
+
+    with SessionLocal() as db:
+        report = dedupe(db, apply=args.apply, force=args.force)
+    print(report)
+    if args.apply and not report["skipped"]:
+        ensure_indexes()
+    return 1 if report["skipped"] else 0
+
+
+__all__ = ["duplicate_groups", "dedupe"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+
+"""
+Content-hash keyed store for sentence embeddings.
+
+Usage:
+- Keys are SHA-256 digests of (namespace, text); the namespace should identify the
+  model that produced the vector so switching models never reuses stale vectors
+- Hot entries live in an in-memory LRU; every entry is also written to a SQLite
+  sidecar file so restarts and other workers reuse previous encodes
+"""
+
+
+class EmbeddingCache:
+    def __init__(self, path: Optional[str], max_items: int = 4096) -> None:
+        self.max_items = max(1, int(max_items))
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def key(namespace: str, text: str) -> str:
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        pending = []
+        with self._lock:
+            for k in keys:
+                if k in found:
+                    continue
+                vec = self._memory.get(k)
+                if vec is not None:
+                    self._memory.move_to_end(k)
+                    found[k] = vec
+                else:
+                    pending.append(k)
+            if pending and self._conn is not None:
+                # Stay well below SQLite's bound-parameter limit
+                for i in range(0, len(pending), 500):
+                    chunk = pending[i:i + 500]
+                    marks = ",".join("?" * len(chunk))
+                    try:
+                        rows = self._conn.execute(
+                            f"SELECT key, vec FROM embeddings WHERE key IN ({marks})", chunk
+                        ).fetchall()
+                    except sqlite3.Error:
+                        rows = []
+                    for k, blob in rows:
+                        vec = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(k, vec)
+                        found[k] = vec
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        rows = []
+        with self._lock:
+            for k, vec in items.items():
+                vec = np.ascontiguousarray(vec, dtype=np.float32)
+                vec.setflags(write=False)
+                self._remember(k, vec)
+                rows.append((k, int(vec.shape[0]), vec.tobytes()))
+            if self._conn is not None:
+                try:
+                    self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, dim, vec) VALUES (?, ?, ?)", rows)
+                    self._conn.commit()
+                except sqlite3.Error:
+                    # Persistence is best-effort; the in-memory copy is still valid
+                    self._conn.rollback()
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+
+__all__ = ["EmbeddingCache"]
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Encoder backend tooling for InternMix matching.
+
+Commands:
+- export:   write model.onnx + tokenizer files for the MiniLM matching model
+- quantize: write model.int8.onnx (dynamic int8 weights) next to model.onnx
+- parity:   compare semantic_skills / semantic_overall of a backend against torch,
+            report encode throughput, exit non-zero if the tolerance is exceeded
+
+Examples:
+    python -m backend.encoder_tools export
+    python -m backend.encoder_tools quantize
+    python -m backend.encoder_tools parity --backend onnx-int8
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Ensure project root is on sys.path so `python backend/encoder_tools.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend import matching
+from backend.encoders import BACKENDS, load_encoder
+
+
+# Max absolute difference allowed per semantic component, relative to the torch backend
+TOLERANCES = {"torch": 1e-6, "onnx": 1e-3, "onnx-int8": 0.03}
+
+SAMPLE_INTERNSHIPS: List[Dict[str, Any]] = [
+    {
+        "title": "Frontend Developer Intern",
+        "description": "Build responsive dashboards with React and TypeScript.",
+        "required_skills": ["react", "typescript", "css"],
+        "optional_skills": ["tailwind", "next.js"],
+        "degree": "BSc", "major": "Computer Science", "location": "Dhaka", "is_remote": True,
+        "duration_months": 3, "recommended_cgpa": 3.2,
+    },
+    {
+        "title": "Data Analyst Intern",
+        "description": "Clean datasets, build reports and simple forecasting models.",
+        "required_skills": ["python", "pandas", "sql"],
+        "optional_skills": ["matplotlib", "scikit-learn"],
+        "degree": "BSc", "major": "Data Science", "location": "Chittagong", "is_remote": False,
+        "duration_months": 6, "recommended_cgpa": 3.0,
+    },
+    {
+        "title": "Backend Engineer Intern",
+        "description": "Design REST APIs and background workers on cloud infrastructure.",
+        "required_skills": ["java", "spring boot", "postgresql"],
+        "optional_skills": ["docker", "kubernetes", "amazon web services"],
+        "degree": "BSc", "major": "Computer Science", "location": "Dhaka", "is_remote": False,
+        "duration_months": 4, "recommended_cgpa": None,
+    },
+    {
+        "title": "Marketing Intern",
+        "description": "Plan social campaigns and analyse engagement metrics.",
+        "required_skills": ["content writing", "excel"],
+        "optional_skills": ["canva"],
+        "degree": "BBA", "major": "Marketing", "location": "Sylhet", "is_remote": True,
+        "duration_months": 3, "recommended_cgpa": 2.8,
+    },
+]
+
+SAMPLE_APPLICANTS: List[Dict[str, Any]] = [
+    {
+        "education": [{"title": "BSc in Computer Science", "organisation": "BRAC University", "city": "Dhaka"}],
+        "experience": [{"title": "Web Developer", "company": "Startup", "description": "Shipped React + Node.js features"}],
+        "skills": [{"name": "React/TypeScript"}, {"name": "HTML, CSS"}, {"name": "Git"}],
+    },
+    {
+        "education": [{"title": "BSc in Data Science", "organisation": "NSU", "city": "Dhaka"}],
+        "experience": [{"title": "Research Assistant", "company": "NSU", "description": "Built pandas pipelines and dashboards"}],
+        "skills": [{"name": "Python"}, {"name": "SQL"}, {"name": "scikit-learn"}],
+    },
+    {
+        "education": [{"title": "BBA in Marketing", "organisation": "IBA", "city": "Sylhet"}],
+        "experience": [],
+        "skills": [{"name": "Excel"}, {"name": "Content Writing"}],
+        "github": {"languages": ["JavaScript"]},
+    },
+]
+
+
+def _pairs(path: str | None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    if path:
+        with open(path, "r", encoding="utf-8") as fh:
+            return [(p["internship"], p["applicant"]) for p in json.load(fh)]
+    return [(jd, app) for jd in SAMPLE_INTERNSHIPS for app in SAMPLE_APPLICANTS]
+
+
+def _semantic_components(encoder, pairs, batch_size: int) -> np.ndarray:
+    texts: List[str] = []
+    for jd, app in pairs:
+        jd_prep = matching._prepare_internship(jd)
+        app_prep = matching._prepare_applicant(app)
+        texts.extend((jd_prep["skills_text"], app_prep["skills_text"], jd_prep["text"], app_prep["text"]))
+    emb = np.asarray(encoder.encode(texts, batch_size=batch_size, normalize_embeddings=True)).reshape(len(pairs), 4, -1)
+    # columns: semantic_skills, semantic_overall
+    return np.stack([(emb[:, 0] * emb[:, 1]).sum(axis=1), (emb[:, 2] * emb[:, 3]).sum(axis=1)], axis=1)
+
+
+def _throughput(encoder, texts: List[str], batch_size: int, repeats: int) -> float:
+    encoder.encode(texts[:batch_size], batch_size=batch_size)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        encoder.encode(texts, batch_size=batch_size)
+    return len(texts) * repeats / max(time.perf_counter() - start, 1e-9)
+
+
+def cmd_export(args) -> int:
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    out = Path(args.dir)
+    out.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModel.from_pretrained(args.model).eval()
+    tokenizer.save_pretrained(str(out))
+    dummy = tokenizer(["InternMix export"], return_tensors="pt")
+    names = ["input_ids", "attention_mask", "token_type_ids"]
+    axes = {name: {0: "batch", 1: "sequence"} for name in names + ["last_hidden_state"]}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(dummy[name] for name in names),
+            str(out / "model.onnx"),
+            input_names=names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=axes,
+            opset_version=14,
+        )
+    print(f"Exported {args.model} to {out / 'model.onnx'}")
+    return 0
+
+
+def cmd_quantize(args) -> int:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    src = Path(args.dir) / "model.onnx"
+    dst = Path(args.dir) / "model.int8.onnx"
+    quantize_dynamic(str(src), str(dst), weight_type=QuantType.QInt8)
+    print(f"Quantized {src} -> {dst} ({dst.stat().st_size / 1e6:.1f} MB)")
+    return 0
+
+
+def cmd_parity(args) -> int:
+    pairs = _pairs(args.pairs)
+    texts = [t for jd, app in pairs for t in (matching._prepare_internship(jd)["text"], matching._prepare_applicant(app)["text"])]
+    reference = load_encoder("torch", args.model, args.dir, threads=args.threads)
+    candidate = load_encoder(args.backend, args.model, args.dir, threads=args.threads)
+
+    ref = _semantic_components(reference, pairs, args.batch_size)
+    got = _semantic_components(candidate, pairs, args.batch_size)
+    diff = np.abs(ref - got)
+    tolerance = args.tolerance if args.tolerance is not None else TOLERANCES[args.backend]
+
+    print(f"pairs: {len(pairs)}  tolerance: {tolerance}")
+    for col, name in enumerate(("semantic_skills", "semantic_overall")):
+        print(f"{name:17s} max|diff|={diff[:, col].max():.5f}  mean|diff|={diff[:, col].mean():.5f}")
+    for encoder in (reference, candidate):
+        rate = _throughput(encoder, texts, args.batch_size, args.repeats)
+        print(f"{encoder.backend:10s} throughput: {rate:8.1f} texts/s")
+
+    if diff.max() > tolerance:
+        print("FAIL: backend exceeds parity tolerance")
+        return 1
+    print("OK")
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=matching._MODEL_NAME)
+    parser.add_argument("--dir", default=matching._ONNX_DIR, help="directory holding the ONNX model and tokenizer")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("export")
+    sub.add_parser("quantize")
+    parity = sub.add_parser("parity")
+    parity.add_argument("--backend", choices=BACKENDS, default=matching._ENCODER_BACKEND)
+    parity.add_argument("--pairs", help="JSON list of {internship, applicant} payloads (defaults to built-in samples)")
+    parity.add_argument("--tolerance", type=float)
+    parity.add_argument("--batch-size", type=int, default=32)
+    parity.add_argument("--repeats", type=int, default=5)
+    parity.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args(argv)
+    return {"export": cmd_export, "quantize": cmd_quantize, "parity": cmd_parity}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+"""
+Sentence encoder backends for matching.
+
+Backends (selected with INTERNMIX_ENCODER_BACKEND):
+- torch: sentence-transformers on PyTorch (reference implementation)
+- onnx: the same MiniLM graph exported to ONNX and run with ONNX Runtime
+- onnx-int8: the ONNX graph with dynamically quantized int8 weights
+
+All backends expose ``encode(texts, batch_size=..., normalize_embeddings=...)`` like
+SentenceTransformer, so matching code is backend-agnostic. ONNX files are produced
+with ``python -m backend.encoder_tools export`` / ``quantize``.
+"""
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+ONNX_FILENAMES = {"onnx": "model.onnx", "onnx-int8": "model.int8.onnx"}
+# all-MiniLM-L6-v2 is trained with 256 word pieces; sentence-transformers truncates there too
+MAX_SEQ_LENGTH = 256
+
+
+class TorchEncoder:
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self.backend = "torch"
+        self._model = SentenceTransformer(model_name)
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32, normalize_embeddings: bool = True) -> np.ndarray:
+        return self._model.encode(texts, batch_size=batch_size, normalize_embeddings=normalize_embeddings)
+
+
+class OnnxEncoder:
+    def __init__(self, model_dir: str | Path, backend: str = "onnx", threads: Optional[int] = None) -> None:
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_dir = Path(model_dir)
+        self.backend = backend
+        self._tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        self._tokenizer.enable_padding(pad_id=self._tokenizer.token_to_id("[PAD]") or 0, pad_token="[PAD]")
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self._session = ort.InferenceSession(
+            str(model_dir / ONNX_FILENAMES[backend]), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encodings], dtype=np.int64)
+        hidden = self._session.run(None, feeds)[0]
+        # Mean pooling over real tokens, as in the sentence-transformers pooling layer
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (hidden * mask).sum(axis=1)
+        return (summed / np.clip(mask.sum(axis=1), 1e-9, None)).astype(np.float32)
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32, normalize_embeddings: bool = True) -> np.ndarray:
+        single = isinstance(texts, str)
+        items = [texts] if single else list(texts)
+        if not items:
+            return np.zeros((0, 0), dtype=np.float32)
+        # Sort by length so each batch pads to similar lengths, then restore input order
+        order = sorted(range(len(items)), key=lambda i: len(items[i]))
+        out: List[Optional[np.ndarray]] = [None] * len(items)
+        for start in range(0, len(order), max(1, batch_size)):
+            chunk = order[start:start + batch_size]
+            for i, vec in zip(chunk, self._encode_batch([items[i] for i in chunk])):
+                out[i] = vec
+        emb = np.stack(out)
+        if normalize_embeddings:
+            emb = emb / np.clip(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12, None)
+        return emb[0] if single else emb
+
+
+def load_encoder(backend: str, model_name: str, onnx_dir: str | Path, threads: Optional[int] = None):
+    if backend == "torch":
+        return TorchEncoder(model_name)
+    if backend in ONNX_FILENAMES:
+        return OnnxEncoder(onnx_dir, backend=backend, threads=threads)
+    raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+
+
+__all__ = ["BACKENDS", "TorchEncoder", "OnnxEncoder", "load_encoder"]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlparse
+from urllib.request import Request, urlopen
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from backend.models import GitHubResponse
+
+
+"""
+Server-side GitHub profile ingestion.
+
+Builds ``github_parsed`` for a student from their ``github_url``:
+- every page of the user's own (non-fork) repositories, following the Link header
+- per-repository language byte counts, summed into language shares, so a language only
+  counts as a skill once it makes up a real part of the user's code (MIN_LANGUAGE_SHARE)
+
+Every GET is conditional: the ETag and body of the last 200 response are kept in the
+``github_responses`` table and sent back as If-None-Match, so unchanged data costs a 304
+(which GitHub does not count against the rate limit). INTERNMIX_GITHUB_API_URL points the
+client at GitHub Enterprise or a local stub server.
+"""
+
+GITHUB_API_URL = os.getenv("INTERNMIX_GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_TOKEN = os.getenv("INTERNMIX_GITHUB_TOKEN") or None
+MAX_REPOS = int(os.getenv("INTERNMIX_GITHUB_MAX_REPOS", "100"))
+MIN_LANGUAGE_SHARE = float(os.getenv("INTERNMIX_GITHUB_MIN_LANGUAGE_SHARE", "0.05"))
+REQUEST_TIMEOUT = 10.0
+
+_USERNAME = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+_NEXT_LINK = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+class GitHubError(Exception):
+    def __init__(self, status_code: Optional[int], detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def username_from_url(github_url: Optional[str]) -> Optional[str]:
+    """GitHub login from a profile URL (``https://github.com/<login>[/...]``), else None."""
+    if not github_url:
+        return None
+    parsed = urlparse(github_url.strip())
+    if parsed.hostname not in ("github.com", "www.github.com"):
+        return None
+    parts = [part for part in parsed.path.split("/") if part]
+    if not parts or not _USERNAME.match(parts[0]):
+        return None
+    return parts[0]
+
+
+class GitHubClient:
+    def __init__(self, api_url: str = GITHUB_API_URL, token: Optional[str] = GITHUB_TOKEN,
+                 timeout: float = REQUEST_TIMEOUT) -> None:
+        self.api_url = api_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+
+    def get(self, url: str, etag: Optional[str] = None) -> Tuple[int, Optional[str], Optional[str], Any]:
+        """GET ``url``; returns (status, etag, next page url, JSON body). Body is None on 304."""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "InternMix",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if etag:
+            headers["If-None-Match"] = etag
+        try:
+            with urlopen(Request(url, headers=headers), timeout=self.timeout) as resp:
+                link = _NEXT_LINK.search(resp.headers.get("Link") or "")
+                return resp.status, resp.headers.get("ETag"), link.group(1) if link else None, json.load(resp)
+        except HTTPError as exc:
+            if exc.code == 304:
+                return 304, etag, None, None
+            detail = f"GitHub API error {exc.code} for {url}"
+            if exc.headers.get("X-RateLimit-Remaining") == "0":
+                detail += f" (rate limited until {exc.headers.get('X-RateLimit-Reset')})"
+            raise GitHubError(exc.code, detail) from exc
+        except (URLError, TimeoutError, ValueError) as exc:
+            raise GitHubError(None, f"GitHub API request failed for {url}: {exc}") from exc
+
+
+def _conditional_get(db: Session, client: GitHubClient, url: str) -> Tuple[Any, Optional[str]]:
+    """(body, next url) for ``url``, replaying the stored response when GitHub answers 304."""
+    entry = db.get(GitHubResponse, url)
+    status, etag, next_url, body = client.get(url, entry.etag if entry is not None else None)
+    now = datetime.utcnow()
+    if status == 304 and entry is not None:
+        entry.checked_at = now
+        return entry.body, entry.next_url
+    if entry is None:
+        entry = GitHubResponse(url=url)
+        db.add(entry)
+    entry.etag = etag
+    entry.next_url = next_url
+    entry.body = body
+    entry.fetched_at = entry.checked_at = now
+    return body, next_url
+
+
+def ingest(db: Session, username: str, client: Optional[GitHubClient] = None) -> Dict[str, Any]:
+    """Fetch (conditionally) and summarize a user's repositories; caches responses, commits.
+
+    The result is stable while nothing changes on GitHub, so callers can compare it with the
+    stored ``github_parsed`` to decide whether scores need refreshing.
+    """
+    client = client or GitHubClient()
+    url: Optional[str] = f"{client.api_url}/users/{quote(username)}/repos?type=owner&sort=pushed&per_page=100"
+    repos: List[dict] = []
+    try:
+        while url and len(repos) < MAX_REPOS:
+            page, url = _conditional_get(db, client, url)
+            if not isinstance(page, list):
+                raise GitHubError(None, "Unexpected GitHub response for repository list")
+            repos.extend(repo for repo in page if isinstance(repo, dict) and not repo.get("fork"))
+        repos = repos[:MAX_REPOS]
+
+        language_bytes: Counter = Counter()
+        repo_languages: Dict[str, str] = {}
+        for repo in repos:
+            languages, _ = _conditional_get(db, client, f"{client.api_url}/repos/{repo['full_name']}/languages")
+            languages = {k: int(v) for k, v in (languages or {}).items() if isinstance(v, (int, float)) and v > 0}
+            if languages:
+                language_bytes.update(languages)
+                repo_languages[repo["name"]] = max(languages, key=languages.get)
+            elif repo.get("language"):
+                repo_languages[repo["name"]] = repo["language"]
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+
+    total = sum(language_bytes.values())
+    shares = {lang: count / total for lang, count in language_bytes.most_common()} if total else {}
+    return {
+        "username": username,
+        # Languages weighted by bytes; minor ones are kept in language_weights only
+        "languages": [lang for lang, share in shares.items() if share >= MIN_LANGUAGE_SHARE],
+        "language_weights": {lang: round(share, 2) for lang, share in shares.items() if round(share, 2) > 0},
+        "repos": sorted((repo["name"] for repo in repos), key=str.lower),
+        "repoLanguageMap": dict(sorted(repo_languages.items())),
+    }
+
+
+def prune(db: Session, older_than: timedelta) -> int:
+    """Drop cached responses not used for ``older_than`` (deleted repos, changed usernames)."""
+    result = db.execute(delete(GitHubResponse).where(GitHubResponse.checked_at < datetime.utcnow() - older_than))
+    db.commit()
+    return result.rowcount or 0
+
+
+__all__ = ["GitHubError", "GitHubClient", "username_from_url", "ingest", "prune"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+"""
+Small in-process background job queue.
+
+Usage:
+- submit(key, fn, *args) runs fn on a worker thread; while a job with the same key is
+  still queued, further submits return that job instead of queueing a duplicate
+- status(job_id) reports queued / running / done / failed for recent jobs
+"""
+
+logger = logging.getLogger("internmix.jobs")
+
+
+class JobQueue:
+    def __init__(self, workers: int = 2, name: str = "internmix-jobs", history: int = 1000) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queued: Dict[str, str] = {}
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._history = history
+        self._active = 0
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any) -> str:
+        with self._lock:
+            existing = self._queued.get(key)
+            if existing is not None:
+                return existing
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "id": job_id,
+                "key": key,
+                "state": "queued",
+                "error": None,
+                "created_at": time.time(),
+                "finished_at": None,
+            }
+            while len(self._jobs) > self._history:
+                self._jobs.popitem(last=False)
+            self._queued[key] = job_id
+            self._active += 1
+        try:
+            self._executor.submit(self._run, job_id, key, fn, args)
+        except RuntimeError:
+            # Executor already shut down (interpreter exit); drop the job
+            with self._lock:
+                self._queued.pop(key, None)
+                self._jobs[job_id]["state"] = "failed"
+                self._jobs[job_id]["error"] = "queue shut down"
+                self._active -= 1
+                self._idle.notify_all()
+        return job_id
+
+    def _run(self, job_id: str, key: str, fn: Callable[..., Any], args: tuple) -> None:
+        with self._lock:
+            if self._queued.get(key) == job_id:
+                del self._queued[key]
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["state"] = "running"
+        state, error = "done", None
+        try:
+            fn(*args)
+        except Exception as exc:
+            logger.exception("Background job %s failed", key)
+            state, error = "failed", str(exc)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["state"] = state
+                job["error"] = error
+                job["finished_at"] = time.time()
+            self._active -= 1
+            self._idle.notify_all()
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no jobs are queued or running; returns False on timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._active == 0, timeout=timeout)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+__all__ = ["JobQueue"]
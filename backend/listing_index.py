@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:  # POSIX advisory locks so concurrent workers don't lose each other's writes
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+"""
+Precomputed listing embeddings shared by every worker process.
+
+Layout (all under one directory):
+- CURRENT: name of the live generation, swapped atomically with os.replace
+- <gen>.ids.npy: int64 listing ids, one per row
+- <gen>.digests.npy: (rows, 32) uint8 content digests so stale rows can be detected
+- <gen>.vectors.npy: contiguous float32 matrix of shape (rows, 2, dim)
+
+Readers memory-map the live generation, so the OS page cache holds one copy for all workers.
+"""
+
+
+def _digest_rows(digests) -> np.ndarray:
+    """Digests as a (rows, 32) uint8 array.
+
+    Not numpy's "S32": reading an element of it strips trailing NUL bytes, so a digest
+    ending in 0x00 would never compare equal again. Older "S32" files are still padded to
+    32 bytes on disk, so viewing their buffer recovers the exact digests.
+    """
+    if isinstance(digests, np.ndarray) and digests.dtype.kind == "S":
+        return np.ascontiguousarray(digests).view(np.uint8).reshape(len(digests), 32)
+    if isinstance(digests, np.ndarray):
+        return digests.astype(np.uint8).reshape(len(digests), 32)
+    if not digests:
+        return np.zeros((0, 32), dtype=np.uint8)
+    return np.stack([np.frombuffer(bytes(d), dtype=np.uint8) if isinstance(d, bytes) else np.asarray(d, dtype=np.uint8)
+                     for d in digests])
+
+
+class ListingIndex:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._generation: Optional[str] = None
+        self._ids: Optional[np.ndarray] = None
+        self._digests: Optional[np.ndarray] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._rows: Dict[int, int] = {}
+
+    # ---- reading ----
+
+    def _current_generation(self) -> Optional[str]:
+        try:
+            return (self.directory / "CURRENT").read_text().strip() or None
+        except OSError:
+            return None
+
+    def _refresh(self) -> None:
+        gen = self._current_generation()
+        if gen == self._generation:
+            return
+        if gen is None:
+            self._generation, self._ids, self._digests, self._vectors, self._rows = None, None, None, None, {}
+            return
+        try:
+            ids = np.load(self.directory / f"{gen}.ids.npy")
+            digests = _digest_rows(np.load(self.directory / f"{gen}.digests.npy"))
+            vectors = np.load(self.directory / f"{gen}.vectors.npy", mmap_mode="r")
+        except (OSError, ValueError):
+            # A writer may have just replaced this generation; keep the previous view
+            return
+        self._generation, self._ids, self._digests, self._vectors = gen, ids, digests, vectors
+        self._rows = {int(lid): row for row, lid in enumerate(ids)}
+
+    def lookup(self, listing_ids: List[int], digests: List[bytes]) -> Tuple[Optional[np.ndarray], List[int]]:
+        """Return (vectors, stale_positions) for the given listings.
+
+        ``vectors`` has one row per requested listing (zeros where stale) and is None
+        when nothing usable is indexed. ``stale_positions`` lists positions whose row
+        is missing or was computed from different listing content.
+        """
+        with self._lock:
+            self._refresh()
+            if self._vectors is None or not self._rows:
+                return None, list(range(len(listing_ids)))
+            rows = np.full(len(listing_ids), -1, dtype=np.int64)
+            stale: List[int] = []
+            for pos, (lid, digest) in enumerate(zip(listing_ids, digests)):
+                row = self._rows.get(int(lid))
+                if row is None or self._digests[row].tobytes() != digest:
+                    stale.append(pos)
+                else:
+                    rows[pos] = row
+            out = np.zeros((len(listing_ids),) + self._vectors.shape[1:], dtype=np.float32)
+            found = rows >= 0
+            if found.any():
+                out[found] = self._vectors[rows[found]]
+            return out, stale
+
+    # ---- writing ----
+
+    @contextmanager
+    def _writer(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.directory / "LOCK", "a+") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _write(self, ids: np.ndarray, digests: np.ndarray, vectors: np.ndarray) -> None:
+        gen = uuid.uuid4().hex
+        np.save(self.directory / f"{gen}.ids.npy", ids.astype(np.int64))
+        np.save(self.directory / f"{gen}.digests.npy", _digest_rows(digests))
+        np.save(self.directory / f"{gen}.vectors.npy", np.ascontiguousarray(vectors, dtype=np.float32))
+        tmp = self.directory / f"CURRENT.{gen}"
+        tmp.write_text(gen)
+        os.replace(tmp, self.directory / "CURRENT")
+        previous = self._generation
+        self._refresh()
+        if previous and previous != gen:
+            for suffix in ("ids", "digests", "vectors"):
+                try:
+                    (self.directory / f"{previous}.{suffix}.npy").unlink()
+                except OSError:
+                    # Still mapped elsewhere (Windows) or already gone
+                    pass
+
+    def upsert(self, items: Iterable[Tuple[int, bytes, np.ndarray]]) -> None:
+        """Insert or replace rows given as (listing_id, digest, vectors[2, dim])."""
+        items = list(items)
+        if not items:
+            return
+        with self._writer():
+            self._generation = None
+            self._refresh()
+            if self._vectors is not None and self._vectors.shape[1:] == np.asarray(items[0][2]).shape:
+                ids = list(self._ids)
+                digests = list(self._digests)
+                vectors = list(np.asarray(self._vectors))
+            else:
+                # Empty index, or the encoder changed dimensions: start over
+                ids, digests, vectors = [], [], []
+            rows = {int(lid): row for row, lid in enumerate(ids)}
+            for lid, digest, vec in items:
+                row = rows.get(int(lid))
+                if row is None:
+                    rows[int(lid)] = len(ids)
+                    ids.append(int(lid))
+                    digests.append(digest)
+                    vectors.append(np.asarray(vec, dtype=np.float32))
+                else:
+                    digests[row] = digest
+                    vectors[row] = np.asarray(vec, dtype=np.float32)
+            self._write(np.asarray(ids), _digest_rows(digests), np.stack(vectors))
+
+    def remove(self, listing_ids: Iterable[int]) -> None:
+        drop = {int(x) for x in listing_ids}
+        with self._writer():
+            self._generation = None
+            self._refresh()
+            if self._vectors is None:
+                return
+            keep = np.array([int(lid) not in drop for lid in self._ids], dtype=bool)
+            if keep.all():
+                return
+            self._write(self._ids[keep], self._digests[keep], np.asarray(self._vectors)[keep])
+
+
+__all__ = ["ListingIndex"]
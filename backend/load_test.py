@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Local HTTP load test for the InternMix read endpoints.
+
+Seeds a recruiter, a student, one listing and one application (reusing them on later
+runs), then keeps ``--concurrency`` clients busy for ``--duration`` seconds on the read
+endpoints and reports throughput and latency per endpoint.
+
+To compare the async and sync database paths, run the same command against a server
+started from this tree and from a checkout before the async port. Start the servers
+with INTERNMIX_DASHBOARD_CACHE_TTL=0 so dashboards hit the database on every request.
+
+Requires httpx (pip install httpx).
+
+Examples:
+    INTERNMIX_DASHBOARD_CACHE_TTL=0 uvicorn backend.main:app --port 8000
+    python -m backend.load_test --base-url http://127.0.0.1:8000 --concurrency 64 --duration 15
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dev tool
+    sys.exit("load_test requires httpx: pip install httpx")
+
+
+PASSWORD = "load-test-password"
+
+
+async def _token(client: httpx.AsyncClient, signup: dict) -> str:
+    credentials = {"email": signup["email"], "password": PASSWORD}
+    resp = await client.post("/api/auth/login", json=credentials)
+    if resp.status_code == 401:
+        (await client.post("/api/auth/signup", json=signup)).raise_for_status()
+        resp = await client.post("/api/auth/login", json=credentials)
+    resp.raise_for_status()
+    return resp.json()["access_token"]
+
+
+async def _seed(client: httpx.AsyncClient, prefix: str) -> List[Tuple[str, dict]]:
+    """Create (or reuse) test users and data; returns (path, headers) targets."""
+    recruiter = {
+        "first_name": "Load", "last_name": "Recruiter", "email": f"{prefix}-recruiter@example.com",
+        "password": PASSWORD, "user_type": "recruiter", "organization_name": "Load Test Co",
+    }
+    student = {
+        "first_name": "Load", "last_name": "Student", "email": f"{prefix}-student@example.com",
+        "password": PASSWORD, "user_type": "student", "degree": "BSc", "major": "Computer Science",
+    }
+    r_headers = {"Authorization": f"Bearer {await _token(client, recruiter)}"}
+    s_headers = {"Authorization": f"Bearer {await _token(client, student)}"}
+
+    listings = (await client.get("/api/listings", headers=r_headers)).json()
+    if listings:
+        listing_id = listings[0]["id"]
+    else:
+        resp = await client.post("/api/listings", headers=r_headers, json={
+            "title": "Load Test Intern", "description": "Python and SQL", "degree": "BSc",
+            "major": "Computer Science", "duration_months": 3, "location": "Dhaka", "is_remote": True,
+            "required_skills": ["python", "sql"], "optional_skills": ["docker"], "deadline": "2099-12-31",
+        })
+        resp.raise_for_status()
+        listing_id = resp.json()["id"]
+    await client.post("/api/student/applications", headers=s_headers, json={"listing_id": listing_id})
+    applications = (await client.get("/api/student/applications", headers=s_headers)).json()
+    application_id = applications[0]["id"]
+
+    return [
+        ("/api/listings", r_headers),
+        (f"/api/listings/{listing_id}", {}),
+        ("/api/dashboard/recruiter", r_headers),
+        ("/api/dashboard/stats", r_headers),
+        ("/api/dashboard/student", s_headers),
+        ("/api/student/dashboard/enhanced", s_headers),
+        ("/api/student/applications", s_headers),
+        (f"/api/student/applications/{application_id}", s_headers),
+    ]
+
+
+async def _worker(client, targets, offset: int, deadline: float, latencies: Dict[str, List[float]], errors: Dict[str, int]):
+    i = offset
+    while time.perf_counter() < deadline:
+        path, headers = targets[i % len(targets)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            resp = await client.get(path, headers=headers)
+            ok = resp.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            latencies[path].append((time.perf_counter() - start) * 1000.0)
+        else:
+            errors[path] += 1
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+async def run(args) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        targets = await _seed(client, args.prefix)
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        errors: Dict[str, int] = defaultdict(int)
+        deadline = time.perf_counter() + args.warmup
+        await asyncio.gather(*(_worker(client, targets, n, deadline, defaultdict(list), defaultdict(int)) for n in range(args.concurrency)))
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(_worker(client, targets, n, deadline, latencies, errors) for n in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.base_url}  concurrency={args.concurrency}  duration={elapsed:.1f}s")
+    print(f"{'endpoint':45s} {'req/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'errors':>7s}")
+    all_latencies: List[float] = []
+    for path, _ in targets:
+        values = latencies[path]
+        all_latencies.extend(values)
+        print(f"{path:45s} {len(values) / elapsed:8.1f} {_percentile(values, 50):8.1f} "
+              f"{_percentile(values, 95):8.1f} {_percentile(values, 99):8.1f} {errors[path]:7d}")
+    total_errors = sum(errors.values())
+    mean = statistics.fmean(all_latencies) if all_latencies else 0.0
+    print(f"{'TOTAL':45s} {len(all_latencies) / elapsed:8.1f} {_percentile(all_latencies, 50):8.1f} "
+          f"{_percentile(all_latencies, 95):8.1f} {_percentile(all_latencies, 99):8.1f} {total_errors:7d}  (mean {mean:.1f} ms)")
+    return 1 if total_errors else 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before the run")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--prefix", default="loadtest", help="email prefix for the seeded users")
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
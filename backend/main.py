@@ -1,41 +1,155 @@
-from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import hmac
+import logging
 import os
+import threading
 from typing import Optional
 import sys
 from pathlib import Path
 
-from fastapi import FastAPI, Depends, HTTPException, status, Header, UploadFile, File, Request
+import anyio
+from fastapi import FastAPI, Depends, HTTPException, status, Header, UploadFile, File, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
-from sqlalchemy import create_engine, select, func
+from sqlalchemy import String, cast, create_engine, select, func, and_, or_, case
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from passlib.context import CryptContext
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from jose import jwt, JWTError
-import uuid
-import shutil
+
+import numpy as np
 
 # Ensure project root is on sys.path so `python backend/main.py` works
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from backend.models import Base, Intern, Recruiter, Listing, Application
-from backend.matching import score_match
+from backend.blob_store import BlobStore, StoredBlob, swap_reference
+from backend.cache import TTLCache
+from backend.db_profile import engine_options, install_sqlite_pragmas
+from backend.jobs import JobQueue
+from backend.models import Base, Intern, Recruiter, Listing, Application, MatchScore
+from backend.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    SortKey,
+    decode_cursor,
+    page_stmt,
+    parse_datetime,
+    split_page,
+)
+from backend.resume_parser import PARSER_VERSION, ResumeParser
+from backend.security import PasswordHasher, TooManyAttempts
+from backend.static_files import UploadStaticFiles
+from backend import github_ingest, skill_aliases, thumbnails
+from backend.uploads import (
+    MAX_IMAGE_BYTES,
+    MAX_RESUME_BYTES,
+    UploadError,
+    remove_replaced,
+    save_upload,
+    sniff_image,
+    sniff_pdf,
+)
+from backend.listing_index import ListingIndex
+from backend.matching import (
+    score_match,
+    score_many,
+    score_top_k,
+    embed_internships,
+    embed_applicant,
+    internship_digest,
+    warm_up_model,
+    model_status,
+    score_fingerprint,
+    applicant_digest,
+)
 
 # Database setup (SQLite)
 DATABASE_URL = os.getenv("INTERNMIX_DATABASE_URL", "sqlite:///./app.db")
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {})
+
+# Async drivers for the async engine; either form of URL may be configured
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg", "postgres": "postgresql+asyncpg"}
+
+
+def _sync_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    if scheme in ("sqlite+aiosqlite", "postgresql+asyncpg"):
+        return f"{scheme.split('+')[0]}{sep}{rest}"
+    return url
+
+
+def _async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+SYNC_DATABASE_URL = _sync_database_url(DATABASE_URL)
+# WAL / busy_timeout / pool sizing; see backend/db_profile.py
+engine = create_engine(
+    SYNC_DATABASE_URL,
+    connect_args={"check_same_thread": False} if SYNC_DATABASE_URL.startswith("sqlite") else {},
+    **engine_options(SYNC_DATABASE_URL),
+)
+install_sqlite_pragmas(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base.metadata.create_all(bind=engine)
 
+# Read-heavy endpoints are async and use this engine, so they don't hold threadpool slots.
+# aiosqlite defaults to NullPool (a new connection and thread per session); pool file databases.
+ASYNC_DATABASE_URL = _async_database_url(DATABASE_URL)
+_async_pool = (
+    {"poolclass": AsyncAdaptedQueuePool}
+    if ASYNC_DATABASE_URL.startswith("sqlite") and ":memory:" not in ASYNC_DATABASE_URL
+    else {}
+)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_pool, **engine_options(ASYNC_DATABASE_URL))
+install_sqlite_pragmas(async_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+logger = logging.getLogger("internmix.api")
+
 # Development settings
 DEBUG_MODE = os.getenv("INTERNMIX_DEBUG", "true").lower() == "true"
+# Load the embedding model in the background at startup; otherwise it loads on first use
+MODEL_WARMUP = os.getenv("INTERNMIX_MODEL_WARMUP", "true").lower() == "true"
+
+# Dashboard responses, keyed by (dashboard, email); writes that change the counts invalidate them
+dashboard_cache = TTLCache(maxsize=4096, ttl=float(os.getenv("INTERNMIX_DASHBOARD_CACHE_TTL", "30")))
+
+# Background jobs (rescoring etc.) run on a small in-process thread pool
+jobs = JobQueue(workers=int(os.getenv("INTERNMIX_JOB_WORKERS", "2")))
+# Uploaded resumes are parsed on their own queue; pypdf runs on a process pool behind it
+RESUME_WORKERS = int(os.getenv("INTERNMIX_RESUME_WORKERS", "1"))
+resume_jobs = JobQueue(workers=RESUME_WORKERS, name="internmix-resume")
+resume_parser = ResumeParser(workers=RESUME_WORKERS)
+# github_parsed is refreshed from the GitHub API this often (conditional requests; 0 disables)
+GITHUB_REFRESH_INTERVAL = float(os.getenv("INTERNMIX_GITHUB_REFRESH_INTERVAL", str(6 * 3600)))
+_github_refresh_stop = threading.Event()
+# skill_taxonomy.json is checked for changes this often (0 disables; see backend/skill_aliases.py)
+SKILL_TAXONOMY_POLL_INTERVAL = float(os.getenv("INTERNMIX_SKILL_TAXONOMY_POLL_INTERVAL", "30"))
+_taxonomy_watch_stop = threading.Event()
+# Enables /api/admin endpoints (sent as X-Admin-Token); unset disables them
+ADMIN_TOKEN = os.getenv("INTERNMIX_ADMIN_TOKEN") or None
 
 
 # Security / JWT setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt runs on a dedicated process pool; see backend/security.py
+password_hasher = PasswordHasher(
+    workers=int(os.getenv("INTERNMIX_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    per_key_limit=int(os.getenv("INTERNMIX_AUTH_CONCURRENCY_PER_KEY", "2")),
+    max_pending=int(os.getenv("INTERNMIX_HASH_MAX_PENDING", "64")),
+)
+# Resolved principals keyed by token subject, so authenticated requests skip the user lookup
+principal_cache = TTLCache(
+    maxsize=int(os.getenv("INTERNMIX_PRINCIPAL_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("INTERNMIX_PRINCIPAL_CACHE_TTL", "60")),
+)
 SECRET_KEY = os.getenv("INTERNMIX_SECRET_KEY", "dev-secret-change-me")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("INTERNMIX_TOKEN_EXPIRE_MINUTES", "10080"))  # default 7 days
@@ -49,14 +163,6 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
     return encoded_jwt
 
 
-def verify_password(plain_password: str, password_hash: str) -> bool:
-    return pwd_context.verify(plain_password, password_hash)
-
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-
 def get_db() -> Session:
     db = SessionLocal()
     try:
@@ -65,6 +171,11 @@ def get_db() -> Session:
         db.close()
 
 
+async def get_async_db() -> AsyncSession:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Pydantic schemas
 class SignupRequest(BaseModel):
     first_name: str
@@ -150,10 +261,35 @@ class ListingResponse(BaseModel):
     created_at: str
     applications_count: int
     created_by_profile_image_url: Optional[str] = None
+    created_by_profile_image_thumbnails: Optional[dict[str, str]] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if MODEL_WARMUP:
+        warm_up_model()
+    # Pick up scores made stale by a model/scoring version change while we were down
+    jobs.submit("rescore:all", _rescore_applications)
+    if GITHUB_REFRESH_INTERVAL > 0:
+        _github_refresh_stop.clear()
+        threading.Thread(target=_github_refresh_loop, name="internmix-github-refresh", daemon=True).start()
+    if SKILL_TAXONOMY_POLL_INTERVAL > 0:
+        _taxonomy_watch_stop.clear()
+        threading.Thread(target=_taxonomy_watch_loop, name="internmix-taxonomy-watch", daemon=True).start()
+    yield
+    _github_refresh_stop.set()
+    _taxonomy_watch_stop.set()
+    jobs.shutdown()
+    resume_jobs.shutdown()
+    resume_parser.shutdown()
+    password_hasher.shutdown()
+    thumbnails.shutdown()
+    await async_engine.dispose()
 
 
 app = FastAPI(
     title="InternMix API",
+    lifespan=lifespan,
     debug=DEBUG_MODE,
     version="1.0.0",
     description="API for InternMix internship platform"
@@ -172,6 +308,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Filesystem storage setup (relative to this server script directory)
@@ -181,9 +318,15 @@ PROFILE_IMG_DIR = UPLOAD_ROOT / "profile_images"
 RESUMES_DIR = UPLOAD_ROOT / "resumes"
 for d in (UPLOAD_ROOT, PROFILE_IMG_DIR, RESUMES_DIR):
     d.mkdir(parents=True, exist_ok=True)
+# New uploads are content-addressed under uploads/blobs; the directories above hold older files
+blob_store = BlobStore(UPLOAD_ROOT / "blobs")
+
+# Precomputed listing embeddings (memory-mapped, shared across workers)
+LISTING_INDEX_DIR = Path(os.getenv("INTERNMIX_LISTING_INDEX_DIR", str(BASE_DIR / "listing_index")))
+listing_index = ListingIndex(LISTING_INDEX_DIR)
 
-# Serve uploads as static files
-app.mount("/uploads", StaticFiles(directory=str(UPLOAD_ROOT)), name="uploads")
+# Serve uploads as static files: immutable caching, ETags, ranges, optional proxy sendfile
+app.mount("/uploads", UploadStaticFiles(directory=str(UPLOAD_ROOT)), name="uploads")
 
 
 # Simple SQLite migrations to add new columns if missing
@@ -202,6 +345,8 @@ def ensure_intern_columns():
             migrations.append("ALTER TABLE interns ADD COLUMN resume_parsed TEXT")
         if "github_parsed" not in cols:
             migrations.append("ALTER TABLE interns ADD COLUMN github_parsed TEXT")
+        if "profile_image_thumbnails" not in cols:
+            migrations.append("ALTER TABLE interns ADD COLUMN profile_image_thumbnails TEXT")
         for stmt in migrations:
             conn.exec_driver_sql(stmt)
 
@@ -217,6 +362,8 @@ def ensure_recruiter_columns():
         cols = {row[1] for row in res.fetchall()}
         if "profile_image_path" not in cols:
             conn.exec_driver_sql("ALTER TABLE recruiters ADD COLUMN profile_image_path TEXT")
+        if "profile_image_thumbnails" not in cols:
+            conn.exec_driver_sql("ALTER TABLE recruiters ADD COLUMN profile_image_thumbnails TEXT")
 
 
 ensure_recruiter_columns()
@@ -235,13 +382,56 @@ def ensure_listings_columns():
             # Backfill new column from legacy 'subject' if it exists
             if "subject" in cols:
                 migrations.append("UPDATE listings SET major = subject WHERE major IS NULL")
+        if "updated_at" not in cols:
+            migrations.append("ALTER TABLE listings ADD COLUMN updated_at DATETIME")
+            migrations.append("UPDATE listings SET updated_at = created_at WHERE updated_at IS NULL")
         for stmt in migrations:
             conn.exec_driver_sql(stmt)
+        conn.commit()
 
 
 ensure_listings_columns()
 
 
+def ensure_match_score_columns():
+    if not DATABASE_URL.startswith("sqlite"):
+        return
+    with engine.connect() as conn:
+        res = conn.exec_driver_sql("PRAGMA table_info(match_scores)")
+        cols = {row[1] for row in res.fetchall()}
+        if "applicant_digest" not in cols:
+            conn.exec_driver_sql("ALTER TABLE match_scores ADD COLUMN applicant_digest TEXT")
+        conn.commit()
+
+
+ensure_match_score_columns()
+
+
+# Indexes for hot filters; create_all only adds them to tables it creates itself
+def ensure_indexes():
+    with engine.begin() as conn:
+        # The unique index fails on duplicate rows; those are never deleted here, see dedupe_applications.py
+        duplicates = conn.exec_driver_sql(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM applications GROUP BY listing_id, intern_email HAVING COUNT(*) > 1)"
+        ).scalar()
+        # Superseded by ix_listings_recruiter_archived_created (same leading columns)
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_listings_recruiter_archived")
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_match_scores_intern_email")
+        for table in (Listing.__table__, Application.__table__, MatchScore.__table__):
+            for index in table.indexes:
+                if index.unique and index.table is Application.__table__ and duplicates:
+                    logger.error(
+                        "%d (listing, intern) pairs have duplicate applications; %s is not created until "
+                        "they are resolved with `python -m backend.dedupe_applications`",
+                        duplicates, index.name,
+                    )
+                    continue
+                index.create(conn, checkfirst=True)
+
+
+ensure_indexes()
+
+
 # Helper to determine display name for a recruiter
 def _recruiter_display_name(recruiter: Recruiter | None) -> str:
     if not recruiter:
@@ -252,6 +442,112 @@ def _recruiter_display_name(recruiter: Recruiter | None) -> str:
     return f"{recruiter.first_name} {recruiter.last_name}".strip()
 
 
+def _listing_rows_stmt(*filters):
+    """Listings with their recruiter and application count in a single query.
+
+    Yields (Listing, Recruiter | None, applications_count) rows, replacing a
+    per-listing recruiter lookup and COUNT query. The count is a correlated
+    subquery so it only touches the selected listings' applications.
+    """
+    applications_count = (
+        select(func.count(Application.id))
+        .where(Application.listing_id == Listing.id)
+        .correlate(Listing)
+        .scalar_subquery()
+    )
+    return (
+        select(Listing, Recruiter, applications_count)
+        .outerjoin(Recruiter, Recruiter.email == Listing.recruiter_email)
+        .where(*filters)
+        .order_by(Listing.id)
+    )
+
+
+def listing_filters(
+    location: Optional[str] = None,
+    is_remote: Optional[bool] = None,
+    degree: Optional[str] = None,
+    major: Optional[str] = None,
+    deadline_after: Optional[date] = Query(default=None, description="YYYY-MM-DD, inclusive"),
+    deadline_before: Optional[date] = Query(default=None, description="YYYY-MM-DD, inclusive"),
+) -> list:
+    """Listing filters from query parameters, as SQL conditions (dependency)."""
+    filters = []
+    if location:
+        # autoescape: % and _ in the input match literally
+        filters.append(Listing.location.icontains(location, autoescape=True))
+    if is_remote is not None:
+        filters.append(Listing.is_remote == is_remote)
+    if degree:
+        filters.append(func.lower(Listing.degree) == degree.lower())
+    if major:
+        filters.append(func.lower(Listing.major) == major.lower())
+    # Deadlines are stored as ISO dates, so string comparison orders them
+    if deadline_after:
+        filters.append(Listing.deadline >= deadline_after.isoformat())
+    if deadline_before:
+        filters.append(Listing.deadline <= deadline_before.isoformat())
+    return filters
+
+
+def _page_or_400(stmt, keys, cursor: Optional[str], limit: int):
+    try:
+        return page_stmt(stmt, keys, cursor, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+# Keyset orderings; each ends in a unique column so pages never overlap
+LISTING_PAGE_KEYS = (SortKey(Listing.created_at, parse=parse_datetime), SortKey(Listing.id, parse=int))
+STUDENT_APPLICATION_PAGE_KEYS = (
+    SortKey(Application.applied_at, descending=True, nullable=True, parse=parse_datetime),
+    SortKey(Application.id, descending=True, parse=int),
+)
+SCORED_APPLICATION_PAGE_KEYS = (
+    SortKey(Application.similarity_score, descending=True, nullable=True, parse=float),
+    SortKey(Application.id, parse=int),
+)
+
+
+def _listing_to_dict(listing: Listing, recruiter: Recruiter | None, applications_count: int) -> dict:
+    return {
+        "id": listing.id,
+        "title": listing.title,
+        "description": listing.description,
+        "degree": listing.degree,
+        "major": listing.major,
+        "recommended_cgpa": listing.recommended_cgpa,
+        "duration_months": listing.duration_months,
+        "location": listing.location,
+        "is_remote": listing.is_remote,
+        "required_skills": listing.required_skills,
+        "optional_skills": listing.optional_skills,
+        "deadline": listing.deadline,
+        "archived": listing.archived,
+        "created_by": listing.recruiter_email,
+        "created_by_name": _recruiter_display_name(recruiter),
+        "created_at": listing.created_at.isoformat(),
+        "applications_count": applications_count,
+        "created_by_profile_image_url": (recruiter.profile_image_url if recruiter else None),
+        "created_by_profile_image_thumbnails": (recruiter.profile_image_thumbnails if recruiter else None),
+    }
+
+
+def _count_if(condition):
+    """SUM(CASE WHEN condition THEN 1 ELSE 0 END), 0 for no rows."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _invalidate_dashboards(*emails: str) -> None:
+    targets = {e for e in emails if e}
+    dashboard_cache.pop_where(lambda key: key[1] in targets)
+
+
 # Development middleware
 if DEBUG_MODE:
     @app.middleware("http")
@@ -267,16 +563,91 @@ def health() -> dict:
     return {"status": "ok", "time": datetime.utcnow().isoformat()}
 
 
+@app.get("/api/metrics/auth")
+def auth_metrics() -> dict:
+    """Password hashing latency and admission counters for this worker."""
+    return password_hasher.metrics()
+
+
+@app.get("/api/ready")
+def ready():
+    """Readiness: 503 until the matching model has finished loading (or failed to)."""
+    model = model_status()
+    body = {
+        "status": "ready" if model in ("ready", "unavailable") else "starting",
+        "model": model,
+        "skill_taxonomy": skill_aliases.taxonomy_version(),
+    }
+    if body["status"] != "ready":
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+
+def _require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    if ADMIN_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def _reload_skill_taxonomy(force: bool = False) -> bool:
+    """Reload skill_taxonomy.json if it changed; on a new version, recompute stored scores.
+
+    Fingerprints and applicant digests include the taxonomy version, so application scores
+    are rescored here and stored recommendations become stale on their next read.
+    """
+    if not skill_aliases.reload_taxonomy(force=force):
+        return False
+    dashboard_cache.clear()
+    jobs.submit("rescore:all", _rescore_applications)
+    return True
+
+
+def _taxonomy_watch_loop() -> None:
+    while not _taxonomy_watch_stop.wait(SKILL_TAXONOMY_POLL_INTERVAL):
+        try:
+            _reload_skill_taxonomy()
+        except (skill_aliases.TaxonomyError, OSError):
+            # Keep the current taxonomy until the file is fixed
+            continue
+
+
+@app.post("/api/admin/skill-taxonomy/reload", dependencies=[Depends(_require_admin)])
+def reload_skill_taxonomy() -> dict:
+    """Re-read the skill taxonomy file in this worker (others pick it up by polling)."""
+    try:
+        changed = _reload_skill_taxonomy(force=True)
+    except (skill_aliases.TaxonomyError, OSError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"version": skill_aliases.taxonomy_version(), "changed": changed}
+
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def _hash_with_limit(password: str, *keys: str) -> str:
+    """Hash on the password hasher pool under its admission limits (sync handlers: anyio.from_thread.run)."""
+    async with password_hasher.limit(*keys):
+        return await password_hasher.hash(password)
+
+
 @app.post("/api/auth/signup", response_model=UserResponse, status_code=201)
-def signup(payload: SignupRequest, db: Session = Depends(get_db)):
+async def signup(payload: SignupRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
     normalized_type = payload.user_type.lower()
     if normalized_type not in ("student", "recruiter"):
         raise HTTPException(status_code=400, detail="user_type must be 'student' or 'recruiter'")
 
+    email = str(payload.email).lower()
+    try:
+        password_hash = await _hash_with_limit(payload.password, f"ip:{_client_ip(request)}", f"email:{email}")
+    except TooManyAttempts:
+        raise HTTPException(status_code=429, detail="Too many concurrent attempts, please retry")
+
     if normalized_type == "student":
         user = Intern(
-            email=str(payload.email).lower(),
-            password_hash=hash_password(payload.password),
+            email=email,
+            password_hash=password_hash,
             first_name=payload.first_name.strip(),
             last_name=payload.last_name.strip(),
             institution=payload.institution.strip() if payload.institution else None,
@@ -287,8 +658,8 @@ def signup(payload: SignupRequest, db: Session = Depends(get_db)):
         )
     else:
         user = Recruiter(
-            email=str(payload.email).lower(),
-            password_hash=hash_password(payload.password),
+            email=email,
+            password_hash=password_hash,
             first_name=payload.first_name.strip(),
             last_name=payload.last_name.strip(),
             phone=payload.phone_num.strip() if payload.phone_num else None,
@@ -297,11 +668,11 @@ def signup(payload: SignupRequest, db: Session = Depends(get_db)):
         )
     db.add(user)
     try:
-        db.commit()
+        await db.commit()
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=409, detail="Email already registered")
-    db.refresh(user)
+    await db.refresh(user)
     user_type = "student" if isinstance(user, Intern) else "recruiter"
     return UserResponse(
         id=user.email,  # Using email as ID now
@@ -313,19 +684,30 @@ def signup(payload: SignupRequest, db: Session = Depends(get_db)):
 
 
 @app.post("/api/auth/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
     # Try intern first
     stmt_intern = select(Intern).where(Intern.email == str(payload.email).lower())
-    intern = db.execute(stmt_intern).scalar_one_or_none()
+    intern = (await db.execute(stmt_intern)).scalar_one_or_none()
     user_obj = intern
     user_type = "student"
     if intern is None:
         stmt_recruiter = select(Recruiter).where(Recruiter.email == str(payload.email).lower())
-        recruiter = db.execute(stmt_recruiter).scalar_one_or_none()
+        recruiter = (await db.execute(stmt_recruiter)).scalar_one_or_none()
         user_obj = recruiter
         user_type = "recruiter" if recruiter is not None else None
-    if user_obj is None or not verify_password(payload.password, user_obj.password_hash):
+    if user_obj is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    try:
+        async with password_hasher.limit(f"ip:{_client_ip(request)}", f"email:{user_obj.email}"):
+            valid, new_hash = await password_hasher.verify_and_update(payload.password, user_obj.password_hash)
+    except TooManyAttempts:
+        raise HTTPException(status_code=429, detail="Too many concurrent login attempts, please retry")
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # Cost factor (or scheme) changed since this hash was made; upgrade it now
+        user_obj.password_hash = new_hash
+        await db.commit()
     
     # Set token expiration based on remember_me
     if payload.remember_me:
@@ -349,7 +731,39 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
     )
 
 
-def get_current_user(db: Session = Depends(get_db), authorization: Optional[str] = Header(default=None)):
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user's identity; handlers that need the ORM row load it explicitly."""
+    email: str
+    user_type: str
+    first_name: str
+    last_name: str
+    organization_name: Optional[str] = None
+    profile_image_url: Optional[str] = None
+    profile_image_thumbnails: Optional[dict] = None
+
+
+_USER_MODELS = {"student": Intern, "recruiter": Recruiter}
+
+
+def _principal_from_user(user_type: str, user) -> Principal:
+    return Principal(
+        email=user.email,
+        user_type=user_type,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        organization_name=getattr(user, "organization_name", None),
+        profile_image_url=user.profile_image_url,
+        profile_image_thumbnails=user.profile_image_thumbnails,
+    )
+
+
+def _invalidate_principal(user_type: str, email: str) -> None:
+    principal_cache.pop(f"{user_type}:{email}")
+
+
+def _token_subject(authorization: Optional[str]) -> tuple[str, str]:
+    """Validate the bearer token and return (user_type, email) from its subject."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing Authorization header")
     try:
@@ -363,18 +777,42 @@ def get_current_user(db: Session = Depends(get_db), authorization: Optional[str]
             raise HTTPException(status_code=401, detail="Invalid token")
     except (JWTError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid token")
+    if user_type not in _USER_MODELS:
+        raise HTTPException(status_code=401, detail="Invalid token subject")
+    return user_type, email
 
-    if user_type == "student":
-        user = db.get(Intern, email)
+
+def _unknown_user(user_type: str) -> HTTPException:
+    return HTTPException(status_code=401, detail="User not found" if user_type == "student" else "Invalid token")
+
+
+def get_current_user(db: Session = Depends(get_db), authorization: Optional[str] = Header(default=None)):
+    user_type, email = _token_subject(authorization)
+    key = f"{user_type}:{email}"
+    principal = principal_cache.get(key)
+    if principal is None:
+        user = db.get(_USER_MODELS[user_type], email)
         if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user, user_type
-    elif user_type == "recruiter":
-        user = db.get(Recruiter, email)
+            raise _unknown_user(user_type)
+        principal = _principal_from_user(user_type, user)
+        principal_cache.set(key, principal)
+    return principal, user_type
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), authorization: Optional[str] = Header(default=None)
+):
+    """get_current_user for async endpoints; shares the principal cache."""
+    user_type, email = _token_subject(authorization)
+    key = f"{user_type}:{email}"
+    principal = principal_cache.get(key)
+    if principal is None:
+        user = await db.get(_USER_MODELS[user_type], email)
         if user is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return user, user_type
-    raise HTTPException(status_code=401, detail="Invalid token subject")
+            raise _unknown_user(user_type)
+        principal = _principal_from_user(user_type, user)
+        principal_cache.set(key, principal)
+    return principal, user_type
 
 
 @app.get("/api/auth/me", response_model=UserResponse)
@@ -427,6 +865,9 @@ def create_listing(
     db.add(listing)
     db.commit()
     db.refresh(listing)
+    _index_listings([listing])
+    _enqueue_recommendations(listing_id=listing.id)
+    _invalidate_dashboards(user_obj.email)
     
     return ListingResponse(
         id=listing.id,
@@ -447,96 +888,45 @@ def create_listing(
         created_at=listing.created_at.isoformat(),
         applications_count=0,
         created_by_profile_image_url=user_obj.profile_image_url,
+        created_by_profile_image_thumbnails=user_obj.profile_image_thumbnails,
     )
 
 
 @app.get("/api/listings", response_model=list[ListingResponse])
-def get_listings(
+async def get_listings(
+    response: Response,
     archived: bool = False,
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    filters: list = Depends(listing_filters),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get listings for the authenticated recruiter, filtered by archived status."""
+    """Get a page of the authenticated recruiter's listings, oldest first.
+
+    The next page's cursor is returned in the X-Next-Cursor header.
+    """
     user_obj, user_type = dep
     if user_type != "recruiter":
         raise HTTPException(status_code=403, detail="Only recruiters can view their listings")
 
-    query = db.query(Listing).filter(
-        Listing.archived == archived,
-        Listing.recruiter_email == user_obj.email,
-    )
-    listings = query.all()
-    
-    result = []
-    for listing in listings:
-        # Get recruiter info
-        recruiter = db.get(Recruiter, listing.recruiter_email)
-        recruiter_name = _recruiter_display_name(recruiter)
-        
-        # Count applications
-        applications_count = db.query(Application).filter(Application.listing_id == listing.id).count()
-        
-        result.append(ListingResponse(
-            id=listing.id,
-            title=listing.title,
-            description=listing.description,
-            degree=listing.degree,
-            major=listing.major,
-            recommended_cgpa=listing.recommended_cgpa,
-            duration_months=listing.duration_months,
-            location=listing.location,
-            is_remote=listing.is_remote,
-            required_skills=listing.required_skills,
-            optional_skills=listing.optional_skills,
-            deadline=listing.deadline,
-            archived=listing.archived,
-            created_by=listing.recruiter_email,
-            created_by_name=recruiter_name,
-            created_at=listing.created_at.isoformat(),
-            applications_count=applications_count,
-            created_by_profile_image_url=(recruiter.profile_image_url if recruiter else None),
-        ))
-    
-    return result
+    stmt = _listing_rows_stmt(Listing.archived == archived, Listing.recruiter_email == user_obj.email, *filters)
+    rows = (await db.execute(_page_or_400(stmt, LISTING_PAGE_KEYS, cursor, limit))).all()
+    rows, next_cursor = split_page(rows, limit, lambda row: (row[0].created_at, row[0].id))
+    _set_next_cursor(response, next_cursor)
+    return [ListingResponse(**_listing_to_dict(listing, recruiter, count)) for listing, recruiter, count in rows]
 
 
 @app.get("/api/listings/{listing_id}", response_model=ListingResponse)
-def get_listing(
+async def get_listing(
     listing_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific listing by ID"""
-    listing = db.get(Listing, listing_id)
-    if not listing:
+    row = (await db.execute(_listing_rows_stmt(Listing.id == listing_id))).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Listing not found")
-    
-    # Get recruiter info
-    recruiter = db.get(Recruiter, listing.recruiter_email)
-    recruiter_name = _recruiter_display_name(recruiter)
-    
-    # Count applications
-    applications_count = db.query(Application).filter(Application.listing_id == listing.id).count()
-    
-    return ListingResponse(
-        id=listing.id,
-        title=listing.title,
-        description=listing.description,
-        degree=listing.degree,
-        major=listing.major,
-        recommended_cgpa=listing.recommended_cgpa,
-        duration_months=listing.duration_months,
-        location=listing.location,
-        is_remote=listing.is_remote,
-        required_skills=listing.required_skills,
-        optional_skills=listing.optional_skills,
-        deadline=listing.deadline,
-        archived=listing.archived,
-        created_by=listing.recruiter_email,
-        created_by_name=recruiter_name,
-        created_at=listing.created_at.isoformat(),
-        applications_count=applications_count,
-        created_by_profile_image_url=(recruiter.profile_image_url if recruiter else None),
-    )
+    return ListingResponse(**_listing_to_dict(*row))
 
 
 @app.put("/api/listings/{listing_id}", response_model=ListingResponse)
@@ -567,34 +957,12 @@ def update_listing(
     
     db.commit()
     db.refresh(listing)
-    
-    # Get recruiter info
-    recruiter = db.get(Recruiter, listing.recruiter_email)
-    recruiter_name = _recruiter_display_name(recruiter)
-    
-    # Count applications
-    applications_count = db.query(Application).filter(Application.listing_id == listing.id).count()
-    
-    return ListingResponse(
-        id=listing.id,
-        title=listing.title,
-        description=listing.description,
-        degree=listing.degree,
-        major=listing.major,
-        recommended_cgpa=listing.recommended_cgpa,
-        duration_months=listing.duration_months,
-        location=listing.location,
-        is_remote=listing.is_remote,
-        required_skills=listing.required_skills,
-        optional_skills=listing.optional_skills,
-        deadline=listing.deadline,
-        archived=listing.archived,
-        created_by=listing.recruiter_email,
-        created_by_name=recruiter_name,
-        created_at=listing.created_at.isoformat(),
-        applications_count=applications_count,
-        created_by_profile_image_url=(recruiter.profile_image_url if recruiter else None),
-    )
+    _index_listings([listing])
+    _enqueue_rescore(listing_id=listing.id)
+    _enqueue_recommendations(listing_id=listing.id)
+    _invalidate_dashboards(user_obj.email)
+
+    return ListingResponse(**_listing_to_dict(*db.execute(_listing_rows_stmt(Listing.id == listing.id)).one()))
 
 
 @app.delete("/api/listings/{listing_id}")
@@ -617,12 +985,18 @@ def delete_listing(
     if listing.recruiter_email != user_obj.email:
         raise HTTPException(status_code=403, detail="Can only delete your own listings")
     
-    # Delete related applications first
+    # Applicants' cached dashboards count these applications
+    applicants = db.scalars(select(Application.intern_email).where(Application.listing_id == listing_id)).all()
+
+    # Delete related applications and scores first
     db.query(Application).filter(Application.listing_id == listing_id).delete()
+    db.query(MatchScore).filter(MatchScore.listing_id == listing_id).delete()
     
     # Delete the listing
     db.delete(listing)
     db.commit()
+    listing_index.remove([listing_id])
+    _invalidate_dashboards(user_obj.email, *applicants)
     
     return {"message": "Listing deleted successfully"}
 
@@ -649,15 +1023,16 @@ def toggle_archive_listing(
     
     listing.archived = not listing.archived
     db.commit()
+    _invalidate_dashboards(user_obj.email)
     
     return {"message": f"Listing {'archived' if listing.archived else 'unarchived'} successfully"}
 
 
 # Dashboard endpoints
 @app.get("/api/dashboard/recruiter")
-def get_recruiter_dashboard(
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_recruiter_dashboard(
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get recruiter dashboard statistics"""
     user_obj, user_type = dep
@@ -665,42 +1040,28 @@ def get_recruiter_dashboard(
     if user_type != "recruiter":
         raise HTTPException(status_code=403, detail="Only recruiters can access this endpoint")
     
-    # Get active listings count
-    active_listings = db.query(Listing).filter(
-        Listing.recruiter_email == user_obj.email,
-        Listing.archived == False
-    ).count()
-    
-    # Get total applications count for all recruiter's listings
-    total_applications = db.query(Application).join(Listing).filter(
-        Listing.recruiter_email == user_obj.email
-    ).count()
-    
-    # Get new applications count (applications from last 7 days)
-    from datetime import datetime, timedelta
+    cached = dashboard_cache.get(("recruiter", user_obj.email))
+    if cached is not None:
+        return cached
+
+    # One pass over the recruiter's listings and their applications
     week_ago = datetime.utcnow() - timedelta(days=7)
-    new_applications = db.query(Application).join(Listing).filter(
-        Listing.recruiter_email == user_obj.email,
-        Application.applied_at >= week_ago
-    ).count()
-    
-    # Status breakdown across all listings for this recruiter
-    accepted_applications = db.query(Application).join(Listing).filter(
-        Listing.recruiter_email == user_obj.email,
-        Application.status == "accepted"
-    ).count()
-
-    rejected_applications = db.query(Application).join(Listing).filter(
-        Listing.recruiter_email == user_obj.email,
-        Application.status == "rejected"
-    ).count()
-
-    pending_applications = db.query(Application).join(Listing).filter(
-        Listing.recruiter_email == user_obj.email,
-        Application.status == "pending"
-    ).count()
+    row = (await db.execute(
+        select(
+            func.count(func.distinct(case((Listing.archived == False, Listing.id)))),
+            func.count(Application.id),
+            _count_if(Application.applied_at >= week_ago),
+            _count_if(Application.status == "accepted"),
+            _count_if(Application.status == "rejected"),
+            _count_if(Application.status == "pending"),
+        )
+        .select_from(Listing)
+        .outerjoin(Application, Application.listing_id == Listing.id)
+        .where(Listing.recruiter_email == user_obj.email)
+    )).one()
+    active_listings, total_applications, new_applications, accepted_applications, rejected_applications, pending_applications = row
     
-    return {
+    result = {
         "active_postings": active_listings,
         "total_applications": total_applications,
         "new_applications": new_applications,
@@ -709,12 +1070,14 @@ def get_recruiter_dashboard(
         "pending_applications": pending_applications,
         "organization_name": user_obj.organization_name or "Your Company"
     }
+    dashboard_cache.set(("recruiter", user_obj.email), result)
+    return result
 
 
 @app.get("/api/dashboard/student")
-def get_student_dashboard(
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_student_dashboard(
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get student dashboard statistics"""
     user_obj, user_type = dep
@@ -722,16 +1085,11 @@ def get_student_dashboard(
     if user_type != "student":
         raise HTTPException(status_code=403, detail="Only students can access this endpoint")
     
-    # Get applications count for this student
-    applications_count = db.query(Application).filter(
-        Application.intern_email == user_obj.email
-    ).count()
-    
-    # Get active applications (not rejected)
-    active_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email,
-        Application.status != "rejected"
-    ).count()
+    # Total and active (not rejected) applications in one query
+    applications_count, active_applications = (await db.execute(
+        select(func.count(Application.id), _count_if(Application.status != "rejected"))
+        .where(Application.intern_email == user_obj.email)
+    )).one()
     
     # Get upcoming interviews (placeholder)
     upcoming_interviews = 0
@@ -748,45 +1106,43 @@ def get_student_dashboard(
 
 
 @app.get("/api/dashboard/stats")
-def get_dashboard_stats(
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_dashboard_stats(
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get general dashboard statistics"""
     user_obj, user_type = dep
     
+    cached = dashboard_cache.get(("stats", user_obj.email))
+    if cached is not None:
+        return cached
+
     if user_type == "recruiter":
         # Recruiter-specific stats
-        total_listings = db.query(Listing).filter(
-            Listing.recruiter_email == user_obj.email
-        ).count()
-        
-        archived_listings = db.query(Listing).filter(
-            Listing.recruiter_email == user_obj.email,
-            Listing.archived == True
-        ).count()
+        total_listings, archived_listings = (await db.execute(
+            select(func.count(Listing.id), _count_if(Listing.archived == True))
+            .where(Listing.recruiter_email == user_obj.email)
+        )).one()
         
-        return {
+        result = {
             "total_listings": total_listings,
             "archived_listings": archived_listings,
             "user_type": "recruiter"
         }
     else:
         # Student-specific stats
-        total_applications = db.query(Application).filter(
-            Application.intern_email == user_obj.email
-        ).count()
+        total_applications, accepted_applications = (await db.execute(
+            select(func.count(Application.id), _count_if(Application.status == "accepted"))
+            .where(Application.intern_email == user_obj.email)
+        )).one()
         
-        accepted_applications = db.query(Application).filter(
-            Application.intern_email == user_obj.email,
-            Application.status == "accepted"
-        ).count()
-        
-        return {
+        result = {
             "total_applications": total_applications,
             "accepted_applications": accepted_applications,
             "user_type": "student"
         }
+    dashboard_cache.set(("stats", user_obj.email), result)
+    return result
 
 
 # Student Profile and Application endpoints
@@ -819,6 +1175,7 @@ def get_student_profile(
         "resume_path": student.resume_path,
         "github_url": student.github_url,
         "profile_image_url": student.profile_image_url,
+        "profile_image_thumbnails": student.profile_image_thumbnails,
         "created_at": student.created_at.isoformat() if student.created_at else None,
         "resume_parsed": student.resume_parsed,
         "github_parsed": student.github_parsed,
@@ -845,17 +1202,30 @@ def update_student_profile(
     # Update allowed fields
     allowed_fields = ['first_name', 'last_name', 'phone_num', 'address', 'institution', 'degree', 'major', 'cgpa', 'github_url']
     
+    previous_github_url = student.github_url
     for field, value in profile_data.items():
         if field in allowed_fields and hasattr(student, field):
             setattr(student, field, value)
     
-    # Handle password update separately if provided
+    # Handle password update separately if provided; bcrypt runs on the hasher pool, not this thread
     if 'password' in profile_data and profile_data['password']:
-        student.password_hash = hash_password(profile_data['password'])
+        try:
+            student.password_hash = anyio.from_thread.run(
+                _hash_with_limit, profile_data['password'], f"email:{student.email}"
+            )
+        except TooManyAttempts:
+            raise HTTPException(status_code=429, detail="Too many concurrent attempts, please retry")
     
     try:
         db.commit()
         db.refresh(student)
+        # Degree, major and CGPA feed the matching payload
+        _enqueue_rescore(intern_email=student.email)
+        _enqueue_recommendations(intern_email=student.email)
+        if student.github_url != previous_github_url:
+            _enqueue_github_refresh(student.email)
+        _invalidate_dashboards(student.email)
+        _invalidate_principal("student", student.email)
         return {"message": "Profile updated successfully"}
     except Exception as e:
         db.rollback()
@@ -871,70 +1241,228 @@ def _build_public_url(request: Request, relative_path: Path) -> str:
     return f"{base}/{rel.lstrip('/')}"
 
 
+async def _save_upload_or_400(file: UploadFile, max_bytes: int, sniff, kind: str) -> StoredBlob:
+    try:
+        return await save_upload(file.file, blob_store, max_bytes, sniff, kind)
+    except UploadError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail)
+
+
+async def _point_user_at_blob(db: AsyncSession, user, column: str, blob: StoredBlob) -> tuple[Optional[str], bool]:
+    """Set ``user.<column>`` to the blob and move its reference; returns (previous path, changed)."""
+    previous_path = getattr(user, column)
+    changed = await swap_reference(db, blob_store, previous_path, blob)
+    setattr(user, column, str(blob.path))
+    return previous_path, changed
+
+
+async def _thumbnail_urls(request: Request, blob: StoredBlob) -> Optional[dict]:
+    paths = await thumbnails.make_thumbnails(blob_store, blob)
+    if not paths:
+        return None
+    return {
+        str(size): _build_public_url(request, Path("uploads") / path.relative_to(UPLOAD_ROOT))
+        for size, path in paths.items()
+    }
+
+
+def _remove_legacy_upload(previous_path: Optional[str], blob: StoredBlob) -> None:
+    # Blobs are shared and refcounted (gc removes them); files from before the blob store are per-user
+    if blob_store.digest_of(previous_path) is None:
+        remove_replaced(previous_path, blob.path, UPLOAD_ROOT)
+
+
 @app.post("/api/student/profile/image")
 async def upload_profile_image(
     request: Request,
     file: UploadFile = File(...),
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     user_obj, user_type = dep
     if user_type != "student":
         raise HTTPException(status_code=403, detail="Only students can upload profile image")
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="Invalid file type. Please upload an image")
-
-    suffix = {
-        "image/jpeg": ".jpg",
-        "image/png": ".png",
-        "image/webp": ".webp",
-    }.get(file.content_type, ".img")
-    filename = f"{user_obj.email.replace('@', '_at_').replace('.', '_')}_{uuid.uuid4().hex}{suffix}"
-    dest_path = PROFILE_IMG_DIR / filename
 
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    blob = await _save_upload_or_400(file, MAX_IMAGE_BYTES, sniff_image, "an image")
 
     # Save URLs and absolute path
-    public_relative = Path("uploads") / "profile_images" / filename
+    public_relative = Path("uploads") / blob.path.relative_to(UPLOAD_ROOT)
     public_url = _build_public_url(request, public_relative)
 
-    student = db.get(Intern, user_obj.email)
-    student.profile_image_path = str(dest_path)
+    # Listing cards and applicant rows use these instead of the original
+    thumbnail_urls = await _thumbnail_urls(request, blob)
+
+    student = await db.get(Intern, user_obj.email)
+    previous_path, _ = await _point_user_at_blob(db, student, "profile_image_path", blob)
     student.profile_image_url = public_url
-    db.commit()
+    student.profile_image_thumbnails = thumbnail_urls
+    await db.commit()
+    _remove_legacy_upload(previous_path, blob)
+    _invalidate_principal("student", student.email)
 
-    return {"profile_image_url": public_url}
+    return {"profile_image_url": public_url, "profile_image_thumbnails": thumbnail_urls}
 
 
 @app.post("/api/student/resume/pdf")
 async def upload_resume_pdf(
     request: Request,
     file: UploadFile = File(...),
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     user_obj, user_type = dep
     if user_type != "student":
         raise HTTPException(status_code=403, detail="Only students can upload resume")
-    if file.content_type != "application/pdf":
-        raise HTTPException(status_code=400, detail="Invalid file type. Please upload a PDF")
-
-    filename = f"{user_obj.email.replace('@', '_at_').replace('.', '_')}_{uuid.uuid4().hex}.pdf"
-    dest_path = RESUMES_DIR / filename
 
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    blob = await _save_upload_or_400(file, MAX_RESUME_BYTES, sniff_pdf, "a PDF")
 
-    public_relative = Path("uploads") / "resumes" / filename
+    public_relative = Path("uploads") / blob.path.relative_to(UPLOAD_ROOT)
     public_url = _build_public_url(request, public_relative)
 
-    student = db.get(Intern, user_obj.email)
-    student.resume_pdf_path = str(dest_path)
+    student = await db.get(Intern, user_obj.email)
+    previous_path, changed = await _point_user_at_blob(db, student, "resume_pdf_path", blob)
     student.resume_path = public_url
-    db.commit()
+    already_parsed = _parsed_from(student.resume_parsed, blob.sha256)
+    await db.commit()
+    _remove_legacy_upload(previous_path, blob)
+    _invalidate_dashboards(student.email)
+
+    parse_job_id = None if already_parsed else _enqueue_resume_parse(student.email)
+    # unchanged: the same PDF (by SHA-256) was already this student's resume
+    return {
+        "resume_url": public_url,
+        "sha256": blob.sha256,
+        "unchanged": not changed,
+        "parse_job_id": parse_job_id,
+    }
+
+
+def _parsed_from(resume_parsed: Optional[dict], sha256: Optional[str]) -> bool:
+    """True if ``resume_parsed`` was produced by this parser version from the blob ``sha256``."""
+    if not sha256 or not isinstance(resume_parsed, dict):
+        return False
+    meta = resume_parsed.get("meta") or {}
+    return meta.get("sha256") == sha256 and meta.get("parser_version") == PARSER_VERSION
 
-    return {"resume_url": public_url}
+
+def _parse_resume(intern_email: str) -> None:
+    """Parse the student's current resume PDF into resume_parsed, then re-embed and rescore.
+
+    Runs on the resume job queue. The path is read when the job starts, so a job coalesced
+    with a newer upload parses the newest file; a result is only saved if the resume was not
+    replaced again while parsing.
+    """
+    with SessionLocal() as db:
+        student = db.get(Intern, intern_email)
+        path = student.resume_pdf_path if student else None
+        sha256 = blob_store.digest_of(path)
+        if not path or _parsed_from(student.resume_parsed, sha256):
+            return
+    parsed = resume_parser.parse_file(path)
+    parsed["meta"].update({"sha256": sha256, "parser_version": PARSER_VERSION})
+
+    with SessionLocal() as db:
+        student = db.get(Intern, intern_email)
+        if student is None or student.resume_pdf_path != path:
+            return
+        student.resume_parsed = parsed
+        db.commit()
+        applicant = _build_applicant_payload_from_intern(student)
+    _applicant_updated(intern_email, applicant)
+
+
+def _applicant_updated(intern_email: str, applicant: dict) -> None:
+    """Follow-up work after a background job changed a student's matching payload."""
+    _invalidate_dashboards(intern_email)
+    # Warm the embedding cache for recommendations, then refresh stored application scores
+    embed_applicant(applicant)
+    _enqueue_rescore(intern_email=intern_email)
+    _enqueue_recommendations(intern_email=intern_email)
+
+
+def _enqueue_resume_parse(intern_email: str) -> str:
+    return resume_jobs.submit(f"resume:{intern_email}", _parse_resume, intern_email)
+
+
+def _job_status_or_404(queue: JobQueue, job_id: str, key: str) -> dict:
+    job = queue.status(job_id)
+    # Job ids are unguessable; still never reveal other students' jobs
+    if job is None or job["key"] != key:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {
+        "id": job["id"],
+        "state": job["state"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "finished_at": job["finished_at"],
+    }
+
+
+@app.get("/api/student/resume/jobs/{job_id}")
+async def get_resume_parse_job(job_id: str, dep=Depends(get_current_user_async)):
+    """State of a resume parsing job: queued / running / done / failed."""
+    user_obj, user_type = dep
+    if user_type != "student":
+        raise HTTPException(status_code=403, detail="Only students can access resume jobs")
+    return _job_status_or_404(resume_jobs, job_id, f"resume:{user_obj.email}")
+
+
+def _refresh_github(intern_email: str) -> None:
+    """Re-ingest the student's GitHub profile; rescore only if github_parsed changed."""
+    with SessionLocal() as db:
+        student = db.get(Intern, intern_email)
+        username = github_ingest.username_from_url(student.github_url) if student else None
+        if username is None:
+            return
+        parsed = github_ingest.ingest(db, username)
+        # ingest commits; re-read in case the profile changed while fetching
+        student = db.get(Intern, intern_email)
+        if student is None or github_ingest.username_from_url(student.github_url) != username:
+            return
+        if student.github_parsed == parsed:
+            return
+        student.github_parsed = parsed
+        db.commit()
+        applicant = _build_applicant_payload_from_intern(student)
+    _applicant_updated(intern_email, applicant)
+
+
+def _enqueue_github_refresh(intern_email: str) -> str:
+    return jobs.submit(f"github:{intern_email}", _refresh_github, intern_email)
+
+
+def _github_refresh_loop() -> None:
+    while not _github_refresh_stop.wait(GITHUB_REFRESH_INTERVAL):
+        try:
+            with SessionLocal() as db:
+                emails = db.scalars(select(Intern.email).where(Intern.github_url.isnot(None))).all()
+                # Responses untouched for a few rounds belong to deleted repos or old usernames
+                github_ingest.prune(db, timedelta(seconds=4 * GITHUB_REFRESH_INTERVAL))
+        except Exception:
+            continue
+        for email in emails:
+            _enqueue_github_refresh(email)
+
+
+@app.post("/api/student/github/refresh")
+def refresh_github(dep=Depends(get_current_user), db: Session = Depends(get_db)):
+    """Queue a refresh of github_parsed from the student's github_url; returns the job id."""
+    user_obj, user_type = dep
+    if user_type != "student":
+        raise HTTPException(status_code=403, detail="Only students can refresh GitHub data")
+    student = db.get(Intern, user_obj.email)
+    if student is None or github_ingest.username_from_url(student.github_url) is None:
+        raise HTTPException(status_code=400, detail="Set a GitHub profile URL first")
+    return {"job_id": _enqueue_github_refresh(user_obj.email)}
+
+
+@app.get("/api/student/github/jobs/{job_id}")
+async def get_github_refresh_job(job_id: str, dep=Depends(get_current_user_async)):
+    """State of a GitHub refresh job: queued / running / done / failed."""
+    user_obj, user_type = dep
+    if user_type != "student":
+        raise HTTPException(status_code=403, detail="Only students can access GitHub jobs")
+    return _job_status_or_404(jobs, job_id, f"github:{user_obj.email}")
 
 
 class ParsedDataRequest(BaseModel):
@@ -956,11 +1484,21 @@ def save_parsed_data(
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    if payload.resume_parsed is not None:
+    # A server-side parse of the current resume wins over the client's copy
+    server_parsed = _parsed_from(student.resume_parsed, blob_store.digest_of(student.resume_pdf_path))
+    if payload.resume_parsed is not None and not server_parsed:
         student.resume_parsed = payload.resume_parsed
-    if payload.github_parsed is not None:
+    # Likewise for GitHub data ingested by the server for the current github_url
+    server_github = (
+        isinstance(student.github_parsed, dict)
+        and student.github_parsed.get("username") is not None
+        and student.github_parsed.get("username") == github_ingest.username_from_url(student.github_url)
+    )
+    if payload.github_parsed is not None and not server_github:
         student.github_parsed = payload.github_parsed
     db.commit()
+    _enqueue_rescore(intern_email=student.email)
+    _enqueue_recommendations(intern_email=student.email)
     return {"message": "Parsed data saved"}
 
 
@@ -982,6 +1520,7 @@ def get_recruiter_profile(dep=Depends(get_current_user), db: Session = Depends(g
         "designation": recruiter.designation,
         "phone": recruiter.phone,
         "profile_image_url": recruiter.profile_image_url,
+        "profile_image_thumbnails": recruiter.profile_image_thumbnails,
         "website": recruiter.website,
         "active": recruiter.active,
         "created_at": recruiter.created_at.isoformat() if recruiter.created_at else None,
@@ -1006,6 +1545,7 @@ def update_recruiter_profile(
             setattr(recruiter, field, value)
     try:
         db.commit()
+        _invalidate_principal("recruiter", recruiter.email)
         return {"message": "Profile updated"}
     except Exception:
         db.rollback()
@@ -1016,48 +1556,56 @@ def update_recruiter_profile(
 async def upload_recruiter_profile_image(
     request: Request,
     file: UploadFile = File(...),
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     user_obj, user_type = dep
     if user_type != "recruiter":
         raise HTTPException(status_code=403, detail="Only recruiters can upload profile image")
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="Invalid file type. Please upload an image")
-    suffix = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}.get(file.content_type, ".img")
-    filename = f"{user_obj.email.replace('@', '_at_').replace('.', '_')}_{uuid.uuid4().hex}{suffix}"
-    dest_path = PROFILE_IMG_DIR / filename
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    public_relative = Path("uploads") / "profile_images" / filename
+    blob = await _save_upload_or_400(file, MAX_IMAGE_BYTES, sniff_image, "an image")
+    public_relative = Path("uploads") / blob.path.relative_to(UPLOAD_ROOT)
     public_url = _build_public_url(request, public_relative)
-    recruiter = db.get(Recruiter, user_obj.email)
-    recruiter.profile_image_path = str(dest_path)
+    thumbnail_urls = await _thumbnail_urls(request, blob)
+    recruiter = await db.get(Recruiter, user_obj.email)
+    previous_path, _ = await _point_user_at_blob(db, recruiter, "profile_image_path", blob)
     recruiter.profile_image_url = public_url
-    db.commit()
-    return {"profile_image_url": public_url}
+    recruiter.profile_image_thumbnails = thumbnail_urls
+    await db.commit()
+    _remove_legacy_upload(previous_path, blob)
+    _invalidate_principal("recruiter", recruiter.email)
+    return {"profile_image_url": public_url, "profile_image_thumbnails": thumbnail_urls}
 
 
 @app.get("/api/student/applications")
-def get_student_applications(
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_student_applications(
+    response: Response,
+    filters: list = Depends(listing_filters),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all applications for a student"""
+    """Get a page of the student's applications, most recent first (cursor in X-Next-Cursor)."""
     user_obj, user_type = dep
     
     if user_type != "student":
         raise HTTPException(status_code=403, detail="Only students can access applications")
     
     # Get applications with listing details
-    applications = db.query(Application, Listing).join(Listing).filter(
-        Application.intern_email == user_obj.email
-    ).all()
+    stmt = select(Application, Listing, Recruiter).join(
+        Listing, Application.listing_id == Listing.id
+    ).outerjoin(
+        Recruiter, Recruiter.email == Listing.recruiter_email
+    ).where(
+        Application.intern_email == user_obj.email,
+        *filters,
+    )
+    applications = (await db.execute(_page_or_400(stmt, STUDENT_APPLICATION_PAGE_KEYS, cursor, limit))).all()
+    applications, next_cursor = split_page(applications, limit, lambda row: (row[0].applied_at, row[0].id))
+    _set_next_cursor(response, next_cursor)
     
     result = []
-    for app, listing in applications:
-        # Get recruiter info
-        recruiter = db.get(Recruiter, listing.recruiter_email)
+    for app, listing, recruiter in applications:
         company_name = recruiter.organization_name if recruiter else "Unknown Company"
         
         result.append({
@@ -1101,18 +1649,18 @@ def apply_for_internship(
     
     if listing.archived:
         raise HTTPException(status_code=400, detail="This internship is no longer accepting applications")
-    
-    # Check if already applied
-    existing_application = db.query(Application).filter(
-        Application.listing_id == listing_id,
-        Application.intern_email == user_obj.email
-    ).first()
-    
-    if existing_application:
+
+    # Cheap indexed check so a repeated apply is rejected before scoring; the unique index
+    # still catches concurrent duplicates at insert time
+    already_applied = db.scalar(
+        select(Application.id).where(Application.listing_id == listing_id, Application.intern_email == user_obj.email)
+    )
+    if already_applied is not None:
         raise HTTPException(status_code=400, detail="You have already applied for this internship")
     
     # Create new application with initial similarity score using ML model
     initial_score = 0.0
+    result = None
     try:
         # Build applicant payload from stored parsed resume/github + profile
         intern = db.get(Intern, user_obj.email)
@@ -1134,17 +1682,35 @@ def apply_for_internship(
         db.add(application)
         db.commit()
         db.refresh(application)
-        return {"message": "Application submitted successfully", "application_id": application.id}
+    except IntegrityError:
+        # uq_applications_listing_intern makes the duplicate check part of the insert
+        db.rollback()
+        raise HTTPException(status_code=400, detail="You have already applied for this internship")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to submit application")
+    _invalidate_dashboards(user_obj.email, listing.recruiter_email)
+
+    if result is not None:
+        try:
+            _upsert_match_score(
+                db, listing_id, user_obj.email, result,
+                score_fingerprint(jd_payload, applicant_payload), applicant_digest(applicant_payload),
+            )
+            db.commit()
+        except IntegrityError:
+            # A background rescore stored this pair first
+            db.rollback()
+    else:
+        _enqueue_rescore(listing_id=listing_id, intern_email=user_obj.email)
+    return {"message": "Application submitted successfully", "application_id": application.id}
 
 
 @app.get("/api/student/applications/{application_id}")
-def get_application_details(
+async def get_application_details(
     application_id: int,
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed information about a specific application"""
     user_obj, user_type = dep
@@ -1153,21 +1719,23 @@ def get_application_details(
         raise HTTPException(status_code=403, detail="Only students can access application details")
     
     # Get application with listing details
-    application = db.query(Application).filter(
-        Application.id == application_id,
-        Application.intern_email == user_obj.email
-    ).first()
+    application = (await db.execute(
+        select(Application).where(
+            Application.id == application_id,
+            Application.intern_email == user_obj.email
+        )
+    )).scalars().first()
     
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Get listing details
-    listing = db.get(Listing, application.listing_id)
+    listing = await db.get(Listing, application.listing_id)
     if not listing:
         raise HTTPException(status_code=404, detail="Internship listing not found")
     
     # Get recruiter info
-    recruiter = db.get(Recruiter, listing.recruiter_email)
+    recruiter = await db.get(Recruiter, listing.recruiter_email)
     
     return {
         "application": {
@@ -1270,71 +1838,411 @@ def _build_listing_payload(listing: Listing) -> dict:
     }
 
 
-@app.get("/api/student/recommendations")
-def get_student_recommendations(dep=Depends(get_current_user), db: Session = Depends(get_db)):
-    user_obj, user_type = dep
-    if user_type != "student":
-        raise HTTPException(status_code=403, detail="Only students can access recommendations")
+# Stored when scoring a pair raises, with the pair's current fingerprint: the listing stays
+# visible with score 0 and is only retried once its inputs (or the scoring version) change
+_FAILED_SCORE = {"final_score": 0.0, "components": {}, "explanations": {"notes": ["scoring_failed"]}}
 
-    intern = db.get(Intern, user_obj.email)
-    if not intern:
-        raise HTTPException(status_code=404, detail="Student not found")
 
-    applicant_payload = _build_applicant_payload_from_intern(intern)
+def _upsert_match_score(
+    db: Session,
+    listing_id: int,
+    intern_email: str,
+    result: dict,
+    fingerprint: str,
+    digest: Optional[str] = None,
+    scored_at: Optional[datetime] = None,
+    row: Optional[MatchScore] = None,
+) -> None:
+    """Stage the persisted breakdown for one pair; the caller commits.
+
+    ``scored_at`` should be taken before the listing was read, so an edit committed while
+    scoring still counts as newer. Pass ``row`` when the caller already loaded it.
+    """
+    if row is None:
+        row = db.query(MatchScore).filter(
+            MatchScore.listing_id == listing_id,
+            MatchScore.intern_email == intern_email,
+        ).first()
+    if row is None:
+        row = MatchScore(listing_id=listing_id, intern_email=intern_email)
+        db.add(row)
+    row.final_score = float(result.get("final_score", 0.0))
+    row.components = result.get("components")
+    row.explanations = result.get("explanations")
+    row.fingerprint = fingerprint
+    row.applicant_digest = digest
+    row.scored_at = scored_at or datetime.utcnow()
+
+
+def _rescore_applications(listing_id: Optional[int] = None, intern_email: Optional[str] = None) -> None:
+    """Recompute persisted scores for existing applications whose scoring inputs changed.
+
+    Runs on the background job queue. Pairs whose fingerprint still matches the stored
+    MatchScore are skipped; the rest are batch-scored per listing with score_many.
+    """
+    # Background work can wait for the model instead of storing fallback scores
+    warm_up_model(block=True)
+    as_of = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        query = (
+            db.query(Application, Listing, Intern, MatchScore)
+            .join(Listing, Application.listing_id == Listing.id)
+            .join(Intern, Application.intern_email == Intern.email)
+            .outerjoin(MatchScore, and_(
+                MatchScore.listing_id == Application.listing_id,
+                MatchScore.intern_email == Application.intern_email,
+            ))
+        )
+        if listing_id is not None:
+            query = query.filter(Application.listing_id == listing_id)
+        if intern_email is not None:
+            query = query.filter(Application.intern_email == intern_email)
+
+        jd_payloads: dict[int, dict] = {}
+        applicant_payloads: dict[str, dict] = {}
+        digests: dict[str, str] = {}
+        stale: dict[int, list] = {}
+        for app, listing, intern, match in query.all():
+            if listing.id not in jd_payloads:
+                jd_payloads[listing.id] = _build_listing_payload(listing)
+            if intern.email not in applicant_payloads:
+                applicant_payloads[intern.email] = _build_applicant_payload_from_intern(intern)
+                digests[intern.email] = applicant_digest(applicant_payloads[intern.email])
+            fingerprint = score_fingerprint(jd_payloads[listing.id], applicant_payloads[intern.email])
+            if match is None or match.fingerprint != fingerprint or app.similarity_score is None:
+                stale.setdefault(listing.id, []).append((app, intern.email, fingerprint))
+
+        for lid, items in stale.items():
+            results = _score_many_or_fallback({
+                "internship": jd_payloads[lid],
+                "applicants": [applicant_payloads[email] for _, email, _ in items],
+            })
+            # A concurrent job may insert the same pair first; retry once as an update
+            for _ in range(2):
+                try:
+                    for (app, email, fingerprint), result in zip(items, results):
+                        result = result if result is not None else _FAILED_SCORE
+                        app.similarity_score = float(result.get("final_score", 0.0))
+                        _upsert_match_score(db, lid, email, result, fingerprint, digests[email], as_of)
+                    db.commit()
+                    break
+                except IntegrityError:
+                    db.rollback()
+    finally:
+        db.close()
 
-    listings = db.query(Listing).filter(Listing.archived == False).all()
-    scored: list[dict] = []
-    for listing in listings:
+
+def _enqueue_rescore(listing_id: Optional[int] = None, intern_email: Optional[str] = None) -> str:
+    key = f"rescore:{listing_id if listing_id is not None else '*'}:{intern_email or '*'}"
+    return jobs.submit(key, _rescore_applications, listing_id, intern_email)
+
+
+# ---------- Materialized recommendations ----------
+# Each student's ranking is stored as MatchScore rows (one per non-archived listing) and
+# only the delta is rescored: listings created or edited since the row was written
+# (Listing.updated_at), or every listing when the student's own payload changed
+# (applicant_digest).
+
+# Above this many stale listings a first page is ranked on the fly and the rest is stored
+# in the background
+RECOMMENDATIONS_INLINE_LIMIT = int(os.getenv("INTERNMIX_RECOMMENDATIONS_INLINE_LIMIT", "200"))
+RECOMMENDATION_PAGE_KEYS = (
+    SortKey(MatchScore.final_score, descending=True, parse=float),
+    SortKey(Listing.id, parse=int),
+)
+
+
+def _stale_listings_stmt(intern_email: str, digest: str, *filters):
+    """Non-archived listings whose stored score for the student is missing or out of date.
+
+    Scores carry a "deadline passed" penalty, so a row scored on or before a deadline that
+    has since passed is stale too, although the listing itself did not change.
+    """
+    # scored_at as text starts with its YYYY-MM-DD date, comparable with the deadline string
+    scored_on = func.substr(cast(MatchScore.scored_at, String), 1, 10)
+    return (
+        select(Listing)
+        .outerjoin(MatchScore, and_(MatchScore.listing_id == Listing.id, MatchScore.intern_email == intern_email))
+        .where(
+            Listing.archived == False,
+            *filters,
+            or_(
+                MatchScore.id.is_(None),
+                MatchScore.applicant_digest.is_(None),
+                MatchScore.applicant_digest != digest,
+                MatchScore.scored_at < Listing.updated_at,
+                and_(Listing.deadline < date.today().isoformat(), scored_on <= Listing.deadline),
+            ),
+        )
+        .order_by(Listing.id)
+    )
+
+
+def _store_scores(db: Session, pairs: list[tuple[Listing, Intern, dict, str]], as_of: datetime) -> None:
+    """Score (listing, intern, applicant payload, digest) pairs and store them as MatchScores; commits."""
+    by_listing: dict[int, list] = {}
+    by_intern: dict[str, list] = {}
+    for pair in pairs:
+        by_listing.setdefault(pair[0].id, []).append(pair)
+        by_intern.setdefault(pair[1].email, []).append(pair)
+    # Batch along the longer side: one student against many listings, or one listing against many students
+    groups = by_intern if len(by_intern) <= len(by_listing) else by_listing
+    for group in groups.values():
+        jd_payloads = [_build_listing_payload(listing) for listing, _, _, _ in group]
+        # Fingerprints first: if the taxonomy is swapped while scoring, these rows stay stale
+        keys = [(listing.id, intern.email) for listing, intern, _, _ in group]
+        fingerprints = [score_fingerprint(jd, pair[2]) for jd, pair in zip(jd_payloads, group)]
+        if groups is by_intern:
+            results = _score_many_or_fallback({"applicant": group[0][2], "internships": jd_payloads})
+        else:
+            results = _score_many_or_fallback({"internship": jd_payloads[0], "applicants": [p[2] for p in group]})
+        # A concurrent request or job may insert the same pair first; retry once as an update
+        for _ in range(2):
+            try:
+                existing = {
+                    (row.listing_id, row.intern_email): row
+                    for row in db.scalars(select(MatchScore).where(
+                        MatchScore.listing_id.in_({lid for lid, _ in keys}),
+                        MatchScore.intern_email.in_({email for _, email in keys}),
+                    ))
+                }
+                for (lid, email), (_, _, _, digest), fingerprint, result in zip(keys, group, fingerprints, results):
+                    # A failed pair is stored too, so it stays listed and is not rescored on every read
+                    _upsert_match_score(
+                        db, lid, email, result if result is not None else _FAILED_SCORE, fingerprint, digest, as_of,
+                        row=existing.get((lid, email)),
+                    )
+                db.commit()
+                break
+            except IntegrityError:
+                db.rollback()
+
+
+def _refresh_recommendations(listing_id: Optional[int] = None, intern_email: Optional[str] = None) -> None:
+    """Background delta update of stored rankings.
+
+    A student change rescans that student's stale listings. A new or edited listing is scored
+    against every student who already has a stored ranking; other students get it on
+    their first visit.
+    """
+    warm_up_model(block=True)
+    as_of = datetime.utcnow()
+    with SessionLocal() as db:
+        if intern_email is not None:
+            intern = db.get(Intern, intern_email)
+            if intern is None:
+                return
+            applicant = _build_applicant_payload_from_intern(intern)
+            digest = applicant_digest(applicant)
+            stale = db.scalars(_stale_listings_stmt(intern.email, digest)).all()
+            _store_scores(db, [(listing, intern, applicant, digest) for listing in stale], as_of)
+        if listing_id is not None:
+            listing = db.get(Listing, listing_id)
+            if listing is None or listing.archived:
+                return
+            interns = db.scalars(
+                select(Intern).where(Intern.email.in_(select(MatchScore.intern_email).distinct()))
+            ).all()
+            pairs = []
+            for intern in interns:
+                applicant = _build_applicant_payload_from_intern(intern)
+                pairs.append((listing, intern, applicant, applicant_digest(applicant)))
+            _store_scores(db, pairs, as_of)
+
+
+def _enqueue_recommendations(listing_id: Optional[int] = None, intern_email: Optional[str] = None) -> str:
+    key = f"recommendations:{listing_id if listing_id is not None else '*'}:{intern_email or '*'}"
+    return jobs.submit(key, _refresh_recommendations, listing_id, intern_email)
+
+
+def _index_listings(listings: list[Listing]) -> Optional[np.ndarray]:
+    """Embed listings and store them in the listing index; returns their vectors (or None)."""
+    if not listings:
+        return None
+    try:
+        payloads = [_build_listing_payload(listing) for listing in listings]
+        vectors = embed_internships(payloads)
+        if vectors is not None:
+            listing_index.upsert(
+                (listing.id, internship_digest(payload), vec)
+                for listing, payload, vec in zip(listings, payloads, vectors)
+            )
+        return vectors
+    except Exception:
+        # Indexing is an optimization; recommendations re-embed anything missing
+        return None
+
+
+def _listing_vectors(listings: list[Listing], jd_payloads: list[dict]) -> Optional[np.ndarray]:
+    """Vectors for ``listings`` from the index, (re)embedding rows that are missing or stale."""
+    vectors, stale = listing_index.lookup(
+        [listing.id for listing in listings],
+        [internship_digest(payload) for payload in jd_payloads],
+    )
+    if stale:
+        fresh = _index_listings([listings[i] for i in stale])
+        if fresh is None:
+            return None
+        if vectors is None:
+            vectors = np.zeros((len(listings),) + fresh.shape[1:], dtype=np.float32)
+        vectors[stale] = fresh
+    return vectors
+
+
+def _score_many_or_fallback(payload: dict) -> list[dict | None]:
+    """Batch-score via score_many; if the batch fails, score pairs one by one.
+
+    Returns one result per item, or None where scoring failed, so a single bad
+    row does not sink the whole response.
+    """
+    try:
+        return score_many(payload)
+    except Exception:
+        pass
+    if "applicants" in payload:
+        pairs = [{"internship": payload["internship"], "applicant": a} for a in payload["applicants"]]
+    else:
+        pairs = [{"internship": jd, "applicant": payload["applicant"]} for jd in payload["internships"]]
+    results: list[dict | None] = []
+    for pair in pairs:
         try:
-            jd_payload = _build_listing_payload(listing)
-            result = score_match({"internship": jd_payload, "applicant": applicant_payload})
-            score = float(result.get("final_score", 0.0))
+            results.append(score_match(pair))
         except Exception:
-            score = 0.0
-            result = {"components": {}, "explanations": {"notes": ["scoring_failed"]}}
+            results.append(None)
+    return results
+
 
-        # Count applications
-        applications_count = db.query(Application).filter(Application.listing_id == listing.id).count()
+def _rank_on_the_fly(
+    db: Session,
+    applicant_payload: dict,
+    filters: list,
+    limit: int,
+    after: Optional[list],
+) -> tuple[list[dict], Optional[str]]:
+    """Score matching listings in the request and return one page (no stored ranking needed).
 
-        recruiter = db.get(Recruiter, listing.recruiter_email)
-        recruiter_name = _recruiter_display_name(recruiter)
+    Only listings that can reach the page are fully scored (score_top_k).
+    """
+    rows = db.execute(_listing_rows_stmt(Listing.archived == False, *filters)).all()
+    listings = [listing for listing, _, _ in rows]
+    jd_payloads = [_build_listing_payload(listing) for listing in listings]
+
+    ranked = None
+    # Shortlist via the precomputed matrix and only fully score listings that can reach the
+    # page (plus one row, to know whether another page exists)
+    try:
+        vectors = _listing_vectors(listings, jd_payloads)
+        if vectors is not None:
+            keep = None
+            if after is not None:
+                # Later pages: rank only rows after the cursor, so the scan covers the rows up
+                # to the cursor plus one page rather than the whole catalogue
+                last_score, last_id = after
+                keep = lambda i, score: (-score, listings[i].id) > (-last_score, last_id)
+            ranked = score_top_k(applicant_payload, jd_payloads, vectors, limit + 1, keep=keep)
+    except Exception:
+        ranked = None
+    if ranked is not None:
+        rows = [rows[i] for i, _ in ranked]
+        results = [result for _, result in ranked]
+    else:
+        results = _score_many_or_fallback({"applicant": applicant_payload, "internships": jd_payloads})
+    scored: list[dict] = []
+    for (listing, recruiter, applications_count), result in zip(rows, results):
+        result = result if result is not None else _FAILED_SCORE
+        score = float(result.get("final_score", 0.0))
 
         scored.append({
-            "listing": {
-                "id": listing.id,
-                "title": listing.title,
-                "description": listing.description,
-                "degree": listing.degree,
-                "major": listing.major,
-                "recommended_cgpa": listing.recommended_cgpa,
-                "duration_months": listing.duration_months,
-                "location": listing.location,
-                "is_remote": listing.is_remote,
-                "required_skills": listing.required_skills,
-                "optional_skills": listing.optional_skills,
-                "deadline": listing.deadline,
-                "archived": listing.archived,
-                "created_by": listing.recruiter_email,
-                "created_by_name": recruiter_name,
-                "created_at": listing.created_at.isoformat(),
-                "applications_count": applications_count,
-                "created_by_profile_image_url": (recruiter.profile_image_url if recruiter else None),
-            },
+            "listing": _listing_to_dict(listing, recruiter, applications_count),
             "final_score": score,
             "components": result.get("components"),
             "explanations": result.get("explanations"),
         })
 
-    scored.sort(key=lambda x: x.get("final_score", 0.0), reverse=True)
-    return scored
+    # Best score first, ties by listing id (the order score_top_k keeps)
+    scored.sort(key=lambda x: (-x["final_score"], x["listing"]["id"]))
+    if after is not None:
+        last_score, last_id = after
+        scored = [x for x in scored if (-x["final_score"], x["listing"]["id"]) > (-last_score, last_id)]
+    return split_page(scored, limit, lambda x: (x["final_score"], x["listing"]["id"]))
+
+
+@app.get("/api/student/recommendations")
+def get_student_recommendations(
+    response: Response,
+    filters: list = Depends(listing_filters),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    dep=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Rank non-archived listings for the student; returns one page, best first.
+
+    The ranking is read from the student's stored MatchScores after rescoring only the
+    listings that changed since (see _stale_listings_stmt). When too many are stale, e.g. on
+    a first visit or after a profile edit, the page is ranked on the fly while the stored
+    ranking is rebuilt in the background. The cursor (X-Next-Cursor) is the last (score, id).
+    """
+    user_obj, user_type = dep
+    if user_type != "student":
+        raise HTTPException(status_code=403, detail="Only students can access recommendations")
+
+    intern = db.get(Intern, user_obj.email)
+    if not intern:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    applicant_payload = _build_applicant_payload_from_intern(intern)
+    digest = applicant_digest(applicant_payload)
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, [key.parse for key in RECOMMENDATION_PAGE_KEYS])
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    as_of = datetime.utcnow()
+    stale = db.scalars(
+        _stale_listings_stmt(intern.email, digest, *filters).limit(RECOMMENDATIONS_INLINE_LIMIT + 1)
+    ).all()
+    if len(stale) > RECOMMENDATIONS_INLINE_LIMIT:
+        _enqueue_recommendations(intern_email=intern.email)
+        scored, next_cursor = _rank_on_the_fly(db, applicant_payload, filters, limit, after)
+        _set_next_cursor(response, next_cursor)
+        return scored
+    if stale:
+        _store_scores(db, [(listing, intern, applicant_payload, digest) for listing in stale], as_of)
+
+    stmt = (
+        _listing_rows_stmt(Listing.archived == False, *filters)
+        .join(MatchScore, and_(MatchScore.listing_id == Listing.id, MatchScore.intern_email == intern.email))
+        .add_columns(MatchScore)
+    )
+    rows = db.execute(page_stmt(stmt, RECOMMENDATION_PAGE_KEYS, cursor, limit)).all()
+    rows, next_cursor = split_page(rows, limit, lambda row: (row[3].final_score, row[0].id))
+    _set_next_cursor(response, next_cursor)
+    return [
+        {
+            "listing": _listing_to_dict(listing, recruiter, applications_count),
+            "final_score": match.final_score,
+            "components": match.components,
+            "explanations": match.explanations,
+        }
+        for listing, recruiter, applications_count, match in rows
+    ]
 
 
 @app.get("/api/listings/{listing_id}/applications/scored")
 def get_scored_applications_for_listing(
     listing_id: int,
+    response: Response,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     dep=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    """A page of the listing's applicants, best score first (cursor in X-Next-Cursor)."""
     user_obj, user_type = dep
     if user_type != "recruiter":
         raise HTTPException(status_code=403, detail="Only recruiters can access applicants list")
@@ -1345,27 +2253,24 @@ def get_scored_applications_for_listing(
     if listing.recruiter_email != user_obj.email:
         raise HTTPException(status_code=403, detail="Unauthorized to view applications for this listing")
 
-    jd_payload = _build_listing_payload(listing)
-    # Get all applications joined with interns
-    entries = db.query(Application, Intern).join(Intern, Application.intern_email == Intern.email).filter(
-        Application.listing_id == listing_id
-    ).all()
+    # Scores are kept current by background rescoring; this is a plain read
+    stmt = (
+        select(Application, Intern, MatchScore)
+        .join(Intern, Application.intern_email == Intern.email)
+        .outerjoin(MatchScore, and_(
+            MatchScore.listing_id == Application.listing_id,
+            MatchScore.intern_email == Application.intern_email,
+        ))
+        .where(Application.listing_id == listing_id)
+    )
+    entries = db.execute(_page_or_400(stmt, SCORED_APPLICATION_PAGE_KEYS, cursor, limit)).all()
+    entries, next_cursor = split_page(entries, limit, lambda row: (row[0].similarity_score, row[0].id))
+    _set_next_cursor(response, next_cursor)
+    if any(match is None for _, _, match in entries):
+        _enqueue_rescore(listing_id=listing_id)
 
     result_list: list[dict] = []
-    for app, intern in entries:
-        try:
-            applicant_payload = _build_applicant_payload_from_intern(intern)
-            result = score_match({"internship": jd_payload, "applicant": applicant_payload})
-            score = float(result.get("final_score", 0.0))
-        except Exception:
-            score = 0.0
-            result = {"components": {}, "explanations": {"notes": ["scoring_failed"]}}
-
-        # Persist score if changed
-        if app.similarity_score != score:
-            app.similarity_score = score
-            db.add(app)
-
+    for app, intern, match in entries:
         result_list.append({
             "application_id": app.id,
             "intern": {
@@ -1376,19 +2281,17 @@ def get_scored_applications_for_listing(
                 "major": intern.major,
                 "cgpa": intern.cgpa,
                 "profile_image_url": intern.profile_image_url,
+                "profile_image_thumbnails": intern.profile_image_thumbnails,
                 "resume_url": getattr(intern, "resume_path", None),
             },
             "status": app.status,
-            "similarity_score": score,
-            "components": result.get("components"),
-            "explanations": result.get("explanations"),
+            "similarity_score": app.similarity_score if app.similarity_score is not None else 0.0,
+            "components": match.components if match else None,
+            "explanations": match.explanations if match else None,
+            "scored_at": match.scored_at.isoformat() if match and match.scored_at else None,
             "applied_at": app.applied_at.isoformat() if app.applied_at else None,
         })
 
-    # Commit any score updates in bulk
-    db.commit()
-
-    result_list.sort(key=lambda x: x.get("similarity_score", 0.0), reverse=True)
     return {
         "listing": {
             "id": listing.id,
@@ -1432,14 +2335,15 @@ def update_application_status(
     db.add(app_obj)
     db.commit()
     db.refresh(app_obj)
+    _invalidate_dashboards(user_obj.email, app_obj.intern_email)
 
     return {"message": "Status updated", "status": app_obj.status}
 
 
 @app.get("/api/student/dashboard/enhanced")
-def get_enhanced_student_dashboard(
-    dep=Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_enhanced_student_dashboard(
+    dep=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get enhanced student dashboard with detailed statistics"""
     user_obj, user_type = dep
@@ -1447,42 +2351,27 @@ def get_enhanced_student_dashboard(
     if user_type != "student":
         raise HTTPException(status_code=403, detail="Only students can access this endpoint")
     
-    # Get basic application counts
-    total_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email
-    ).count()
-    
-    active_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email,
-        Application.status != "rejected"
-    ).count()
-    
-    accepted_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email,
-        Application.status == "accepted"
-    ).count()
-    
-    pending_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email,
-        Application.status == "pending"
-    ).count()
-    
-    # Get recent applications (last 30 days)
+    cached = dashboard_cache.get(("student_enhanced", user_obj.email))
+    if cached is not None:
+        return cached
+
+    # Per-status totals and recent (last 30 days) counts in one GROUP BY
     month_ago = datetime.utcnow() - timedelta(days=30)
-    recent_applications = db.query(Application).filter(
-        Application.intern_email == user_obj.email,
-        Application.applied_at >= month_ago
-    ).count()
-    
-    # Get application status breakdown
-    status_breakdown = db.query(Application.status, func.count(Application.id)).filter(
-        Application.intern_email == user_obj.email
-    ).group_by(Application.status).all()
-    
-    status_stats = {status: count for status, count in status_breakdown}
+    status_breakdown = (await db.execute(
+        select(Application.status, func.count(Application.id), _count_if(Application.applied_at >= month_ago))
+        .where(Application.intern_email == user_obj.email)
+        .group_by(Application.status)
+    )).all()
+    
+    status_stats = {status: count for status, count, _ in status_breakdown}
+    total_applications = sum(status_stats.values())
+    active_applications = total_applications - status_stats.get("rejected", 0)
+    accepted_applications = status_stats.get("accepted", 0)
+    pending_applications = status_stats.get("pending", 0)
+    recent_applications = sum(recent for _, _, recent in status_breakdown)
     
     # Get student profile info
-    student = db.get(Intern, user_obj.email)
+    student = await db.get(Intern, user_obj.email)
     profile_completion = 0
     if student:
         # Calculate profile completion percentage
@@ -1490,7 +2379,7 @@ def get_enhanced_student_dashboard(
         completed_fields = sum(1 for field in fields if getattr(student, field))
         profile_completion = int((completed_fields / len(fields)) * 100)
     
-    return {
+    result = {
         "total_applications": total_applications,
         "active_applications": active_applications,
         "accepted_applications": accepted_applications,
@@ -1506,6 +2395,8 @@ def get_enhanced_student_dashboard(
             "update_resume": not student.resume_path if student else True
         }
     }
+    dashboard_cache.set(("student_enhanced", user_obj.email), result)
+    return result
 
 
 if __name__ == "__main__":
@@ -1,59 +1,240 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import uuid
 from datetime import date
-from typing import Any, Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
-from sentence_transformers import SentenceTransformer 
-from backend.skill_aliases import normalize_skill as _normalize_skill
-
-
-_MODEL = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+from backend.embedding_cache import EmbeddingCache
+from backend.encoders import load_encoder
+from backend.skill_aliases import (
+    current_taxonomy,
+    extract_skills,
+    normalize_skill as _normalize_skill,
+    split_skill,
+    taxonomy_version,
+)
+
+
+_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+# Bump when weights, penalties or text canonicalization change so persisted scores are recomputed
+SCORING_VERSION = "3"
+# torch (sentence-transformers), onnx or onnx-int8; see backend/encoders.py
+_ENCODER_BACKEND = os.getenv("INTERNMIX_ENCODER_BACKEND", "torch").lower()
+_ONNX_DIR = os.getenv("INTERNMIX_ONNX_MODEL_DIR", str(Path(__file__).resolve().parent / "onnx_models" / "all-MiniLM-L6-v2"))
+_ENCODER_THREADS = int(os.getenv("INTERNMIX_ENCODER_THREADS", "0")) or None
+# Vectors from different backends are not interchangeable, so each gets its own cache namespace
+_EMBEDDING_NAMESPACE = _MODEL_NAME if _ENCODER_BACKEND == "torch" else f"{_MODEL_NAME}@{_ENCODER_BACKEND}"
+# None = not loaded yet, False = failed to load, otherwise the encoder
+_MODEL: Any = None
+_MODEL_LOCK = threading.Lock()
+_MODEL_THREAD: Optional[threading.Thread] = None
+
+# Embeddings keyed by content hash; set INTERNMIX_EMBEDDING_CACHE_PATH="" to keep them in memory only
+_EMBEDDINGS = EmbeddingCache(
+    os.getenv("INTERNMIX_EMBEDDING_CACHE_PATH", str(Path(__file__).resolve().parent / "embeddings.sqlite3")),
+    max_items=int(os.getenv("INTERNMIX_EMBEDDING_CACHE_SIZE", "4096")),
+)
+_ENCODE_BATCH_SIZE = int(os.getenv("INTERNMIX_ENCODE_BATCH_SIZE", "32"))
+
+# Cosine similarities between canonical skills, one .npy per taxonomy and encoder (see _skill_similarity)
+_SKILL_SIMILARITY_DIR = Path(os.getenv("INTERNMIX_SKILL_SIMILARITY_DIR", str(Path(__file__).resolve().parent / "skill_similarity")))
+# A related canonical skill at or above this cosine earns that much partial credit toward coverage
+_SKILL_SIMILARITY_MIN = float(os.getenv("INTERNMIX_SKILL_SIMILARITY_MIN", "0.7"))
+# (taxonomy version, canonical skill -> row, matrix)
+_SKILL_SIMILARITY: Optional[Tuple[str, Dict[str, int], np.ndarray]] = None
+_SKILL_SIMILARITY_LOCK = threading.Lock()
+
+
+def _load_model() -> None:
+    global _MODEL
+    try:
+        # Backends import torch / onnxruntime lazily, so only the warm-up thread pays for it
+        model = load_encoder(_ENCODER_BACKEND, _MODEL_NAME, _ONNX_DIR, threads=_ENCODER_THREADS)
+    except Exception:
+        model = False
+    _MODEL = model
+    if model:
+        try:
+            _skill_similarity()
+        except Exception:
+            pass
+
+
+def warm_up_model(block: bool = False) -> None:
+    """Start loading the embedding model in a background thread (no-op once started).
+
+    With ``block=True`` wait for loading to finish, e.g. in scripts.
+    """
+    global _MODEL_THREAD
+    with _MODEL_LOCK:
+        if _MODEL is None and _MODEL_THREAD is None:
+            _MODEL_THREAD = threading.Thread(target=_load_model, name="internmix-model-warmup", daemon=True)
+            _MODEL_THREAD.start()
+        thread = _MODEL_THREAD
+    if block and thread is not None:
+        thread.join()
+
+
+def model_status() -> str:
+    """One of 'idle', 'loading', 'ready' or 'unavailable'."""
+    if _MODEL is False:
+        return "unavailable"
+    if _MODEL is not None:
+        return "ready"
+    return "loading" if _MODEL_THREAD is not None else "idle"
 
 
 def _get_model():
-    global _MODEL
-
+    # Never block a request on model loading; callers fall back until it is ready
+    if _MODEL is None:
+        warm_up_model()
     return _MODEL
 
 def _flatten_applicant_skills(applicant: Dict[str, Any]) -> List[str]:
     names: List[str] = []
     for item in applicant.get("skills", []) or []:
-        raw = (item.get("name") or "").replace("(", "").replace(")", "")
-        tokens = raw.replace("/", ",").replace("+", ",").split(",")
-        for tok in tokens:
-            tok = tok.strip()
-            if tok:
-                names.append(tok)
+        names.extend(split_skill(item.get("name")))
+    # skills named in experience descriptions ("built the API in FastAPI")
+    for work in applicant.get("experience", []) or []:
+        names.extend(extract_skills(_get_text_content((work or {}).get("description"))))
     # also consider GitHub languages as skills signals
     gh = applicant.get("github") or {}
     for lang in gh.get("languages", []) or []:
         if isinstance(lang, str) and lang.strip():
-            names.append(lang.strip())
-    return sorted({ _normalize_skill(x) for x in names })
+            names.append(_normalize_skill(lang))
+    return sorted(set(names))
+
+
+def _skill_similarity() -> Optional[Tuple[Dict[str, int], np.ndarray]]:
+    """(canonical skill -> row, cosine matrix) for the current taxonomy; None until the model is ready.
+
+    Each canonical skill is embedded together with its aliases. The matrix is built once per
+    taxonomy and encoder and saved under _SKILL_SIMILARITY_DIR, so other processes just
+    memory-map it.
+    """
+    global _SKILL_SIMILARITY
+    taxonomy = current_taxonomy()
+    cached = _SKILL_SIMILARITY
+    if cached is not None and cached[0] == taxonomy.version:
+        return cached[1], cached[2]
+    with _SKILL_SIMILARITY_LOCK:
+        cached = _SKILL_SIMILARITY
+        if cached is not None and cached[0] == taxonomy.version:
+            return cached[1], cached[2]
+        skills = list(taxonomy.canonical_to_aliases)
+        texts = [f"{skill}: {', '.join(taxonomy.canonical_to_aliases[skill])}" for skill in skills]
+        name = hashlib.sha256(json.dumps([_EMBEDDING_NAMESPACE, texts]).encode("utf-8")).hexdigest()[:16]
+        path = _SKILL_SIMILARITY_DIR / f"{name}.npy"
+        try:
+            matrix = np.load(path, mmap_mode="r")
+            if matrix.shape != (len(skills), len(skills)):
+                matrix = None
+        except (OSError, ValueError):
+            matrix = None
+        if matrix is None:
+            emb = _embed_many(texts)
+            if emb is None:
+                return None
+            matrix = np.clip(emb @ emb.T, -1.0, 1.0).astype(np.float32)
+            try:
+                _SKILL_SIMILARITY_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = _SKILL_SIMILARITY_DIR / f"{name}.{uuid.uuid4().hex}.tmp.npy"
+                np.save(tmp, matrix)
+                os.replace(tmp, path)
+            except OSError:
+                pass  # keep it in memory only
+        index = {skill: i for i, skill in enumerate(skills)}
+        _SKILL_SIMILARITY = (taxonomy.version, index, matrix)
+        return index, matrix
+
+
+def _coverage_many(
+    pairs: List[Tuple[List[str], List[str]]],
+    threshold: int = 85,
+) -> List[Tuple[float, List[str], List[str], List[Dict[str, Any]]]]:
+    """Coverage for many (required, candidate) pairs of already-normalized skill lists.
+
+    Returns (coverage, matched, missing, partial) per pair. Exact hits are set lookups.
+    Between two known canonical skills the similarity matrix decides: no credit below
+    _SKILL_SIMILARITY_MIN, partial credit (the cosine) above it, so "java" never fully
+    matches "javascript". Pairs involving an unknown skill, or every pair while the model
+    is loading, are fuzzy-matched in a single ``process.cdist`` call, and each pair reads
+    its best match off that shared table.
+    """
+    similarity = _skill_similarity()
+    index, matrix = similarity if similarity is not None else ({}, None)
+    cand_sets = [set(cand) for _, cand in pairs]
+    rows: Dict[str, int] = {}
+    cols: Dict[str, int] = {}
+    for (req, cand), cand_set in zip(pairs, cand_sets):
+        misses = [r for r in req if r not in cand_set]
+        unknown = [c for c in cand if c not in index]
+        for r in misses:
+            # Known required skills only need fuzzy scores against unknown candidate skills
+            targets = unknown if r in index else cand
+            if targets:
+                rows.setdefault(r, len(rows))
+                for c in targets:
+                    cols.setdefault(c, len(cols))
+    table = None
+    if rows:
+        table = process.cdist(
+            list(rows), list(cols), scorer=fuzz.token_set_ratio, score_cutoff=threshold, workers=-1
+        )
 
+    out: List[Tuple[float, List[str], List[str], List[Dict[str, Any]]]] = []
+    for (req, cand), cand_set in zip(pairs, cand_sets):
+        if not req:
+            out.append((1.0, [], [], []))
+            continue
+        matched: List[str] = []
+        missing: List[str] = []
+        partial: List[Dict[str, Any]] = []
+        credit = 0.0
+        known = [c for c in cand if c in index]
+        unknown = [c for c in cand if c not in index]
+        for r in req:
+            if r in cand_set:
+                credit += 1.0
+                matched.append(r)
+                continue
+            targets = unknown if r in index else cand
+            if targets:
+                col_idx = np.fromiter((cols[c] for c in targets), dtype=np.intp, count=len(targets))
+                scores = table[rows[r], col_idx]
+                # argmax keeps the first best candidate, like extractOne
+                best = int(scores.argmax())
+                if scores[best] >= threshold:
+                    credit += 1.0
+                    matched.append(f"{r}~{targets[best]}")
+                    continue
+            if r in index and known:
+                sims = matrix[index[r], [index[c] for c in known]]
+                best = int(sims.argmax())
+                sim = round(float(sims[best]), 3)
+                if sim >= _SKILL_SIMILARITY_MIN:
+                    credit += sim
+                    partial.append({"skill": r, "matched": known[best], "credit": sim})
+                    continue
+            missing.append(r)
+        out.append((credit / max(1, len(req)), matched, missing, partial))
+    return out
 
-def _coverage(required_list: List[str], candidate_list: List[str], threshold: int = 85) -> Tuple[float, List[str], List[str]]:
-    if not required_list:
-        return 1.0, [], []
+
+def _coverage(
+    required_list: List[str], candidate_list: List[str], threshold: int = 85
+) -> Tuple[float, List[str], List[str], List[Dict[str, Any]]]:
     req = [_normalize_skill(x) for x in required_list]
     cand = [_normalize_skill(x) for x in candidate_list]
-    matched: List[str] = []
-    missing: List[str] = []
-    hits = 0
-    for r in req:
-        if r in cand:
-            hits += 1
-            matched.append(r)
-            continue
-        best = process.extractOne(r, cand, scorer=fuzz.token_set_ratio)
-        if best and best[1] >= threshold:
-            hits += 1
-            matched.append(f"{r}~{best[0]}")
-        else:
-            missing.append(r)
-    return hits / max(1, len(req)), matched, missing
+    return _coverage_many([(req, cand)], threshold)[0]
 
 
 def _canonicalize_jd(jd: Dict[str, Any]) -> str:
@@ -101,20 +282,47 @@ def _canonicalize_cv(app: Dict[str, Any]) -> Tuple[str, List[str]]:
     return cv_text, cand_skills
 
 
+def _embed_many(texts: List[str], batch_size: int = _ENCODE_BATCH_SIZE) -> Optional[np.ndarray]:
+    """Return one normalized embedding row per text, encoding only unseen texts.
+
+    Texts are looked up by content hash in the embedding cache; all misses are
+    encoded together in a single ``model.encode`` call and written back.
+    Returns None when some text is uncached and the model is unavailable or
+    still loading.
+    """
+    keys = [EmbeddingCache.key(_EMBEDDING_NAMESPACE, t) for t in texts]
+    found = _EMBEDDINGS.get_many(keys)
+    missing: Dict[str, str] = {}
+    for k, t in zip(keys, texts):
+        if k not in found and k not in missing:
+            missing[k] = t
+    if missing:
+        model = _get_model()
+        if not model or model is False:
+            return None
+        # encode returns normalized vectors if normalize_embeddings=True
+        encoded = model.encode(list(missing.values()), batch_size=batch_size, normalize_embeddings=True)
+        fresh = {k: np.asarray(v, dtype=np.float32) for k, v in zip(missing.keys(), encoded)}
+        _EMBEDDINGS.put_many(fresh)
+        found.update(fresh)
+    return np.stack([found[k] for k in keys])
+
+
 def _semantic_sim(a: str, b: str) -> float:
-    model = _get_model()
-    if not model or model is False:
+    emb = _embed_many([a, b])
+    if emb is None:
         # Fallback when embedding model cannot be loaded
         return 0.0
-    # encode returns normalized vectors if normalize_embeddings=True
-    ea = model.encode(a, normalize_embeddings=True)
-    eb = model.encode(b, normalize_embeddings=True)
     # Manual cosine (inputs normalized -> cosine == dot)
+    return float((emb[0] * emb[1]).sum())
+
+
+def _days_to_deadline(jd: Dict[str, Any]) -> Optional[int]:
     try:
-        # ea, eb are 1D numpy arrays
-        return float((ea * eb).sum())
+        y, m, d = map(int, str(jd.get("deadline") or "1970-01-01").split("-"))
+        return (date(y, m, d) - date.today()).days
     except Exception:
-        return 0.0
+        return None
 
 
 def _soft_constraints_penalty(jd: Dict[str, Any], app: Dict[str, Any]) -> Tuple[float, List[str]]:
@@ -149,33 +357,49 @@ def _soft_constraints_penalty(jd: Dict[str, Any], app: Dict[str, Any]) -> Tuple[
             notes.append("location likely mismatch (non-remote)")
 
     # Deadline (past postings)
-    try:
-        y, m, d = map(int, str(jd.get("deadline") or "1970-01-01").split("-"))
-        days_left = (date(y, m, d) - date.today()).days
-        if days_left < 0:
-            penalty += 0.05
-            notes.append("deadline passed")
-    except Exception:
-        pass
+    days_left = _days_to_deadline(jd)
+    if days_left is not None and days_left < 0:
+        penalty += 0.05
+        notes.append("deadline passed")
 
     return min(penalty, 0.2), notes
 
 
-def score_match(payload: Dict[str, Any]) -> Dict[str, Any]:
-    jd = payload["internship"]
-    app = payload["applicant"]
+def _prepare_internship(jd: Dict[str, Any]) -> Dict[str, Any]:
+    required = jd.get("required_skills", []) or []
+    optional = jd.get("optional_skills", []) or []
+    return {
+        "jd": jd,
+        "text": _canonicalize_jd(jd),
+        "skills_text": "Skills: " + ", ".join([*required, *optional]),
+        "required": [_normalize_skill(x) for x in required],
+        "optional": [_normalize_skill(x) for x in optional],
+    }
+
 
-    jd_text = _canonicalize_jd(jd)
+def _prepare_applicant(app: Dict[str, Any]) -> Dict[str, Any]:
     cv_text, cand_skills = _canonicalize_cv(app)
+    return {
+        "app": app,
+        "text": cv_text,
+        "skills": cand_skills,
+        "skills_text": "Skills: " + ", ".join(cand_skills),
+    }
 
-    req_cov, matched_req, missing_req = _coverage(jd.get("required_skills", []) or [], cand_skills)
-    opt_cov, matched_opt, _ = _coverage(jd.get("optional_skills", []) or [], cand_skills)
 
-    sem_skills = _semantic_sim(
-        "Skills: " + ", ".join([*(jd.get("required_skills", []) or []), *(jd.get("optional_skills", []) or [])]),
-        "Skills: " + ", ".join(cand_skills),
-    )
-    sem_overall = _semantic_sim(jd_text, cv_text)
+def _assemble_result(
+    jd_prep: Dict[str, Any],
+    app_prep: Dict[str, Any],
+    required: Tuple[float, List[str], List[str], List[Dict[str, Any]]],
+    optional: Tuple[float, List[str], List[str], List[Dict[str, Any]]],
+    sem_skills: float,
+    sem_overall: float,
+) -> Dict[str, Any]:
+    jd = jd_prep["jd"]
+    app = app_prep["app"]
+
+    req_cov, matched_req, missing_req, partial_req = required
+    opt_cov, matched_opt, _, partial_opt = optional
 
     penalty, notes = _soft_constraints_penalty(jd, app)
 
@@ -195,13 +419,173 @@ def score_match(payload: Dict[str, Any]) -> Dict[str, Any]:
             "matched_required": matched_req,
             "matched_optional": matched_opt,
             "missing_required": missing_req,
+            # Related but different skills, e.g. {"skill": "mysql", "matched": "postgresql", "credit": 0.74}
+            "partial_required": partial_req,
+            "partial_optional": partial_opt,
             "notes": notes,
         },
     }
 
 
+def _score_one_to_many(one: Dict[str, Any], many: List[Dict[str, Any]], one_is_internship: bool, batch_size: int) -> List[Dict[str, Any]]:
+    if not many:
+        return []
+    # Row layout: [one.skills, one.text, many[0].skills, many[0].text, ...]
+    texts = [one["skills_text"], one["text"]]
+    for p in many:
+        texts.extend((p["skills_text"], p["text"]))
+    emb = _embed_many(texts, batch_size=batch_size)
+    if emb is None:
+        # Fallback when embedding model cannot be loaded
+        sem_skills = np.zeros(len(many), dtype=np.float32)
+        sem_overall = np.zeros(len(many), dtype=np.float32)
+    else:
+        # Inputs normalized -> cosine == dot; one matrix-vector product per component
+        sem_skills = emb[2::2] @ emb[0]
+        sem_overall = emb[3::2] @ emb[1]
+
+    preps = [(one, p) if one_is_internship else (p, one) for p in many]
+    # Required and optional coverage for every pair share one fuzzy-match table and similarity matrix
+    coverage = _coverage_many(
+        [(jd_prep["required"], app_prep["skills"]) for jd_prep, app_prep in preps]
+        + [(jd_prep["optional"], app_prep["skills"]) for jd_prep, app_prep in preps]
+    )
+    n = len(preps)
+    return [
+        _assemble_result(jd_prep, app_prep, coverage[i], coverage[n + i], float(sem_skills[i]), float(sem_overall[i]))
+        for i, (jd_prep, app_prep) in enumerate(preps)
+    ]
+
+
+def score_match(payload: Dict[str, Any]) -> Dict[str, Any]:
+    jd_prep = _prepare_internship(payload["internship"])
+    app_prep = _prepare_applicant(payload["applicant"])
+    return _score_one_to_many(jd_prep, [app_prep], True, _ENCODE_BATCH_SIZE)[0]
+
+
+def score_many(payload: Dict[str, Any], batch_size: int = _ENCODE_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """Score one internship against many applicants, or one applicant against many internships.
+
+    Accepts ``{"internship": jd, "applicants": [...]}`` or ``{"applicant": app, "internships": [...]}``
+    and returns one ``score_match``-shaped result per item, in input order. All texts are
+    embedded in a single batched encode and cosines are computed as matrix products.
+    """
+    if "applicants" in payload:
+        one = _prepare_internship(payload["internship"])
+        many = [_prepare_applicant(a) for a in payload["applicants"] or []]
+        return _score_one_to_many(one, many, True, batch_size)
+    if "internships" in payload:
+        one = _prepare_applicant(payload["applicant"])
+        many = [_prepare_internship(jd) for jd in payload["internships"] or []]
+        return _score_one_to_many(one, many, False, batch_size)
+    raise ValueError("payload must contain 'applicants' or 'internships'")
+
+
+def internship_digest(jd: Dict[str, Any]) -> bytes:
+    """Digest of the texts ``embed_internships`` encodes for ``jd`` (and of the model producing them)."""
+    prep = _prepare_internship(jd)
+    return hashlib.sha256(f"{_EMBEDDING_NAMESPACE}\0{prep['skills_text']}\0{prep['text']}".encode("utf-8")).digest()
+
+
+def embed_internships(internships: List[Dict[str, Any]], batch_size: int = _ENCODE_BATCH_SIZE) -> Optional[np.ndarray]:
+    """Return a float32 array of shape (n, 2, dim): skills-text and full-text embeddings per internship."""
+    texts: List[str] = []
+    for jd in internships:
+        prep = _prepare_internship(jd)
+        texts.extend((prep["skills_text"], prep["text"]))
+    if not texts:
+        return None
+    emb = _embed_many(texts, batch_size=batch_size)
+    if emb is None:
+        return None
+    return emb.reshape(len(internships), 2, -1)
+
+
+def embed_applicant(applicant: Dict[str, Any]) -> bool:
+    """Encode (and cache) the applicant texts scoring will need; False if the model is unavailable."""
+    prep = _prepare_applicant(applicant)
+    return _embed_many([prep["skills_text"], prep["text"]]) is not None
+
+
+def score_top_k(
+    applicant: Dict[str, Any],
+    internships: List[Dict[str, Any]],
+    internship_vectors: np.ndarray,
+    limit: int,
+    batch_size: int = _ENCODE_BATCH_SIZE,
+    keep: Optional[Callable[[int, float], bool]] = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Return the ``limit`` best (index, result) pairs, best first, without fully scoring every internship.
+
+    The semantic components are read straight off ``internship_vectors`` (see
+    ``embed_internships``). Coverage can add at most 0.70 and the penalty never adds,
+    so each internship has a cheap upper bound; candidates are fully scored in bound
+    order and the scan stops once the current k-th best beats every remaining bound.
+    Ties keep input order, matching a stable sort of ``score_many`` output.
+
+    ``keep(index, final_score)`` restricts the ranking, e.g. to rows after a page cursor;
+    rows it rejects are scored but never count towards ``limit``.
+    """
+    if limit <= 0 or not internships:
+        return []
+    app_prep = _prepare_applicant(applicant)
+    emb = _embed_many([app_prep["skills_text"], app_prep["text"]], batch_size=batch_size)
+    if emb is None:
+        bounds = np.full(len(internships), 0.70)
+    else:
+        bounds = 0.70 + 0.20 * (internship_vectors[:, 0, :] @ emb[0]) + 0.10 * (internship_vectors[:, 1, :] @ emb[1])
+    # Round up to the 3 decimals score_match reports so the bound stays safe
+    bounds = np.ceil(np.clip(bounds, 0.0, 1.0) * 1000.0) / 1000.0
+    order = sorted(range(len(internships)), key=lambda i: (-bounds[i], i))
+
+    best: List[Tuple[float, int, Dict[str, Any]]] = []
+    step = max(limit, 8)
+    for start in range(0, len(order), step):
+        if len(best) >= limit and best[limit - 1][0] > bounds[order[start]]:
+            break
+        chunk = order[start:start + step]
+        results = score_many({"applicant": applicant, "internships": [internships[i] for i in chunk]}, batch_size=batch_size)
+        for i, result in zip(chunk, results):
+            score = float(result.get("final_score", 0.0))
+            if keep is None or keep(i, score):
+                best.append((score, i, result))
+        best.sort(key=lambda x: (-x[0], x[1]))
+        del best[limit:]
+    return [(i, result) for _, i, result in best]
+
+
+def scoring_version() -> str:
+    """Identifies everything besides the payloads that affects scores."""
+    model = "" if model_status() == "ready" else "+no-model"
+    return f"{SCORING_VERSION}:{taxonomy_version()}:{_EMBEDDING_NAMESPACE}{model}:sim>={_SKILL_SIMILARITY_MIN}"
+
+
+def applicant_digest(applicant: Dict[str, Any]) -> str:
+    """Hash of an applicant payload and the scoring version; a change invalidates all their scores."""
+    state = [scoring_version(), applicant]
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def score_fingerprint(internship: Dict[str, Any], applicant: Dict[str, Any]) -> str:
+    """Hash of the inputs ``score_match`` would see for this pair; equal fingerprints mean equal scores."""
+    jd = {k: v for k, v in internship.items() if k not in ("archived", "created_at")}
+    days_left = _days_to_deadline(jd)
+    state = [scoring_version(), jd, applicant, days_left is not None and days_left < 0]
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
 __all__ = [
     "score_match",
+    "score_many",
+    "score_top_k",
+    "embed_internships",
+    "embed_applicant",
+    "internship_digest",
+    "warm_up_model",
+    "model_status",
+    "scoring_version",
+    "score_fingerprint",
+    "applicant_digest",
 ]
 
 
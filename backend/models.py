@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import declarative_base, relationship
 
 
@@ -26,6 +26,7 @@ class Intern(Base):
     github_url = Column(String, nullable=True)
     # Public URL for profile image (served from static uploads)
     profile_image_url = Column(String, nullable=True)
+    profile_image_thumbnails = Column(JSON, nullable=True)  # {"<px>": url} WebP thumbnails
     # Absolute filesystem paths for server-side storage (cross-platform safe via pathlib)
     profile_image_path = Column(String, nullable=True)
     resume_pdf_path = Column(String, nullable=True)
@@ -48,6 +49,7 @@ class Recruiter(Base):
     phone = Column(String, nullable=True)
     password_hash = Column(String, nullable=False)
     profile_image_url = Column(String, nullable=True)
+    profile_image_thumbnails = Column(JSON, nullable=True)  # {"<px>": url} WebP thumbnails
     profile_image_path = Column(String, nullable=True)
     website = Column(String, nullable=True)
     active = Column(Boolean, default=True)
@@ -58,6 +60,11 @@ class Recruiter(Base):
 
 class Listing(Base):
     __tablename__ = "listings"
+    __table_args__ = (
+        # Recruiter listing pages: filter, then keyset on (created_at, id)
+        Index("ix_listings_recruiter_archived_created", "recruiter_email", "archived", "created_at", "id"),
+        Index("ix_listings_archived", "archived"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     recruiter_email = Column(String, ForeignKey("recruiters.email"), nullable=False)
@@ -76,12 +83,21 @@ class Listing(Base):
     deadline = Column(String, nullable=False)
     archived = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Any change makes stored MatchScores older than this stale (materialized recommendations)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     applications = relationship("Application", back_populates="listing")
 
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # One application per intern per listing; lets apply rely on an atomic insert
+        Index("uq_applications_listing_intern", "listing_id", "intern_email", unique=True),
+        Index("ix_applications_listing_status", "listing_id", "status"),
+        Index("ix_applications_listing_score", "listing_id", "similarity_score"),
+        Index("ix_applications_intern_applied", "intern_email", "applied_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     listing_id = Column(Integer, ForeignKey("listings.id"), nullable=False)
@@ -93,3 +109,62 @@ class Application(Base):
     status = Column(String, nullable=False, default="pending")  # pending, accepted, waitlisted, rejected
     similarity_score = Column(Float, nullable=True)
     applied_at = Column(DateTime, default=datetime.utcnow)
+
+
+class MatchScore(Base):
+    """Persisted score_match result for one (listing, intern) pair.
+
+    ``fingerprint`` hashes the scoring inputs and model version, so background
+    rescoring can skip pairs whose inputs have not changed.
+
+    Rows also exist for listings the student has not applied to: they are the student's
+    materialized recommendation ranking. A row is current while ``applicant_digest`` matches
+    the student's payload and ``scored_at`` is not older than the listing's ``updated_at``.
+    """
+    __tablename__ = "match_scores"
+    __table_args__ = (
+        UniqueConstraint("listing_id", "intern_email", name="uq_match_scores_listing_intern"),
+        # Recommendation pages: keyset on (final_score DESC, listing_id) per student
+        Index("ix_match_scores_intern_score", "intern_email", "final_score", "listing_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    listing_id = Column(Integer, ForeignKey("listings.id"), nullable=False)
+    intern_email = Column(String, ForeignKey("interns.email"), nullable=False)
+
+    final_score = Column(Float, nullable=False, default=0.0)
+    components = Column(JSON, nullable=True)
+    explanations = Column(JSON, nullable=True)
+    fingerprint = Column(String, nullable=False)
+    applicant_digest = Column(String, nullable=True)
+    scored_at = Column(DateTime, default=datetime.utcnow)
+
+
+class Blob(Base):
+    """Content-addressed upload stored once under its SHA-256 (see backend/blob_store.py).
+
+    ``refcount`` counts the user image/resume columns pointing at the blob; blobs at
+    zero are deleted by ``python -m backend.blob_store gc``.
+    """
+    __tablename__ = "blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    suffix = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    refcount = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class GitHubResponse(Base):
+    """Last 200 response per GitHub API URL, replayed when GitHub answers 304 Not Modified.
+
+    See backend/github_ingest.py; ``next_url`` keeps the pagination link of list pages.
+    """
+    __tablename__ = "github_responses"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    next_url = Column(String, nullable=True)
+    body = Column(JSON, nullable=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+    checked_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, false, or_
+
+
+"""
+Keyset (cursor) pagination.
+
+A page is ordered by a unique sort key, e.g. (created_at, id) or (score DESC, id), and the
+next page starts strictly after the last row's key. With an index on the key each page is
+an index range scan, whatever the page number; there is no OFFSET to skip over.
+
+The cursor is the last row's key, JSON-encoded in url-safe base64. It is opaque to clients,
+who only echo the X-Next-Cursor response header back as ``?cursor=``.
+"""
+
+DEFAULT_PAGE_SIZE = int(os.getenv("INTERNMIX_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("INTERNMIX_MAX_PAGE_SIZE", "200"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class SortKey:
+    """One column of a keyset ordering; NULLs always sort last."""
+
+    def __init__(self, expr, descending: bool = False, nullable: bool = False,
+                 parse: Callable[[Any], Any] = lambda v: v) -> None:
+        self.expr = expr
+        self.descending = descending
+        self.nullable = nullable
+        self.parse = parse
+
+    def order_by(self):
+        clause = self.expr.desc() if self.descending else self.expr.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def equals(self, value):
+        return self.expr.is_(None) if value is None else self.expr == value
+
+    def after(self, value):
+        if value is None:
+            # Nothing sorts after NULL
+            return false()
+        cond = self.expr < value if self.descending else self.expr > value
+        return or_(cond, self.expr.is_(None)) if self.nullable else cond
+
+
+def _dump(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_dump(v) for v in values], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable[[Any], Any]]) -> List[Any]:
+    """Values of ``cursor``, one per parser; raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise ValueError("Invalid cursor")
+    try:
+        return [None if v is None else parse(v) for parse, v in zip(parsers, values)]
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """WHERE clause selecting rows strictly after ``values`` in the order given by ``keys``."""
+    branches = []
+    for i, key in enumerate(keys):
+        prefix = [keys[j].equals(values[j]) for j in range(i)]
+        branches.append(and_(*prefix, key.after(values[i])))
+    return or_(*branches)
+
+
+def page_stmt(stmt, keys: Sequence[SortKey], cursor: Optional[str], limit: int):
+    """Order ``stmt`` by ``keys``, start after ``cursor`` and fetch one row past the page.
+
+    The extra row tells ``split_page`` whether another page exists. Raises ValueError for
+    a malformed cursor.
+    """
+    if cursor:
+        stmt = stmt.where(keyset_after(keys, decode_cursor(cursor, [key.parse for key in keys])))
+    return stmt.order_by(None).order_by(*(key.order_by() for key in keys)).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int, key_of: Callable[[Any], Sequence[Any]]) -> Tuple[List[Any], Optional[str]]:
+    """(rows of this page, cursor of the next page or None)."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key_of(rows[-1]))
+
+
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "NEXT_CURSOR_HEADER",
+    "SortKey",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_after",
+    "page_stmt",
+    "split_page",
+    "parse_datetime",
+]
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Query-count check for the list and dashboard read endpoints.
+
+Seeds a temporary SQLite database at two sizes (a recruiter with N listings, each applied to
+by the student, and N applicants on the first listing) and calls each endpoint through the
+API at both. The statements an endpoint runs (auth lookup included) must not grow with N;
+an N+1 query pattern, e.g. a per-row recruiter lookup, fails the check.
+
+Each endpoint is called once to warm stored scores and background jobs are drained before
+the counted call, so only the request's own statements are counted.
+
+Examples:
+    python -m backend.query_check
+    python -m backend.query_check --small 2 --large 40 --verbose
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Ensure project root is on sys.path so `python backend/query_check.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.db_profile import count_queries
+from backend.models import Application, Intern, Listing, Recruiter
+
+RECRUITER = "check-recruiter@example.com"
+STUDENT = "check-student@example.com"
+
+
+def _seed(db, start: int, stop: int) -> None:
+    """Listings start..stop-1 for the recruiter, applied to by the student, plus one applicant each on listing 1."""
+    listings = [Listing(recruiter_email=RECRUITER, title=f"Listing {i}", description="Build things", degree="BSc",
+                        major="CS", duration_months=3, location="Dhaka", is_remote=i % 2 == 0,
+                        required_skills=["python", "sql"], optional_skills=["git"], deadline="2099-12-31",
+                        archived=False)
+                for i in range(start, stop)]
+    applicants = [Intern(email=f"applicant{i}@example.com", first_name="A", last_name=str(i), password_hash="x",
+                         degree="BSc", major="CS")
+                  for i in range(start, stop)]
+    db.add_all(listings + applicants)
+    db.flush()
+    first = db.query(Listing.id).filter(Listing.recruiter_email == RECRUITER).order_by(Listing.id).limit(1).scalar()
+    db.add_all(Application(listing_id=listing.id, intern_email=STUDENT, status="pending") for listing in listings
+               if listing.id != first)
+    db.add_all(Application(listing_id=first, intern_email=intern.email, status="pending") for intern in applicants)
+    db.commit()
+
+
+def _endpoints(first_listing: int, first_application: int) -> List[tuple]:
+    return [
+        ("recruiter", "/api/listings"),
+        ("recruiter", f"/api/listings/{first_listing}"),
+        ("recruiter", f"/api/listings/{first_listing}/applications/scored"),
+        ("recruiter", "/api/dashboard/recruiter"),
+        ("student", "/api/student/applications"),
+        ("student", f"/api/student/applications/{first_application}"),
+        ("student", "/api/student/recommendations"),
+        ("student", "/api/dashboard/student"),
+    ]
+
+
+def _measure(main, client, headers: Dict[str, dict], verbose: bool) -> Dict[str, int]:
+    with main.SessionLocal() as db:
+        first_listing = db.query(Listing.id).order_by(Listing.id).limit(1).scalar()
+        first_application = (db.query(Application.id).filter(Application.intern_email == STUDENT)
+                             .order_by(Application.id).limit(1).scalar())
+    counts: Dict[str, int] = {}
+    for role, path in _endpoints(first_listing, first_application):
+        # Warm up: fill stored scores, then let the background jobs it queued finish
+        response = client.get(path, headers=headers[role])
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path}: {response.status_code} {response.text}")
+        main.jobs.join()
+        with count_queries(main.engine, main.async_engine) as counter:
+            client.get(path, headers=headers[role])
+        counts[path] = counter.count
+        if verbose:
+            print(f"GET {path}")
+            for statement in counter.statements:
+                print("   ", " ".join(statement.split())[:160])
+    return counts
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--small", type=int, default=3, help="rows per table in the first run")
+    parser.add_argument("--large", type=int, default=30, help="rows per table in the second run (<= page size)")
+    parser.add_argument("--verbose", action="store_true", help="print each counted statement")
+    args = parser.parse_args(argv)
+
+    # A throwaway database, and dashboards read from it on every request
+    workdir = tempfile.mkdtemp(prefix="internmix-query-check-")
+    os.environ["INTERNMIX_DATABASE_URL"] = f"sqlite:///{workdir}/check.db"
+    os.environ["INTERNMIX_DASHBOARD_CACHE_TTL"] = "0"
+    os.environ.setdefault("INTERNMIX_EMBEDDING_CACHE_PATH", "")
+
+    from fastapi.testclient import TestClient
+    from backend import main as api
+
+    try:
+        with TestClient(api.app) as client:
+            with api.SessionLocal() as db:
+                db.add(Recruiter(email=RECRUITER, first_name="R", last_name="C", password_hash="x",
+                                 organization_name="Check"))
+                db.add(Intern(email=STUDENT, first_name="S", last_name="T", password_hash="x", degree="BSc", major="CS"))
+                db.commit()
+            headers = {
+                role: {"Authorization": "Bearer " + api.create_access_token(f"{role}:{email}")}
+                for role, email in (("recruiter", RECRUITER), ("student", STUDENT))
+            }
+            with api.SessionLocal() as db:
+                _seed(db, 0, args.small)
+            small = _measure(api, client, headers, args.verbose)
+            with api.SessionLocal() as db:
+                _seed(db, args.small, args.large)
+            large = _measure(api, client, headers, args.verbose)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    failed = 0
+    print(f"{'endpoint':56s} {'N=' + str(args.small):>6s} {'N=' + str(args.large):>6s}")
+    for path, count in small.items():
+        grew = large[path] > count
+        failed += grew
+        print(f"{path:56s} {count:6d} {large[path]:6d}{'  GROWS WITH N' if grew else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
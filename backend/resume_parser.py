@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeout
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.skill_aliases import TaxonomyError, extract_skills, reload_taxonomy
+
+
+"""
+Server-side resume parsing.
+
+Turns an uploaded resume PDF into the ``resume_parsed`` structure the matcher reads
+(personal / education / experience / languages / skills, as produced by the frontend's
+europass.util.ts):
+- Europass PDFs carry their CV as an embedded XML attachment; it is mapped field by field
+- any other PDF falls back to its text layer: contact details and known skills are picked
+  out of the text (see skill_aliases.py)
+
+pypdf is pure Python and CPU-bound, so parsing runs on a small process pool
+(INTERNMIX_RESUME_WORKERS) and never holds the GIL of the API process. A parse that overruns
+INTERNMIX_RESUME_PARSE_TIMEOUT has its worker killed, so a hostile PDF cannot pin a worker.
+pypdf is optional: without it resumes are stored but not parsed.
+"""
+
+PARSER_VERSION = "2"
+MAX_PAGES = int(os.getenv("INTERNMIX_RESUME_MAX_PAGES", "20"))
+MAX_TEXT_CHARS = 200_000
+PARSE_TIMEOUT = float(os.getenv("INTERNMIX_RESUME_PARSE_TIMEOUT", "60"))
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE = re.compile(r"\+?\d[\d ()-]{7,}\d")
+
+_CEF_DIMENSIONS = {
+    "CEF-Understanding-Listening": "listening",
+    "CEF-Understanding-Reading": "reading",
+    "CEF-Speaking-Interaction": "interaction",
+    "CEF-Speaking-Production": "production",
+    "CEF-Writing-Production": "writing",
+}
+
+
+class ResumeParseError(Exception):
+    pass
+
+
+# ---------- Europass XML ----------
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _children(el: Optional[ET.Element], name: str) -> List[ET.Element]:
+    if el is None:
+        return []
+    return [child for child in el if _local(child.tag) == name]
+
+
+def _child(el: Optional[ET.Element], *path: str) -> Optional[ET.Element]:
+    for name in path:
+        found = _children(el, name)
+        el = found[0] if found else None
+    return el
+
+
+def _text(el: Optional[ET.Element], *path: str) -> Optional[str]:
+    node = _child(el, *path)
+    if node is None or node.text is None:
+        return None
+    return node.text.strip() or None
+
+
+def _address(el: Optional[ET.Element]) -> Optional[ET.Element]:
+    for comm in _children(el, "Communication"):
+        address = _child(comm, "Address")
+        if address is not None:
+            return address
+    return None
+
+
+def _europass_xml(attachments: Dict[str, List[bytes]]) -> Optional[bytes]:
+    entries = [(name, data[0]) for name, data in attachments.items() if data]
+    for name, data in entries:
+        lowered = name.lower()
+        if lowered.endswith(".xml") or "europass" in lowered:
+            return data
+    if len(entries) == 1:
+        return entries[0][1]
+    return None
+
+
+def map_europass(xml: bytes) -> Dict[str, Any]:
+    """Map a Europass Candidate XML document to ``resume_parsed`` (mirrors mapEuropass in the frontend)."""
+    if b"<!DOCTYPE" in xml[:4096].upper():
+        # Entity declarations are never needed here; refuse rather than expand them
+        raise ResumeParseError("Europass XML with a DOCTYPE is not accepted")
+    try:
+        root = ET.fromstring(xml)
+    except ET.ParseError as exc:
+        raise ResumeParseError(f"Invalid Europass XML: {exc}") from exc
+    candidate = root if _local(root.tag) == "Candidate" else _child(root, "Candidate")
+    if candidate is None:
+        raise ResumeParseError("Invalid Europass XML (Candidate root missing)")
+    person = _child(candidate, "CandidatePerson")
+    profile = _child(candidate, "CandidateProfile")
+
+    email = phone = address = None
+    for comm in _children(person, "Communication"):
+        channel = _text(comm, "ChannelCode")
+        if channel == "Email":
+            email = _text(comm, "URI")
+        elif channel == "Telephone":
+            phone = f"+{_text(comm, 'CountryDialing') or ''}{_text(comm, 'DialNumber') or ''}"
+        elif _child(comm, "Address") is not None:
+            addr = _child(comm, "Address")
+            lines = [line.text.strip() for line in _children(addr, "AddressLine") if line.text and line.text.strip()]
+            address = ", ".join(filter(None, [*lines, _text(addr, "CityName"), _text(addr, "PostalCode")])) or None
+
+    education = []
+    for edu in _children(_child(profile, "EducationHistory"), "EducationOrganizationAttendance"):
+        contact = _child(edu, "OrganizationContact")
+        website = next(
+            (_text(comm, "URI") for comm in _children(contact, "Communication") if _text(comm, "ChannelCode") == "Web"),
+            None,
+        )
+        education.append({
+            "organisation": _text(edu, "OrganizationName"),
+            "title": _text(edu, "EducationDegree", "DegreeName"),
+            "start": _text(edu, "AttendancePeriod", "StartDate", "FormattedDateTime"),
+            "end": _text(edu, "AttendancePeriod", "EndDate", "FormattedDateTime"),
+            "city": _text(_address(contact), "CityName"),
+            "description": None,
+            "level": _text(edu, "EducationLevelCode"),
+            "website": website,
+        })
+
+    experience = []
+    for employer in _children(_child(profile, "EmploymentHistory"), "EmployerHistory"):
+        position = _child(employer, "PositionHistory")
+        experience.append({
+            "title": _text(position, "PositionTitle"),
+            "company": _text(employer, "OrganizationName"),
+            "start": _text(position, "EmploymentPeriod", "StartDate", "FormattedDateTime"),
+            "end": _text(position, "EmploymentPeriod", "EndDate", "FormattedDateTime"),
+            "city": _text(_address(_child(employer, "OrganizationContact")), "CityName"),
+            "description": _text(position, "Description"),
+        })
+
+    languages = []
+    for comp in _children(_child(profile, "PersonQualifications"), "PersonCompetency"):
+        entry: Dict[str, Any] = {"code": _text(comp, "CompetencyID")}
+        for dim in _children(comp, "CompetencyDimension"):
+            key = _CEF_DIMENSIONS.get(_text(dim, "CompetencyDimensionTypeCode") or "")
+            if key:
+                entry[key] = _text(dim, "Score", "ScoreText")
+        languages.append(entry)
+
+    skills = []
+    for comp in _children(_child(profile, "Skills"), "PersonCompetency"):
+        skill = {
+            "name": _text(comp, "CompetencyName"),
+            "taxonomy": _text(comp, "TaxonomyID"),
+            "competencyId": _text(comp, "CompetencyID"),
+        }
+        if any(skill.values()):
+            skills.append(skill)
+
+    return {
+        "personal": {
+            "first_name": _text(person, "PersonName", "GivenName"),
+            "last_name": _text(person, "PersonName", "FamilyName"),
+            "email": email,
+            "phone": phone,
+            "address": address,
+            "dob": _text(person, "BirthDate"),
+            "nationality": _text(person, "NationalityCode"),
+        },
+        "education": education,
+        "experience": experience,
+        "languages": languages,
+        "skills": skills,
+        "meta": {"template": _text(candidate, "RenderingInformation", "Design", "Template")},
+    }
+
+
+# ---------- Plain PDF text ----------
+
+def map_text(text: str) -> Dict[str, Any]:
+    """Best-effort ``resume_parsed`` from a resume's plain text: contact details and known skills."""
+    email = _EMAIL.search(text)
+    phone = _PHONE.search(text)
+    return {
+        "personal": {
+            "email": email.group(0) if email else None,
+            "phone": re.sub(r"[ ()-]", "", phone.group(0)) if phone else None,
+        },
+        "education": [],
+        "experience": [],
+        "languages": [],
+        "skills": [{"name": name} for name in extract_skills(text)],
+        "meta": {},
+    }
+
+
+def parse_pdf(data: bytes) -> Dict[str, Any]:
+    """Parse resume PDF bytes; raises ResumeParseError (or RuntimeError without pypdf)."""
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError as exc:
+        raise RuntimeError("pypdf is not installed; server-side resume parsing is disabled") from exc
+
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        xml = _europass_xml(reader.attachments or {})
+        if xml is not None:
+            parsed = map_europass(xml)
+            parsed["meta"]["source"] = "europass"
+            return parsed
+        chunks: List[str] = []
+        size = 0
+        for page in reader.pages[:MAX_PAGES]:
+            chunk = page.extract_text() or ""
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_TEXT_CHARS:
+                break
+    except PdfReadError as exc:
+        raise ResumeParseError(f"Unreadable PDF: {exc}") from exc
+    parsed = map_text("\n".join(chunks)[:MAX_TEXT_CHARS])
+    parsed["meta"].update({"source": "text", "pages": len(reader.pages)})
+    return parsed
+
+
+def _parse_file(path: str) -> Dict[str, Any]:
+    # Workers are long-lived processes; pick up taxonomy edits the API process has seen
+    try:
+        reload_taxonomy()
+    except (TaxonomyError, OSError):
+        pass
+    return parse_pdf(Path(path).read_bytes())
+
+
+def _parser_context():
+    # Same reasoning as security._hashing_context: never fork the server process
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class ResumeParser:
+    def __init__(self, workers: int) -> None:
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_parser_context())
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Kill the workers of `executor`; the next parse starts a fresh pool."""
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        # shutdown() alone leaves a running parse to finish; the stdlib has no public kill
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, path: str, timeout: float) -> Dict[str, Any]:
+        executor = self._pool()
+        try:
+            return executor.submit(_parse_file, path).result(timeout=timeout)
+        except (FuturesTimeout, BrokenProcessPool):
+            self._recycle(executor)
+            raise
+
+    def parse_file(self, path: str | Path, timeout: float = PARSE_TIMEOUT) -> Dict[str, Any]:
+        """Parse a stored resume on the worker pool (blocking; call from a background job).
+
+        On timeout the pool is recycled, killing the overrunning worker, and TimeoutError is
+        raised. A parse caught in another parse's recycle is retried once on the new pool.
+        """
+        try:
+            return self._run(str(path), timeout)
+        except BrokenProcessPool:
+            return self._run(str(path), timeout)
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+__all__ = ["PARSER_VERSION", "ResumeParseError", "ResumeParser", "map_europass", "map_text", "parse_pdf"]
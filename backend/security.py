@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+
+"""
+Password hashing for InternMix.
+
+bcrypt is deliberately slow, so request handlers go through PasswordHasher, which runs
+it on a dedicated process pool (real parallelism, no request-threadpool slots held),
+caps concurrent attempts per client IP / email, and records hashing latency.
+
+Raising INTERNMIX_BCRYPT_ROUNDS rolls out gradually: weaker hashes are flagged by
+passlib (deprecated="auto" + min_rounds) and replaced on the user's next login.
+"""
+
+BCRYPT_ROUNDS = int(os.getenv("INTERNMIX_BCRYPT_ROUNDS", "12"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, password_hash: str) -> bool:
+    return pwd_context.verify(plain_password, password_hash)
+
+
+def verify_and_update(plain_password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+    """Return (valid, new_hash); new_hash is set when the stored hash should be upgraded."""
+    return pwd_context.verify_and_update(plain_password, password_hash)
+
+
+def _hashing_context():
+    # Never fork the server process itself (it runs model/job threads); workers come from a
+    # forkserver preloaded with just this module. As with spawn, the launching script must
+    # keep its entry point under ``if __name__ == "__main__":`` (uvicorn and dev.py do).
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class TooManyAttempts(Exception):
+    pass
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, per_key_limit: int, max_pending: int) -> None:
+        self.workers = max(1, workers)
+        self.per_key_limit = max(1, per_key_limit)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._pending = 0
+        self._rejected = 0
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_hashing_context())
+            return self._executor
+
+    @asynccontextmanager
+    async def limit(self, *keys: str):
+        """Admit one hashing request for ``keys`` (e.g. client IP and email) or raise TooManyAttempts."""
+        keys = tuple(k for k in keys if k)
+        # Runs on the event loop thread only, so plain counters are safe
+        if self._pending >= self.max_pending or any(self._in_flight.get(k, 0) >= self.per_key_limit for k in keys):
+            self._rejected += 1
+            raise TooManyAttempts()
+        self._pending += 1
+        for k in keys:
+            self._in_flight[k] = self._in_flight.get(k, 0) + 1
+        try:
+            yield
+        finally:
+            self._pending -= 1
+            for k in keys:
+                left = self._in_flight.get(k, 1) - 1
+                if left > 0:
+                    self._in_flight[k] = left
+                else:
+                    self._in_flight.pop(k, None)
+
+    async def _run(self, op: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            stats = self._stats.setdefault(op, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    async def verify_and_update(self, plain_password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        return await self._run("verify", verify_and_update, plain_password, password_hash)
+
+    def metrics(self) -> dict:
+        ops = {
+            op: {
+                "count": int(s["count"]),
+                "avg_ms": round(s["total_ms"] / s["count"], 2) if s["count"] else 0.0,
+                "max_ms": round(s["max_ms"], 2),
+            }
+            for op, s in self._stats.items()
+        }
+        return {
+            "bcrypt_rounds": BCRYPT_ROUNDS,
+            "workers": self.workers,
+            "in_flight": self._pending,
+            "rejected": self._rejected,
+            "operations": ops,
+        }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+__all__ = [
+    "pwd_context",
+    "hash_password",
+    "verify_password",
+    "verify_and_update",
+    "PasswordHasher",
+    "TooManyAttempts",
+]
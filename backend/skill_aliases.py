@@ -1,112 +1,281 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 """
 Canonical skill sets and aliases used for normalized matching across CVs and JDs.
 
-Usage:
-- Keep canonical keys lowercase
-- Add as many variants as needed under each canonical key
+The taxonomy lives in skill_taxonomy.json (INTERNMIX_SKILL_TAXONOMY_PATH), not in code:
+- "skills": groups of canonical key -> aliases; keep canonical keys lowercase and add as many
+  variants as needed under each
+- "ambiguous": aliases that are ordinary words, ignored in free text
+- "version": bump it with every edit; it is reported by /api/ready
+
+SkillMatcher compiles every alias into one Aho-Corasick automaton, so free text (resume
+text, experience descriptions, "React.js and Node" style skill entries) is scanned for all
+aliases in a single pass instead of being split on punctuation and looked up token by token.
+
+The file is re-read when it changes (reload_taxonomy). Each version is an immutable
+SkillTaxonomy swapped in with a single assignment, so a lookup never sees half of an update.
+Its ``version`` also covers the file contents and is part of matching.scoring_version(), so
+scores stored under an older taxonomy are recomputed.
 """
 
-CANONICAL_TO_ALIASES: Dict[str, List[str]] = {
-    # Web frameworks / libraries
-    "react": ["react", "reactjs", "react.js", "react js"],
-    "next.js": ["next.js", "nextjs", "next js", "next"],
-    "vue": ["vue", "vuejs", "vue.js", "vue js"],
-    "angular": ["angular", "angularjs", "angular.js", "angular js", "ng"],
-
-    # Languages
-    "javascript": ["javascript", "js", "ecmascript", "es6", "es2015"],
-    "typescript": ["typescript", "ts"],
-    "python": ["python", "py"],
-    "java": ["java"],
-    "cpp": ["cpp", "c++", "c plus plus"],
-    "csharp": ["csharp", "c#", "c sharp"],
-    "go": ["go", "golang"],
-    "ruby": ["ruby"],
-    "php": ["php"],
-    "swift": ["swift"],
-    "kotlin": ["kotlin"],
-    "rust": ["rust"],
-
-    # Back-end frameworks
-    "express": ["express", "expressjs", "express.js"],
-    "fastapi": ["fastapi", "fast api"],
-    "django": ["django", "django rest", "drf"],
-    "flask": ["flask", "flask rest", "flaskrest"],
-    "spring boot": ["spring boot", "springboot"],
-    "dotnet": [".net", "dotnet", "asp.net", "aspnet"],
-
-    # Styling / UI
-    "tailwind": ["tailwind", "tailwindcss", "tailwind css"],
-    "bootstrap": ["bootstrap", "bootstrap 5", "bootstrap5", "bootstrap 4", "bootstrap4"],
-    "material ui": ["material ui", "mui", "material-ui"],
-    "chakra ui": ["chakra ui", "chakra-ui", "chakra"],
-
-    # Databases
-    "postgresql": ["postgresql", "postgres", "postgre sql", "pg"],
-    "mysql": ["mysql", "my sql"],
-    "mongodb": ["mongodb", "mongo", "mongo db"],
-    "sqlserver": ["sqlserver", "ms sql", "mssql", "microsoft sql server"],
-    "sqlite": ["sqlite", "sqlite3"],
-    "redis": ["redis"],
-    "elasticsearch": ["elasticsearch", "elastic search", "es"],
-
-    # Cloud / DevOps
-    "amazon web services": ["amazon web services", "aws", "amazon web service"],
-    "google cloud": ["google cloud", "gcp", "google cloud platform"],
-    "azure": ["azure", "microsoft azure", "azure devops"],
-    "kubernetes": ["kubernetes", "k8s", "kube"],
-    "docker": ["docker"],
-    "cicd": ["cicd", "ci/cd", "ci cd"],
-    "terraform": ["terraform"],
-    "github actions": ["github actions", "gh actions"],
-
-    # Data / ML
-    "numpy": ["numpy"],
-    "pandas": ["pandas"],
-    "tensorflow": ["tensorflow", "tf"],
-    "pytorch": ["pytorch", "torch"],
-    "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
-    "xgboost": ["xgboost", "xgb"],
-    "lightgbm": ["lightgbm", "lgbm"],
-    "matplotlib": ["matplotlib", "mpl"],
-    "seaborn": ["seaborn"],
-
-    # Tools
-    "git": ["git"],
-    "github": ["github", "git hub"],
-    "gitlab": ["gitlab", "gitlab ci"],
-    "jira": ["jira"],
-
-    # Markup / Styling
-    "html": ["html", "html5"],
-    "css": ["css", "css3"],
-    "sass": ["sass", "scss"],
-}
-
-
-# Build reverse lookup: alias -> canonical
-REVERSE_ALIAS_MAP: Dict[str, str] = {}
-for canonical, variants in CANONICAL_TO_ALIASES.items():
-    for v in variants:
-        REVERSE_ALIAS_MAP[v.lower().strip()] = canonical
+TAXONOMY_PATH = Path(os.getenv("INTERNMIX_SKILL_TAXONOMY_PATH", str(Path(__file__).resolve().parent / "skill_taxonomy.json")))
+
+# A match must not continue a word on either side; "." only before it, so "asp.net" wins over ".net"
+_BOUNDARY_BEFORE = re.compile(r"[\w+#.]")
+_BOUNDARY_AFTER = re.compile(r"[\w+#]")
+# Separators between the skills of one entry, e.g. "Python/Django, SQL & Docker"
+_ENTRY_SEPARATORS = re.compile(r"[,/;|+&]|\band\b")
+
+
+class TaxonomyError(ValueError):
+    pass
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over all aliases; results are memoized per input string."""
+
+    def __init__(
+        self,
+        canonical_to_aliases: Dict[str, List[str]],
+        ambiguous: Iterable[str] = (),
+        cache_size: Optional[int] = 8192,
+        memo_max_chars: int = 4096,
+    ) -> None:
+        ambiguous = frozenset(ambiguous)
+        self.aliases: Dict[str, str] = {}
+        for canonical, variants in canonical_to_aliases.items():
+            for variant in variants:
+                self.aliases[variant.lower().strip()] = canonical
+        # Trie as one transition dict per state; outputs are (length, canonical, ambiguous)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[Tuple[int, str, bool]]] = [[]]
+        for alias, canonical in self.aliases.items():
+            if not alias:
+                continue
+            state = 0
+            for ch in alias:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(alias), canonical, alias in ambiguous))
+        # Failure links in BFS order; each state inherits the outputs of its failure state
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        # Long inputs (whole resumes) are scanned once anyway and would only bloat the caches
+        self.memo_max_chars = memo_max_chars
+        self._extract_memo = lru_cache(maxsize=cache_size)(self._extract)
+        self._split_memo = lru_cache(maxsize=cache_size)(self._split)
+
+    def extract(self, text: str) -> Tuple[str, ...]:
+        """Canonical skills in free text, ignoring ambiguous aliases."""
+        return self._extract_memo(text) if len(text) <= self.memo_max_chars else self._extract(text)
+
+    def split(self, entry: str) -> Tuple[str, ...]:
+        """Normalized skills of one skill-list entry; unknown fragments are kept cleaned."""
+        return self._split_memo(entry) if len(entry) <= self.memo_max_chars else self._split(entry)
+
+    def _matches(self, text: str, allow_ambiguous: bool) -> List[Tuple[int, int, str]]:
+        """Leftmost-longest, non-overlapping (start, end, canonical) alias matches in lowercased ``text``."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: List[Tuple[int, int, str]] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, canonical, ambiguous in out[state]:
+                if ambiguous and not allow_ambiguous:
+                    continue
+                start, end = i + 1 - length, i + 1
+                if start > 0 and _BOUNDARY_BEFORE.match(text, start - 1):
+                    continue
+                if end < len(text) and _BOUNDARY_AFTER.match(text, end):
+                    continue
+                found.append((start, end, canonical))
+        found.sort(key=lambda m: (m[0], m[0] - m[1]))
+        chosen: List[Tuple[int, int, str]] = []
+        for match in found:
+            if not chosen or match[0] >= chosen[-1][1]:
+                chosen.append(match)
+        return chosen
+
+    def _extract(self, text: str) -> Tuple[str, ...]:
+        seen: Dict[str, None] = {}
+        for _, _, canonical in self._matches(text.lower(), allow_ambiguous=False):
+            seen.setdefault(canonical)
+        return tuple(seen)
+
+    def _split(self, entry: str) -> Tuple[str, ...]:
+        cleaned = entry.lower().replace("(", " ").replace(")", " ").strip()
+        if not cleaned:
+            return ()
+        if cleaned in self.aliases:
+            return (self.aliases[cleaned],)
+        matches = self._matches(cleaned, allow_ambiguous=True)
+        # Split at separators outside matched aliases, so "c++/c#" is not cut at "+"
+        cuts = [0]
+        for sep in _ENTRY_SEPARATORS.finditer(cleaned):
+            if not any(start < sep.end() and sep.start() < end for start, end, _ in matches):
+                cuts.extend((sep.start(), sep.end()))
+        cuts.append(len(cleaned))
+        seen: Dict[str, None] = {}
+        for lo, hi in zip(cuts[::2], cuts[1::2]):
+            inside = [canonical for start, end, canonical in matches if lo <= start and end <= hi]
+            fragment = " ".join(cleaned[lo:hi].split())
+            # Words around a known skill ("python advanced") are dropped; unknown fragments are kept
+            for skill in inside or ([self.aliases.get(fragment, fragment)] if fragment else []):
+                seen.setdefault(skill)
+        return tuple(seen)
+
+
+class SkillTaxonomy:
+    """One immutable version of the taxonomy: aliases, reverse lookup and compiled matcher."""
+
+    def __init__(
+        self,
+        canonical_to_aliases: Dict[str, List[str]],
+        ambiguous: Iterable[str] = (),
+        version: str = "",
+        path: Optional[Path] = None,
+        mtime_ns: Optional[int] = None,
+    ) -> None:
+        self.canonical_to_aliases = canonical_to_aliases
+        # Reverse lookup: alias -> canonical
+        self.reverse_alias_map: Dict[str, str] = {}
+        for canonical, variants in canonical_to_aliases.items():
+            for v in variants:
+                self.reverse_alias_map[v.lower().strip()] = canonical
+        # Aliases that are ordinary words or too short to trust in free text; they still count
+        # as a whole skill entry ("Go") or a separated part of one ("Go/Rust")
+        self.ambiguous = frozenset(a.lower().strip() for a in ambiguous) | {
+            alias for alias in self.reverse_alias_map if len(alias) < 3 and alias.isalpha()
+        }
+        self.matcher = SkillMatcher(canonical_to_aliases, self.ambiguous)
+        contents = json.dumps([canonical_to_aliases, sorted(self.ambiguous)], sort_keys=True)
+        self.version = f"{version}+{hashlib.sha256(contents.encode('utf-8')).hexdigest()[:12]}"
+        self.path = path
+        self.mtime_ns = mtime_ns
+
+
+def load_taxonomy(path: Path = TAXONOMY_PATH) -> SkillTaxonomy:
+    """Read and validate a taxonomy file; raises TaxonomyError (or OSError)."""
+    path = Path(path)
+    mtime_ns = path.stat().st_mtime_ns
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise TaxonomyError(f"Invalid skill taxonomy JSON in {path}: {exc}") from exc
+    if not isinstance(data, dict) or not isinstance(data.get("skills"), dict):
+        raise TaxonomyError(f"Skill taxonomy {path} needs a \"skills\" object")
+    canonical_to_aliases: Dict[str, List[str]] = {}
+    for group, skills in data["skills"].items():
+        if not isinstance(skills, dict):
+            raise TaxonomyError(f"Skill taxonomy group {group!r} must map canonical keys to alias lists")
+        for canonical, aliases in skills.items():
+            if canonical != canonical.lower().strip() or not canonical:
+                raise TaxonomyError(f"Canonical skill {canonical!r} must be lowercase and trimmed")
+            if not isinstance(aliases, list) or not all(isinstance(a, str) and a.strip() for a in aliases):
+                raise TaxonomyError(f"Aliases of {canonical!r} must be a list of non-empty strings")
+            if canonical in canonical_to_aliases:
+                raise TaxonomyError(f"Canonical skill {canonical!r} is listed twice")
+            canonical_to_aliases[canonical] = aliases
+    ambiguous = data.get("ambiguous", [])
+    if not isinstance(ambiguous, list) or not all(isinstance(a, str) for a in ambiguous):
+        raise TaxonomyError("\"ambiguous\" must be a list of aliases")
+    return SkillTaxonomy(canonical_to_aliases, ambiguous, str(data.get("version", "")), path, mtime_ns)
+
+
+_taxonomy = load_taxonomy()
+_reload_lock = threading.Lock()
+
+
+def current_taxonomy() -> SkillTaxonomy:
+    return _taxonomy
+
+
+def reload_taxonomy(path: Optional[Path] = None, force: bool = False) -> bool:
+    """Swap in the taxonomy file if it changed on disk (or ``force``); True if the version changed.
+
+    Raises TaxonomyError or OSError for an unreadable file; the current taxonomy stays in use.
+    """
+    global _taxonomy
+    path = Path(path or TAXONOMY_PATH)
+    with _reload_lock:
+        if not force and path == _taxonomy.path and path.stat().st_mtime_ns == _taxonomy.mtime_ns:
+            return False
+        taxonomy = load_taxonomy(path)
+        changed = taxonomy.version != _taxonomy.version
+        _taxonomy = taxonomy
+        return changed
+
+
+def taxonomy_version() -> str:
+    return _taxonomy.version
 
 
 def normalize_skill(skill: str) -> str:
     """Normalize a skill token to its canonical label using alias sets.
 
     - Lowercases and trims the input
-    - Uses REVERSE_ALIAS_MAP to map variants to canonical keys
+    - Uses the taxonomy's reverse alias map to map variants to canonical keys
     - Falls back to the cleaned token if unknown
     """
     cleaned = (skill or "").lower().strip()
-    return REVERSE_ALIAS_MAP.get(cleaned, cleaned)
+    return _taxonomy.reverse_alias_map.get(cleaned, cleaned)
+
+
+def extract_skills(text: Optional[str]) -> Tuple[str, ...]:
+    """Canonical skills mentioned in free text, in order of first mention (memoized).
+
+    Ambiguous aliases are ignored, since "go" or "next" in a sentence is rarely a skill.
+    """
+    return _taxonomy.matcher.extract(text) if text else ()
 
 
-__all__ = ["CANONICAL_TO_ALIASES", "normalize_skill"]
+def split_skill(entry: Optional[str]) -> Tuple[str, ...]:
+    """Normalized skills of one skill-list entry (memoized).
+
+    "React.js and Node" gives ("react", "node"); unknown parts are kept cleaned, like
+    normalize_skill does for a single token.
+    """
+    return _taxonomy.matcher.split(entry) if entry else ()
 
 
+__all__ = [
+    "TAXONOMY_PATH",
+    "TaxonomyError",
+    "SkillMatcher",
+    "SkillTaxonomy",
+    "load_taxonomy",
+    "current_taxonomy",
+    "reload_taxonomy",
+    "taxonomy_version",
+    "normalize_skill",
+    "extract_skills",
+    "split_skill",
+]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Skill normalization benchmark.
+
+Builds a seeded corpus of synthetic applicants (skill entries such as "React.js and Node" or
+"C++/C#" plus experience descriptions that mention skills in prose) and extracts their
+canonical skills with:
+- split:  the previous path, splitting entries on "/", "+" and "," and looking up each token
+- cold:   the SkillMatcher automaton with empty memo caches
+- warm:   the same automaton once every input is memoized
+
+Reports applicants/s and mean microseconds per applicant, and recall: the share of the
+skills planted in each applicant that were found.
+
+Examples:
+    python -m backend.skill_benchmark
+    python -m backend.skill_benchmark --applicants 5000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set, Tuple
+
+# Ensure project root is on sys.path so `python backend/skill_benchmark.py` works
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.skill_aliases import SkillMatcher, current_taxonomy, normalize_skill
+
+_FILLERS = ["built", "maintained", "a dashboard", "the billing service", "with the team", "for clients",
+            "migrated", "tested", "deployed", "an internal tool", "using", "on top of"]
+_JOINERS = [" and ", ", ", "/", " & ", " + "]
+
+
+def _split_and_lookup(applicant: Dict) -> Set[str]:
+    """The previous _flatten_applicant_skills: descriptions are not read at all."""
+    names: List[str] = []
+    for item in applicant["skills"]:
+        raw = item["name"].replace("(", "").replace(")", "")
+        for tok in raw.replace("/", ",").replace("+", ",").split(","):
+            tok = tok.strip()
+            if tok:
+                names.append(tok)
+    return {normalize_skill(x) for x in names}
+
+
+def _automaton(matcher: SkillMatcher) -> Callable[[Dict], Set[str]]:
+    def run(applicant: Dict) -> Set[str]:
+        found: Set[str] = set()
+        for item in applicant["skills"]:
+            found.update(matcher.split(item["name"]))
+        for work in applicant["experience"]:
+            found.update(matcher.extract(work["description"]))
+        return found
+    return run
+
+
+def _corpus(count: int, seed: int) -> List[Tuple[Dict, Set[str]]]:
+    rng = random.Random(seed)
+    taxonomy = current_taxonomy()
+    aliases = [(alias, canonical) for canonical, variants in taxonomy.canonical_to_aliases.items() for alias in variants]
+    prose = [pair for pair in aliases if pair[0] not in taxonomy.ambiguous]
+    corpus = []
+    for _ in range(count):
+        planted: Set[str] = set()
+        skills = []
+        for _ in range(rng.randint(3, 8)):
+            picks = rng.sample(aliases, rng.choice([1, 1, 2]))
+            planted.update(canonical for _, canonical in picks)
+            name = rng.choice(_JOINERS).join(rng.choice([alias, alias.title(), alias.upper()]) for alias, _ in picks)
+            skills.append({"name": name})
+        experience = []
+        for _ in range(rng.randint(1, 3)):
+            picks = rng.sample(prose, 2)
+            planted.update(canonical for _, canonical in picks)
+            words = rng.sample(_FILLERS, 4)
+            words.insert(1, picks[0][0])
+            words.insert(4, picks[1][0])
+            experience.append({"description": " ".join(words).capitalize() + "."})
+        corpus.append(({"skills": skills, "experience": experience}, planted))
+    return corpus
+
+
+def _measure(name: str, fn: Callable[[Dict], Set[str]], corpus, repeat: int) -> None:
+    best = float("inf")
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(applicant) for applicant, _ in corpus]
+        best = min(best, time.perf_counter() - start)
+        found = sum(len(result & planted) for result, (_, planted) in zip(results, corpus))
+    planted = sum(len(p) for _, p in corpus)
+    print(f"  {name:8s} {len(corpus) / best:12.0f} {best / len(corpus) * 1e6:10.1f} {found / planted:8.1%}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per path; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    corpus = _corpus(args.applicants, args.seed)
+    taxonomy = current_taxonomy()
+    start = time.perf_counter()
+    SkillMatcher(taxonomy.canonical_to_aliases, taxonomy.ambiguous)
+    print(f"applicants={args.applicants}  automaton build={(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"  {'path':8s} {'applicants/s':>12s} {'us/each':>10s} {'recall':>8s}")
+    _measure("split", _split_and_lookup, corpus, args.repeat)
+    # cache_size=0 disables memoization, so every run scans every input
+    _measure("cold", _automaton(SkillMatcher(taxonomy.canonical_to_aliases, taxonomy.ambiguous, cache_size=0)), corpus, args.repeat)
+    warm = _automaton(SkillMatcher(taxonomy.canonical_to_aliases, taxonomy.ambiguous, cache_size=None))
+    for applicant, _ in corpus:
+        warm(applicant)
+    _measure("warm", warm, corpus, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from backend.blob_store import _BLOB_NAME
+
+
+"""
+Static serving for /uploads.
+
+Upload filenames never change content (blobs are named by their SHA-256, older uploads by
+a per-upload uuid), so responses are marked immutable with a long max-age. Blobs use their
+hash as a strong ETag; derived files (thumbnails) and older uploads use mtime and size, since
+their bytes are not the hash's. Single byte ranges are supported (PDF viewers fetch pages lazily).
+
+With INTERNMIX_UPLOADS_SENDFILE set, Python only checks the path and returns headers; a
+fronting proxy sends the bytes:
+- x-accel-redirect: nginx, ``X-Accel-Redirect: <INTERNMIX_UPLOADS_ACCEL_PREFIX><path>``
+  pointing at an ``internal`` location aliased to the uploads directory
+- x-sendfile: Apache mod_xsendfile / lighttpd, ``X-Sendfile: <absolute path>``
+"""
+
+MAX_AGE = int(os.getenv("INTERNMIX_UPLOADS_MAX_AGE", str(365 * 24 * 3600)))
+SENDFILE_MODES = ("", "x-accel-redirect", "x-sendfile")
+SENDFILE_MODE = os.getenv("INTERNMIX_UPLOADS_SENDFILE", "").lower()
+ACCEL_PREFIX = os.getenv("INTERNMIX_UPLOADS_ACCEL_PREFIX", "/_protected_uploads/")
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(FileResponse):
+    """206 response with bytes ``start``..``end`` (inclusive) of a file."""
+
+    def __init__(self, path, start: int, end: int, stat_result: os.stat_result, headers: dict) -> None:
+        headers = dict(headers)
+        headers["content-length"] = str(end - start + 1)
+        headers["content-range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+        super().__init__(path, status_code=206, headers=headers, stat_result=stat_result)
+        self.start = start
+        self.end = end
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            remaining = self.end - self.start + 1
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:
+            # File shrank underneath us; end the body so the client sees a short read
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _parse_range(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """(start, end) for a single satisfiable ``bytes=`` range; raises ValueError if unsatisfiable.
+
+    Returns None for headers we do not handle (e.g. multiple ranges), meaning "send it all".
+    """
+    match = _RANGE.match(value.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+class UploadStaticFiles(StaticFiles):
+    def __init__(self, *, directory: str | Path, max_age: int = MAX_AGE, sendfile: str = SENDFILE_MODE,
+                 accel_prefix: str = ACCEL_PREFIX, **kwargs) -> None:
+        if sendfile not in SENDFILE_MODES:
+            raise ValueError(f"Unknown sendfile mode {sendfile!r}; expected one of {', '.join(m for m in SENDFILE_MODES if m)}")
+        super().__init__(directory=directory, **kwargs)
+        self.root = Path(directory).resolve()
+        self.max_age = max_age
+        self.sendfile = sendfile
+        self.accel_prefix = accel_prefix.rstrip("/") + "/"
+
+    def _etag(self, full_path: Path, stat_result: os.stat_result) -> str:
+        # Only the exact blob names BlobStore writes; <sha256>.w64.webp is not those bytes
+        match = _BLOB_NAME.match(full_path.name)
+        if match is not None:
+            return f'"{match.group(1)}"'
+        return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        full_path = Path(full_path)
+        request_headers = Headers(scope=scope)
+        etag = self._etag(full_path, stat_result)
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": f"public, max-age={self.max_age}, immutable",
+            "accept-ranges": "bytes",
+        }
+        if status_code == 200 and self._not_modified(request_headers, etag, stat_result):
+            return Response(status_code=304, headers=headers)
+
+        if self.sendfile:
+            return self._sendfile_response(full_path, stat_result, headers, status_code)
+
+        range_header = request_headers.get("range")
+        if status_code == 200 and range_header and self._if_range_matches(request_headers, etag, stat_result):
+            try:
+                byte_range = _parse_range(range_header, stat_result.st_size)
+            except ValueError:
+                return Response(status_code=416, headers={**headers, "content-range": f"bytes */{stat_result.st_size}"})
+            if byte_range is not None:
+                return RangeFileResponse(full_path, *byte_range, stat_result=stat_result, headers=headers)
+        return FileResponse(full_path, status_code=status_code, headers=headers, stat_result=stat_result)
+
+    def _sendfile_response(self, full_path: Path, stat_result: os.stat_result, headers: dict, status_code: int) -> Response:
+        # The proxy handles ranges and conditional requests for the bytes it serves
+        media_type = FileResponse(full_path, stat_result=stat_result).media_type
+        if self.sendfile == "x-accel-redirect":
+            relative = full_path.resolve().relative_to(self.root).as_posix()
+            headers["x-accel-redirect"] = f"{self.accel_prefix}{relative}"
+        else:
+            headers["x-sendfile"] = str(full_path.resolve())
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+    @staticmethod
+    def _not_modified(request_headers: Headers, etag: str, stat_result: os.stat_result) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(stat_result.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _if_range_matches(request_headers: Headers, etag: str, stat_result: os.stat_result) -> bool:
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            # Strong comparison only
+            return if_range == etag
+        try:
+            return int(stat_result.st_mtime) <= parsedate_to_datetime(if_range).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+__all__ = ["UploadStaticFiles", "RangeFileResponse"]
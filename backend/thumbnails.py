@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Tuple
+
+from backend.blob_store import BlobStore, StoredBlob
+
+
+"""
+Profile image thumbnails.
+
+Each uploaded profile image is resized once into square WebP thumbnails (THUMBNAIL_SIZES
+pixels) stored next to its blob as ``<sha256>.w<size>.webp``, so identical avatars share
+thumbnails too and blob gc removes them with the original. Resizing runs on a small
+dedicated thread pool (Pillow releases the GIL while decoding, resizing and encoding).
+
+Pillow is optional: without it uploads still work and no thumbnails are produced.
+"""
+
+logger = logging.getLogger("internmix.thumbnails")
+
+THUMBNAIL_SIZES: Tuple[int, ...] = (64, 160, 320)
+WEBP_QUALITY = int(os.getenv("INTERNMIX_THUMBNAIL_QUALITY", "80"))
+# Refuse to decode images larger than this many pixels (decompression bombs)
+MAX_SOURCE_PIXELS = int(os.getenv("INTERNMIX_THUMBNAIL_MAX_PIXELS", str(40_000_000)))
+
+_executor = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("INTERNMIX_THUMBNAIL_WORKERS", "2"))),
+    thread_name_prefix="internmix-thumbs",
+)
+
+
+def _render(source: Path, targets: Dict[int, Path]) -> Dict[int, Path]:
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        logger.warning("Pillow is not installed; skipping profile image thumbnails")
+        return {}
+
+    Image.MAX_IMAGE_PIXELS = MAX_SOURCE_PIXELS
+    missing = {size: path for size, path in targets.items() if not path.exists()}
+    if missing:
+        with Image.open(source) as img:
+            img = ImageOps.exif_transpose(img)
+            img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+            for size, path in missing.items():
+                thumb = ImageOps.fit(img, (size, size), method=Image.Resampling.LANCZOS)
+                # A private temp file per writer: concurrent renders of one image never share it
+                fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+                try:
+                    with os.fdopen(fd, "wb") as out:
+                        thumb.save(out, format="WEBP", quality=WEBP_QUALITY, method=4)
+                    os.replace(tmp, path)
+                finally:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+    return targets
+
+
+async def make_thumbnails(store: BlobStore, blob: StoredBlob) -> Dict[int, Path]:
+    """Render (or reuse) the thumbnails for an image blob; returns {size: path}, empty on failure."""
+    targets = {size: store.derived_path(blob.sha256, f"w{size}.webp") for size in THUMBNAIL_SIZES}
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, _render, blob.path, targets)
+    except Exception:
+        logger.exception("Thumbnail generation failed for %s", blob.sha256)
+        return {}
+
+
+def shutdown() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["THUMBNAIL_SIZES", "make_thumbnails", "shutdown"]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.blob_store import BlobStore, StoredBlob
+
+
+"""
+Upload storage helpers.
+
+Uploaded files are copied in chunks on a worker thread, so a large PDF never blocks the
+event loop. The size limit is enforced while copying, the file type is taken from its
+leading magic bytes (the client's content_type is not trusted), and the data is hashed
+as it is written to a temp file, then moved into the content-addressed BlobStore.
+"""
+
+MAX_IMAGE_BYTES = int(os.getenv("INTERNMIX_MAX_IMAGE_BYTES", str(5 * 1024 * 1024)))
+MAX_RESUME_BYTES = int(os.getenv("INTERNMIX_MAX_RESUME_BYTES", str(10 * 1024 * 1024)))
+CHUNK_SIZE = 1024 * 1024
+# Enough leading bytes for every signature below
+_SNIFF_BYTES = 16
+
+
+class UploadError(Exception):
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def sniff_image(head: bytes) -> Optional[str]:
+    """File suffix for a JPEG / PNG / WebP / GIF header, else None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    return None
+
+
+def sniff_pdf(head: bytes) -> Optional[str]:
+    return ".pdf" if head.startswith(b"%PDF-") else None
+
+
+def _read_head(src: BinaryIO) -> bytes:
+    head = b""
+    while len(head) < _SNIFF_BYTES:
+        chunk = src.read(_SNIFF_BYTES - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _store(src: BinaryIO, store: BlobStore, max_bytes: int, sniff: Callable[[bytes], Optional[str]], kind: str) -> StoredBlob:
+    head = _read_head(src)
+    suffix = sniff(head)
+    if suffix is None:
+        raise UploadError(400, f"Invalid file type. Please upload {kind}")
+    fd, tmp_name = store.temp_file()
+    try:
+        digest = hashlib.sha256(head)
+        size = len(head)
+        with os.fdopen(fd, "wb") as out:
+            out.write(head)
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadError(413, f"File too large (limit {max_bytes // (1024 * 1024)} MB)")
+                digest.update(chunk)
+                out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+        return store.commit(tmp_name, digest.hexdigest(), suffix, size)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+async def save_upload(
+    src: BinaryIO,
+    store: BlobStore,
+    max_bytes: int,
+    sniff: Callable[[bytes], Optional[str]],
+    kind: str,
+) -> StoredBlob:
+    """Stream ``src`` into the content-addressed store off the event loop; raises UploadError."""
+    return await run_in_threadpool(_store, src, store, max_bytes, sniff, kind)
+
+
+def remove_replaced(old_path: Optional[str], new_path: Path, root: Path) -> None:
+    """Delete a replaced pre-blob-store upload (only inside ``root``); blobs are left to gc."""
+    if not old_path:
+        return
+    old = Path(old_path).resolve()
+    if old == new_path.resolve() or root.resolve() not in old.parents:
+        return
+    try:
+        old.unlink()
+    except FileNotFoundError:
+        pass
+
+
+__all__ = [
+    "MAX_IMAGE_BYTES",
+    "MAX_RESUME_BYTES",
+    "UploadError",
+    "sniff_image",
+    "sniff_pdf",
+    "save_upload",
+    "remove_replaced",
+]
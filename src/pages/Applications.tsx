@@ -2,21 +2,24 @@ import React, { useState, useEffect } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { Navigate } from 'react-router-dom';
 import { Briefcase, Building, MapPin, Clock, Loader2, AlertCircle, CheckCircle, XCircle, Eye } from 'lucide-react';
-import { getStudentApplications, type StudentApplication } from '../utils/student';
+import { getStudentApplicationsPage, type StudentApplication } from '../utils/student';
 
 const Applications = () => {
   const { isAuthenticated } = useAuth();
   const [applications, setApplications] = useState<StudentApplication[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchApplications = async () => {
       try {
         setLoading(true);
         setError(null);
-        const data = await getStudentApplications();
-        setApplications(data);
+        const page = await getStudentApplicationsPage();
+        setApplications(page.applications);
+        setNextCursor(page.nextCursor);
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Failed to fetch applications');
       } finally {
@@ -29,6 +32,20 @@ const Applications = () => {
     }
   }, [isAuthenticated]);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await getStudentApplicationsPage(nextCursor);
+      setApplications(prev => [...prev, ...page.applications]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      alert(err instanceof Error ? err.message : 'Failed to fetch applications');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   if (!isAuthenticated) {
     return <Navigate to="/login" replace />;
   }
@@ -195,6 +212,18 @@ const Applications = () => {
                 </div>
               </div>
             ))}
+            {nextCursor && (
+              <div className="text-center">
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="inline-flex items-center px-4 py-2 text-sm font-medium rounded-md text-primary-700 bg-primary-50 hover:bg-primary-100 disabled:opacity-50"
+                >
+                  {loadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                  Load more
+                </button>
+              </div>
+            )}
           </div>
         ) : (
           <div className="text-center bg-white rounded-xl shadow-md p-12">
@@ -12,6 +12,8 @@ const ListingApplications: React.FC = () => {
   const [listingTitle, setListingTitle] = useState<string>('');
   const [apps, setApps] = useState<ScoredApplicationEntry[]>([]);
   const [busyId, setBusyId] = useState<number | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const listingId = Number(searchParams.get('listingId'));
 
@@ -23,6 +25,7 @@ const ListingApplications: React.FC = () => {
         const data = await getScoredApplicationsForListing(listingId);
         setListingTitle(data.listing.title);
         setApps(data.applications);
+        setNextCursor(data.nextCursor);
         setError(null);
       } catch (e) {
         setError(e instanceof Error ? e.message : 'Failed to load applications');
@@ -33,6 +36,20 @@ const ListingApplications: React.FC = () => {
     load();
   }, [isAuthenticated, userType, listingId]);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const data = await getScoredApplicationsForListing(listingId, nextCursor);
+      setApps(prev => [...prev, ...data.applications]);
+      setNextCursor(data.nextCursor);
+    } catch (e) {
+      alert(e instanceof Error ? e.message : 'Failed to load applications');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleStatus = async (applicationId: number, status: 'accepted' | 'rejected') => {
     try {
       setBusyId(applicationId);
@@ -134,6 +151,18 @@ const ListingApplications: React.FC = () => {
                 </div>
               ))
             )}
+            {nextCursor && (
+              <div className="text-center">
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="inline-flex items-center px-4 py-2 text-sm rounded bg-gray-100 text-gray-700 hover:bg-gray-200 disabled:opacity-50"
+                >
+                  {loadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                  Load more
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
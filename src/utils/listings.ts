@@ -1,5 +1,6 @@
 // API service for listing operations
 import { getToken } from './auth';
+import { fetchAllPages } from './pagination';
 
 export interface ListingCreateRequest {
   title: string;
@@ -78,19 +79,15 @@ export const createListing = async (data: ListingCreateRequest): Promise<Listing
   return response.json();
 };
 
-// Get all listings (optionally filtered by archived status)
+// Get the recruiter's listings (optionally filtered by archived status), capped at MAX_PAGES pages
 export const getListings = async (archived: boolean = false): Promise<ListingResponse[]> => {
-  const response = await fetch(`${API_BASE}/api/listings?archived=${archived}`, {
-    method: 'GET',
-    headers: getAuthHeaders(),
-  });
-
-  if (!response.ok) {
-    const error = await response.json().catch(() => ({}));
-    throw new Error(error.detail || 'Failed to fetch listings');
-  }
-
-  return response.json();
+  const { items } = await fetchAllPages<ListingResponse[], ListingResponse>(
+    `${API_BASE}/api/listings?archived=${archived}&limit=200`,
+    { method: 'GET', headers: getAuthHeaders() },
+    'Failed to fetch listings',
+    (page) => page,
+  );
+  return items;
 };
 
 // Get a specific listing by ID
@@ -0,0 +1,52 @@
+// Cursor pagination helpers for list endpoints.
+// Each request returns one page; the next page's cursor comes back in the X-Next-Cursor header.
+
+export const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+
+// fetchAllPages stops after this many pages; screens that can grow past it page with "Load more"
+export const MAX_PAGES = 5;
+
+export function withCursor(url: string, cursor: string | null): string {
+  if (!cursor) return url;
+  const sep = url.includes('?') ? '&' : '?';
+  return `${url}${sep}cursor=${encodeURIComponent(cursor)}`;
+}
+
+// Fetch one page of a list endpoint; nextCursor is null on the last page
+export async function fetchPage<Body>(
+  url: string,
+  init: RequestInit,
+  errorMessage: string,
+  cursor: string | null = null,
+): Promise<{ body: Body; nextCursor: string | null }> {
+  const response = await fetch(withCursor(url, cursor), init);
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || errorMessage);
+  }
+  const body = (await response.json()) as Body;
+  return { body, nextCursor: response.headers.get(NEXT_CURSOR_HEADER) };
+}
+
+// Fetch up to maxPages pages of a list endpoint; `items` extracts the rows from one page's body.
+// `truncated` is set when more pages were left unread.
+export async function fetchAllPages<Body, Item>(
+  url: string,
+  init: RequestInit,
+  errorMessage: string,
+  items: (body: Body) => Item[],
+  maxPages: number = MAX_PAGES,
+): Promise<{ items: Item[]; first: Body; truncated: boolean }> {
+  const all: Item[] = [];
+  let first: Body | null = null;
+  let cursor: string | null = null;
+  let pages = 0;
+  do {
+    const page: { body: Body; nextCursor: string | null } = await fetchPage<Body>(url, init, errorMessage, cursor);
+    if (first === null) first = page.body;
+    all.push(...items(page.body));
+    cursor = page.nextCursor;
+    pages += 1;
+  } while (cursor && pages < maxPages);
+  return { items: all, first: first as Body, truncated: cursor !== null };
+}
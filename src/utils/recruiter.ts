@@ -1,4 +1,5 @@
 import { getToken } from './auth';
+import { fetchPage } from './pagination';
 
 export interface RecruiterProfile {
   email: string;
@@ -116,16 +117,19 @@ export const uploadRecruiterProfileImage = async (file: File): Promise<{ profile
   return response.json();
 };
 
-export const getScoredApplicationsForListing = async (listingId: number): Promise<ScoredApplicationsResponse> => {
-  const response = await fetch(`${API_BASE}/api/listings/${listingId}/applications/scored`, {
-    method: 'GET',
-    headers: getAuthHeaders(),
-  });
-  if (!response.ok) {
-    const error = await response.json().catch(() => ({}));
-    throw new Error(error.detail || 'Failed to fetch scored applications');
-  }
-  return response.json();
+// Get one page of a listing's applicants, best match first; pass nextCursor back for the next page
+export const getScoredApplicationsForListing = async (
+  listingId: number,
+  cursor: string | null = null,
+): Promise<ScoredApplicationsResponse & { nextCursor: string | null }> => {
+  const { body, nextCursor } = await fetchPage<ScoredApplicationsResponse>(
+    `${API_BASE}/api/listings/${listingId}/applications/scored`,
+    { method: 'GET', headers: getAuthHeaders() },
+    'Failed to fetch scored applications',
+    cursor,
+  );
+  return { ...body, nextCursor };
+};
 };
 
 
@@ -1,5 +1,6 @@
 // Student API service
 import { getToken } from './auth';
+import { fetchAllPages, fetchPage } from './pagination';
 
 export interface StudentProfile {
   email: string;
@@ -101,10 +102,19 @@ export interface ScoredListing {
     matched_required?: string[];
     matched_optional?: string[];
     missing_required?: string[];
+    partial_required?: PartialSkillMatch[];
+    partial_optional?: PartialSkillMatch[];
     notes?: string[];
   };
 }
 
+// A related skill that earned part of a skill's coverage credit
+export interface PartialSkillMatch {
+  skill: string;
+  matched: string;
+  credit: number;
+}
+
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
 // Helper function to get auth headers
@@ -168,8 +178,24 @@ export const uploadProfileImage = async (file: File): Promise<{ profile_image_ur
   return response.json();
 };
 
+export interface ResumeUploadResult {
+  resume_url: string;
+  sha256: string;
+  unchanged: boolean;
+  // Server-side parsing job; null when this exact PDF was already parsed
+  parse_job_id: string | null;
+}
+
+export interface ResumeParseJob {
+  id: string;
+  state: 'queued' | 'running' | 'done' | 'failed';
+  error: string | null;
+  created_at: number;
+  finished_at: number | null;
+}
+
 // Upload resume PDF (multipart/form-data)
-export const uploadResumePdf = async (file: File): Promise<{ resume_url: string }> => {
+export const uploadResumePdf = async (file: File): Promise<ResumeUploadResult> => {
   const token = getToken();
   const form = new FormData();
   form.append('file', file);
@@ -187,6 +213,32 @@ export const uploadResumePdf = async (file: File): Promise<{ resume_url: string
   return response.json();
 };
 
+// Poll the server-side parsing job started by uploadResumePdf
+export const getResumeParseJob = async (jobId: string): Promise<ResumeParseJob> => {
+  const response = await fetch(`${API_BASE}/api/student/resume/jobs/${jobId}`, {
+    method: 'GET',
+    headers: getAuthHeaders(),
+  });
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to fetch resume parsing status');
+  }
+  return response.json();
+};
+
+// Queue a server-side refresh of GitHub data from the profile's github_url
+export const refreshGithubData = async (): Promise<{ job_id: string }> => {
+  const response = await fetch(`${API_BASE}/api/student/github/refresh`, {
+    method: 'POST',
+    headers: getAuthHeaders(),
+  });
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || 'Failed to refresh GitHub data');
+  }
+  return response.json();
+};
+
 // Save parsed resume/github data
 export const saveParsedData = async (payload: { resume_parsed?: unknown; github_parsed?: unknown; }): Promise<{ message: string }> => {
   const response = await fetch(`${API_BASE}/api/student/parsed`, {
@@ -201,19 +253,28 @@ export const saveParsedData = async (payload: { resume_parsed?: unknown; github_
   return response.json();
 };
 
-// Get all student applications
+// Get the student's applications (capped at MAX_PAGES pages; used to mark applied listings)
 export const getStudentApplications = async (): Promise<StudentApplication[]> => {
-  const response = await fetch(`${API_BASE}/api/student/applications`, {
-    method: 'GET',
-    headers: getAuthHeaders(),
-  });
-
-  if (!response.ok) {
-    const error = await response.json().catch(() => ({}));
-    throw new Error(error.detail || 'Failed to fetch student applications');
-  }
+  const { items } = await fetchAllPages<StudentApplication[], StudentApplication>(
+    `${API_BASE}/api/student/applications?limit=200`,
+    { method: 'GET', headers: getAuthHeaders() },
+    'Failed to fetch student applications',
+    (page) => page,
+  );
+  return items;
+};
 
-  return response.json();
+// Get one page of student applications, newest first; pass nextCursor back for the next page
+export const getStudentApplicationsPage = async (
+  cursor: string | null = null,
+): Promise<{ applications: StudentApplication[]; nextCursor: string | null }> => {
+  const { body, nextCursor } = await fetchPage<StudentApplication[]>(
+    `${API_BASE}/api/student/applications`,
+    { method: 'GET', headers: getAuthHeaders() },
+    'Failed to fetch student applications',
+    cursor,
+  );
+  return { applications: body, nextCursor };
 };
 
 // Apply for an internship
@@ -262,7 +323,7 @@ export const getEnhancedStudentDashboard = async (): Promise<EnhancedStudentDash
   return response.json();
 };
 
-// Get student recommendations (sorted listings)
+// Get student recommendations (sorted listings; the server returns the best page)
 export const getStudentRecommendations = async (): Promise<ScoredListing[]> => {
   const response = await fetch(`${API_BASE}/api/student/recommendations`, {
     method: 'GET',